@@ -1,6 +1,26 @@
-from backend.api.diagnostics_routes import router as diagnostics_router
-from backend.api.lms_routes import router as lms_router
-from backend.api.mlp_routes import router as mlp_router
-from backend.api.perceptron_routes import router as perceptron_router
+"""API routers, imported on first access so backend.api.deps/utils stay cheap to load."""
 
-__all__ = ["diagnostics_router", "lms_router", "mlp_router", "perceptron_router"]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_ROUTERS = {
+    "dataset_router": "dataset_routes",
+    "diagnostics_router": "diagnostics_routes",
+    "job_router": "job_routes",
+    "lms_router": "lms_routes",
+    "mlp_router": "mlp_routes",
+    "perceptron_router": "perceptron_routes",
+}
+
+__all__ = list(_ROUTERS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _ROUTERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = import_module(f"{__name__}.{module}").router
+    globals()[name] = router
+    return router
@@ -0,0 +1,53 @@
+"""Query handling shared by GET /boundary and GET /mlp/boundary."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator
+
+from fastapi import HTTPException, Response
+
+from backend.api.wire import Wire, encode_json
+from backend.viz.viz_boundary import DEFAULT_PLANE_RANGE, DEFAULT_RASTER_SIDE, BoundarySource, RasterSpec
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@dataclass(frozen=True)
+class RasterQuery:
+    spec: RasterSpec
+    quantize: bool = False
+    progressive: bool = False
+
+
+def raster_query(
+    height: int = DEFAULT_RASTER_SIDE,
+    width: int = DEFAULT_RASTER_SIDE,
+    x_min: float = DEFAULT_PLANE_RANGE[0],
+    x_max: float = DEFAULT_PLANE_RANGE[1],
+    y_min: float = DEFAULT_PLANE_RANGE[0],
+    y_max: float = DEFAULT_PLANE_RANGE[1],
+    quantize: bool = False,
+    progressive: bool = False,
+) -> RasterQuery:
+    """FastAPI dependency: the lattice and encoding options from the query string."""
+    try:
+        spec = RasterSpec(height=height, width=width, x_range=(x_min, x_max), y_range=(y_min, y_max))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return RasterQuery(spec=spec, quantize=quantize, progressive=progressive)
+
+
+def _progressive_lines(source: BoundarySource, query: RasterQuery, precision: int | None) -> Iterator[bytes]:
+    levels = query.spec.levels()
+    for index, spec in enumerate(levels):
+        payload = {**source.payload(spec, query.quantize), "level": index, "levels": len(levels)}
+        yield encode_json(payload, precision) + b"\n"
+
+
+def boundary_response(wire: Wire, source: BoundarySource, query: RasterQuery) -> Response:
+    """The raster in the negotiated encoding, or coarse-to-fine NDJSON lines when progressive."""
+    if query.progressive:
+        lines = _progressive_lines(source, query, wire.format.precision)
+        return wire.stream_response(lines, NDJSON_MEDIA_TYPE)
+    return wire.response(source.payload(query.spec, query.quantize))
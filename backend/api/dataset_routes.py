@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+
+from backend.api.deps import datasets, resolve_session
+from backend.api.utils import grid_side_limit, normalize_samples, validate_grid_shape
+from backend.services.sessions import Session
+
+router = APIRouter(prefix="/datasets")
+
+
+@router.post("")
+def upload_dataset(
+    response: Response,
+    body: Dict[str, Any] = Body(default_factory=dict),
+    session: Session = Depends(resolve_session),
+) -> Dict[str, Any]:
+    """Validate and store a custom dataset for this session; identical content always gets the same dataset_id."""
+    try:
+        rows, cols = validate_grid_shape(body.get("grid_rows"), body.get("grid_cols"), grid_side_limit(body))
+        samples = normalize_samples(body.get("samples", []), rows, cols)
+        entry, created = datasets.put(samples, (rows, cols), owner=session.id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    response.status_code = 201 if created else 200
+    return {**entry.info(), "created": created}
+
+
+@router.get("/{dataset_id}")
+def dataset_info(dataset_id: str) -> Dict[str, Any]:
+    try:
+        return datasets.get(dataset_id).info()
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="dataset not found") from exc
+
+
+@router.delete("/{dataset_id}")
+def delete_dataset(dataset_id: str, session: Session = Depends(resolve_session)) -> Dict[str, Any]:
+    """Release this session's reference; the data is deleted once no session references it."""
+    try:
+        remaining = datasets.release(dataset_id, session.id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="dataset not found") from exc
+    return {"dataset_id": dataset_id, "deleted": remaining == 0, "references": remaining}
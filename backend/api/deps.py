@@ -1,7 +1,68 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from fastapi import Depends, Request, Response, WebSocket
+
+from backend.api.executor import CpuPool
+from backend.api.response_cache import ResponseCache
+from backend.services.dataset_store import DatasetStore
+from backend.services.jobs import JobManager
 from backend.services.lms_service import LmsService
 from backend.services.mlp_service import MlpService
 from backend.services.perceptron_service import PerceptronService
+from backend.services.sessions import Session, SessionRegistry
+
+SESSION_HEADER = "X-Session-Id"
+SESSION_COOKIE = "perceptron_session"
+
+registry = SessionRegistry()
+datasets = DatasetStore()
+response_cache = ResponseCache()
+jobs = JobManager()
+cpu_pool = CpuPool()
+
+
+def resolve_session(request: Request, response: Response) -> Session:
+    """Resolve the caller's session (header first, then cookie) without locking it.
+
+    For handlers that take session.lock themselves, only around their reads.
+    """
+    requested = request.headers.get(SESSION_HEADER) or request.cookies.get(SESSION_COOKIE)
+    session = registry.get_or_create(requested)
+    if session.id != requested:
+        response.set_cookie(SESSION_COOKIE, session.id, httponly=True, samesite="lax")
+    response.headers[SESSION_HEADER] = session.id
+    return session
+
+
+def get_session(request: Request, response: Response) -> Iterator[Session]:
+    """Resolve the caller's session and hold its lock for the request."""
+    session = resolve_session(request, response)
+    with session.lock:
+        try:
+            yield session
+        finally:
+            registry.touch(session)
+
+
+def get_ws_session(websocket: WebSocket) -> Session:
+    """Resolve a WebSocket client's session; streams take the session lock per training chunk."""
+    requested = (
+        websocket.query_params.get("session")
+        or websocket.headers.get(SESSION_HEADER)
+        or websocket.cookies.get(SESSION_COOKIE)
+    )
+    return registry.get_or_create(requested)
+
+
+def get_perceptron_service(session: Session = Depends(get_session)) -> PerceptronService:
+    return session.perceptron
+
+
+def get_lms_service(session: Session = Depends(get_session)) -> LmsService:
+    return session.lms
+
 
-perceptron_service = PerceptronService()
-lms_service = LmsService()
-mlp_service = MlpService()
+def get_mlp_service(session: Session = Depends(get_session)) -> MlpService:
+    return session.mlp
@@ -1,36 +1,97 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
-from fastapi import APIRouter, Body, HTTPException
+import numpy as np
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from starlette.concurrency import run_in_threadpool
 
-from backend.api.utils import build_mlp_payload, load_samples_from_body
-from backend.nn.grid_mlp import GridMlp
-from backend.viz.viz_error_surface import mse_surface
+from backend.api.deps import cpu_pool, resolve_session, response_cache
+from backend.api.payload import compact_mlp_step, parse_payload_options
+from backend.api.utils import build_mlp_payload, check_mlp_size, load_samples_from_body, parse_board, parse_bool
+from backend.api.wire import Wire, WireFormat, get_wire, render
+from backend.core.sample_matrix import SampleMatrix
+from backend.nn.grid_mlp import GridMlp, reshape_template
+from backend.services.sessions import Session
+from backend.viz.viz_detect import correlate_many, mlp_score_maps, top_placements
+from backend.viz.viz_error_surface import mse_minimum, mse_stats, mse_surface_from_stats
 
 router = APIRouter()
 
 
 @router.post("/error-surface")
-def error_surface(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, Any]:
+async def error_surface(
+    request: Request,
+    body: Dict[str, Any] = Body(default_factory=dict),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    return await response_cache.respond(
+        request,
+        "error-surface",
+        body,
+        lambda: _run_on_samples("error-surface", error_surface_payload, body, wire.format),
+        wire.format,
+    )
+
+
+@router.post("/mlp-internals")
+async def mlp_internals(
+    request: Request,
+    body: Dict[str, Any] = Body(default_factory=dict),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    return await response_cache.respond(
+        request,
+        "mlp-internals",
+        body,
+        lambda: _run_on_samples("mlp-internals", mlp_internals_payload, body, wire.format),
+        wire.format,
+    )
+
+
+@router.get("/cache-stats")
+def cache_stats() -> Dict[str, int]:
+    return response_cache.stats()
+
+
+@router.get("/executor-stats")
+def executor_stats() -> Dict[str, Any]:
+    return cpu_pool.stats()
+
+
+async def _run_on_samples(
+    endpoint: str,
+    fn: Callable[..., Dict[str, Any]],
+    body: Dict[str, Any],
+    wire: WireFormat,
+) -> bytes:
+    """Resolve the dataset here (dataset_id lives in this process), then compute and encode on the CPU pool."""
     try:
-        dataset, samples, grid_shape = load_samples_from_body(body)
+        dataset, samples, grid_shape = await run_in_threadpool(load_samples_from_body, body)
+        return await cpu_pool.run(endpoint, render, wire, fn, dataset, samples, grid_shape, body)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+def error_surface_payload(
+    dataset: str,
+    samples: SampleMatrix,
+    grid_shape: Tuple[int, int],
+    body: Dict[str, Any],
+) -> Dict[str, Any]:
+    """/error-surface response; runs on the CPU pool, so errors are plain ValueErrors."""
     rows, cols = grid_shape
     if rows * cols != 2:
-        raise HTTPException(status_code=400, detail="error surface requires 2D inputs (grid_rows * grid_cols == 2)")
+        raise ValueError("error surface requires 2D inputs (grid_rows * grid_cols == 2)")
     try:
         steps = int(body.get("steps", 25))
         w_min = float(body.get("w_min", -2.0))
         w_max = float(body.get("w_max", 2.0))
         b = float(body.get("b", 0.0))
     except (TypeError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail="steps, w_min, w_max, and b must be numeric") from exc
-    try:
-        grid = mse_surface(samples, (w_min, w_max), steps=steps, b=b)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+        raise ValueError("steps, w_min, w_max, and b must be numeric") from exc
+    stats = mse_stats(samples)
+    grid = mse_surface_from_stats(stats, (w_min, w_max), steps=steps, b=b).tolist()
     return {
         "dataset": dataset,
         "grid_rows": rows,
@@ -40,15 +101,17 @@ def error_surface(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str
         "bias": b,
         "sample_count": len(samples),
         "grid": grid,
+        "minimum": mse_minimum(stats, b=b),
     }
 
 
-@router.post("/mlp-internals")
-def mlp_internals(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, Any]:
-    try:
-        dataset, samples, grid_shape = load_samples_from_body(body)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+def mlp_internals_payload(
+    dataset: str,
+    samples: SampleMatrix,
+    grid_shape: Tuple[int, int],
+    body: Dict[str, Any],
+) -> Dict[str, Any]:
+    """/mlp-internals response for one inspected training step (CPU pool)."""
     rows, cols = grid_shape
     try:
         hidden_dim = int(body.get("hidden_dim", 2))
@@ -57,15 +120,15 @@ def mlp_internals(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str
         seed_value = int(seed) if seed is not None else 0
         sample_index = int(body.get("sample_index", 0))
     except (TypeError, ValueError) as exc:
-        raise HTTPException(status_code=400, detail="hidden_dim, lr, seed, and sample_index must be numeric") from exc
-    if hidden_dim <= 0:
-        raise HTTPException(status_code=400, detail="hidden_dim must be positive")
+        raise ValueError("hidden_dim, lr, seed, and sample_index must be numeric") from exc
+    payload_options = parse_payload_options(body)
+    check_mlp_size(hidden_dim, rows, cols)
     if not samples:
-        raise HTTPException(status_code=400, detail="samples must be non-empty")
+        raise ValueError("samples must be non-empty")
     sample = samples[sample_index % len(samples)]
     model = GridMlp(rows=rows, cols=cols, hidden_dim=hidden_dim, lr=lr, seed=seed_value)
     internals = model.model.inspect_step(sample["x"], sample["y"])
-    return build_mlp_payload(
+    payload = build_mlp_payload(
         internals=internals,
         rows=rows,
         cols=cols,
@@ -74,3 +137,93 @@ def mlp_internals(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str
         sample_count=len(samples),
         dataset=dataset,
     )
+    return compact_mlp_step(payload, payload_options)
+
+
+@router.post("/detect")
+async def detect(
+    body: Dict[str, Any] = Body(default_factory=dict),
+    session: Session = Depends(resolve_session),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    """Score every placement of a template on a board in one pass.
+
+    source "perceptron" / "mlp" use this session's trained model (its grid
+    is the template); "template" takes template + bias from the body.
+    """
+    try:
+        board = parse_board(body.get("board"))
+        top_k = int(body.get("top_k", 5))
+        include_hidden = parse_bool(body, "include_hidden")
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    source = body.get("source", "perceptron")
+    method = body.get("method", "auto")
+    try:
+        model = await run_in_threadpool(_detect_model, session, source, body)
+        content = await cpu_pool.run(
+            "detect", render, wire.format, detect_payload, board, source, model, method, top_k, include_hidden
+        )
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return wire.content_response(content)
+
+
+def _detect_model(session: Session, source: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the template(s) and biases to score with, so the pool never touches session state.
+
+    session.lock is held only for the copy, not while the pool scores the board.
+    """
+    if source == "template":
+        return {"templates": [parse_board(body.get("template"))], "bias": float(body.get("bias", 0.0))}
+    with session.lock:
+        if source == "mlp":
+            service = session.mlp
+            rows, cols = service.grid_rows, service.grid_cols
+            model = service.model
+            return {
+                "templates": [reshape_template(row, rows, cols) for row in model.hidden.W],
+                "hidden_b": list(model.hidden.b),
+                "out_w": list(model.output.W[0]),
+                "out_b": model.output.b[0],
+            }
+        if source == "perceptron":
+            service = session.perceptron
+            if service.variant == "kernel":
+                raise ValueError("kernel perceptron has no weight template")
+            w, b = service.predictor_weights()
+            return {"templates": [reshape_template(w, service.grid_rows, service.grid_cols)], "bias": b}
+    raise ValueError("source must be 'perceptron', 'mlp', or 'template'")
+
+
+def detect_payload(
+    board: np.ndarray,
+    source: str,
+    model: Dict[str, Any],
+    method: str,
+    top_k: int,
+    include_hidden: bool,
+) -> Dict[str, Any]:
+    """/detect response (CPU pool)."""
+    templates = model["templates"]
+    if source == "mlp":
+        hidden, scores, used = mlp_score_maps(
+            board, templates, model["hidden_b"], model["out_w"], model["out_b"], method=method
+        )
+    else:
+        maps, used = correlate_many(board, templates, method=method)
+        scores = maps[0] + model["bias"]
+    rows, cols = np.shape(templates[0])
+    payload: Dict[str, Any] = {
+        "source": source,
+        "method": used[0],
+        "board_rows": int(board.shape[0]),
+        "board_cols": int(board.shape[1]),
+        "template_rows": int(rows),
+        "template_cols": int(cols),
+        "score_map": scores.tolist(),
+        "peaks": top_placements(scores, top_k),
+    }
+    if source == "mlp" and include_hidden:
+        payload["hidden_maps"] = hidden.tolist()
+    return payload
@@ -0,0 +1,189 @@
+"""Off-loop execution and backpressure for CPU-heavy routes.
+
+Pure computations (error surface, MLP internals, detection maps) run on a
+CpuExecutor: a process pool by default, so NumPy work and Python loops
+alike stay off the GIL that serves cheap reads such as /state. Set
+PERCEPTRON_CPU_EXECUTOR=thread to use threads instead (the pool also
+falls back to threads where processes are unavailable), and
+PERCEPTRON_CPU_WORKERS to size it.
+
+Each heavy endpoint also has an EndpointLimiter: at most max_concurrent
+calls run, at most max_queue more wait, and anything beyond that is
+rejected at once with 503 + Retry-After instead of piling up.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Mapping, Tuple
+import asyncio
+import os
+import threading
+
+from fastapi import HTTPException
+
+EXECUTOR_ENV = "PERCEPTRON_CPU_EXECUTOR"
+WORKERS_ENV = "PERCEPTRON_CPU_WORKERS"
+EXECUTOR_KINDS = ("process", "thread")
+RETRY_AFTER_SECONDS = 1
+
+# endpoint -> (max_concurrent, max_queue)
+DEFAULT_LIMITS: Dict[str, Tuple[int, int]] = {
+    "error-surface": (2, 8),
+    "mlp-internals": (2, 8),
+    "detect": (2, 8),
+    "train": (4, 16),
+}
+
+
+class Overloaded(RuntimeError):
+    """Raised when an endpoint's concurrency slots and queue are all taken."""
+
+
+class EndpointLimiter:
+    """Concurrency cap plus bounded wait queue for one endpoint (event-loop side)."""
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int) -> None:
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
+        if max_queue < 0:
+            raise ValueError("max_queue must be non-negative")
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _current_semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives belong to one loop; rebuild if the app moved to another (e.g. test clients).
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self.active = self.waiting = 0
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        semaphore = self._current_semaphore()
+        if semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise Overloaded(f"{self.name} is busy; retry shortly")
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+        }
+
+
+def _workers_from_env() -> int | None:
+    value = os.environ.get(WORKERS_ENV)
+    if not value:
+        return None
+    workers = int(value)
+    if workers <= 0:
+        raise ValueError(f"{WORKERS_ENV} must be positive")
+    return workers
+
+
+class CpuExecutor:
+    """Lazily created process (or thread) pool for pure, picklable functions."""
+
+    def __init__(self, kind: str | None = None, workers: int | None = None) -> None:
+        kind = kind or os.environ.get(EXECUTOR_ENV, "process")
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"{EXECUTOR_ENV} must be 'process' or 'thread'")
+        self.kind = kind
+        self.workers = workers or _workers_from_env() or os.cpu_count() or 1
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create()
+            return self._executor
+
+    def _create(self) -> Executor:
+        if self.kind == "process":
+            try:
+                return ProcessPoolExecutor(max_workers=self.workers)
+            except (ImportError, NotImplementedError, OSError):
+                # No working multiprocessing (e.g. no sem_open): threads still keep the loop free.
+                self.kind = "thread"
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cpu")
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class CpuPool:
+    """The shared executor plus one limiter per heavy endpoint."""
+
+    def __init__(
+        self,
+        executor: CpuExecutor | None = None,
+        limits: Mapping[str, Tuple[int, int]] = DEFAULT_LIMITS,
+    ) -> None:
+        self.executor = executor or CpuExecutor()
+        self.limiters = {name: EndpointLimiter(name, *limit) for name, limit in limits.items()}
+
+    @asynccontextmanager
+    async def slot(self, endpoint: str) -> AsyncIterator[None]:
+        """Hold one of endpoint's slots; full queues become 503 with Retry-After."""
+        try:
+            async with self.limiters[endpoint].slot():
+                yield
+        except Overloaded as exc:
+            raise HTTPException(
+                status_code=503,
+                detail=str(exc),
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            ) from exc
+
+    async def run(self, endpoint: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) on the executor within endpoint's limits."""
+        async with self.slot(endpoint):
+            return await self.executor.run(fn, *args)
+
+    def limit(self, endpoint: str) -> Callable[[], AsyncIterator[None]]:
+        """FastAPI dependency holding a slot for the whole request (for stateful sync routes)."""
+
+        async def dependency() -> AsyncIterator[None]:
+            async with self.slot(endpoint):
+                yield
+
+        return dependency
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executor": self.executor.kind,
+            "workers": self.executor.workers,
+            "endpoints": {name: limiter.stats() for name, limiter in self.limiters.items()},
+        }
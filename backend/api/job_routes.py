@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from fastapi import APIRouter, Body, HTTPException
+
+from backend.api.deps import jobs
+from backend.api.utils import load_samples_from_body, parse_bool
+from backend.services.jobs import JobQueueFull, JobSpec
+
+router = APIRouter(prefix="/jobs")
+
+
+def _parse_spec(body: Dict[str, Any], dataset: str, grid_shape: Tuple[int, int]) -> JobSpec:
+    model = str(body.get("model", "perceptron"))
+    try:
+        seed = body.get("seed", 0)
+        chunk_epochs = body.get("chunk_epochs")
+        numbers = {
+            "epochs": int(body.get("epochs", 100)),
+            "lr": float(body.get("lr", 1.0 if model == "perceptron" else 0.5)),
+            "seed": int(seed) if seed is not None else None,
+            "hidden_dim": int(body.get("hidden_dim", 2)),
+            "batch_size": int(body.get("batch_size", 1)),
+            "chunk_epochs": int(chunk_epochs) if chunk_epochs is not None else None,
+        }
+    except (TypeError, ValueError) as exc:
+        raise ValueError("epochs, lr, seed, hidden_dim, batch_size, and chunk_epochs must be numeric") from exc
+    return JobSpec(
+        model=model,
+        dataset=dataset,
+        grid_shape=grid_shape,
+        init=str(body.get("init", "zeros")),
+        early_stop=parse_bool(body, "early_stop", default=True),
+        **numbers,
+    )
+
+
+@router.post("", status_code=202)
+def submit_job(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, Any]:
+    """Start a training run in the background; poll GET /jobs/{job_id} for progress."""
+    try:
+        dataset, samples, grid_shape = load_samples_from_body(body)
+        spec = _parse_spec(body, dataset, grid_shape)
+        job = jobs.submit(spec, samples)
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "5"}) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return job.to_dict(include_result=False)
+
+
+@router.get("")
+def list_jobs() -> List[Dict[str, Any]]:
+    return [job.to_dict(include_result=False) for job in jobs.list()]
+
+
+@router.get("/{job_id}")
+def job_status(job_id: str) -> Dict[str, Any]:
+    try:
+        return jobs.get(job_id).to_dict()
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="job not found") from exc
+
+
+@router.post("/{job_id}/cancel")
+def cancel_job(job_id: str) -> Dict[str, Any]:
+    try:
+        job = jobs.cancel(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="job not found") from exc
+    return job.to_dict(include_result=False)
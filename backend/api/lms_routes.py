@@ -2,33 +2,41 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, WebSocket
 
-from backend.api.deps import lms_service
-from backend.api.utils import normalize_samples, validate_grid_shape
+from backend.api.deps import cpu_pool, get_lms_service, get_ws_session
+from backend.api.stream import serve_training_stream
+from backend.api.utils import custom_samples_from_body, parse_run_options, requested_dataset
+from backend.services.lms_service import LmsService
+from backend.services.sessions import Session
 
 router = APIRouter(prefix="/lms")
 
 
 @router.get("/state")
-def lms_state() -> Dict[str, Any]:
+def lms_state(lms_service: LmsService = Depends(get_lms_service)) -> Dict[str, Any]:
     return lms_service.state()
 
 
 @router.post("/reset")
-def lms_reset(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, Any]:
+def lms_reset(
+    body: Dict[str, Any] = Body(default_factory=dict),
+    lms_service: LmsService = Depends(get_lms_service),
+) -> Dict[str, Any]:
     if "lr" in body:
         try:
             lms_service.set_lr(float(body["lr"]))
         except (TypeError, ValueError) as exc:
             raise HTTPException(status_code=400, detail="lr must be a number") from exc
-    dataset = body.get("dataset", lms_service.dataset)
+    try:
+        dataset = requested_dataset(body, lms_service.dataset)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if dataset == "custom":
         try:
-            rows, cols = validate_grid_shape(body.get("grid_rows"), body.get("grid_cols"))
+            samples, (rows, cols) = custom_samples_from_body(body)
             if rows * cols != 2:
                 raise ValueError("LMS requires 2D inputs (grid_rows * grid_cols == 2)")
-            samples = normalize_samples(body.get("samples", []), rows, cols)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         lms_service.set_dataset("custom", custom_samples=samples)
@@ -40,6 +48,20 @@ def lms_reset(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, An
     return lms_service.state()
 
 
-@router.post("/step")
-def lms_step() -> Dict[str, Any]:
+@router.post("/step", dependencies=[Depends(cpu_pool.limit("train"))])
+def lms_step(
+    body: Dict[str, Any] = Body(default_factory=dict),
+    lms_service: LmsService = Depends(get_lms_service),
+) -> Dict[str, Any]:
+    try:
+        run_options = parse_run_options(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if run_options is not None:
+        return lms_service.run(run_options)
     return lms_service.step()
+
+
+@router.websocket("/stream")
+async def lms_stream(websocket: WebSocket, session: Session = Depends(get_ws_session)) -> None:
+    await serve_training_stream(websocket, session, lambda current: current.lms)
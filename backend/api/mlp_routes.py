@@ -1,60 +1,111 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict
 
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, WebSocket
 
-from backend.api.deps import mlp_service
-from backend.api.utils import build_mlp_payload, normalize_samples, validate_grid_shape
+from backend.api.boundary import RasterQuery, boundary_response, raster_query
+from backend.api.deps import cpu_pool, get_mlp_service, get_ws_session
+from backend.api.payload import compact_mlp_snapshot, parse_fields, parse_payload_options
+from backend.api.stream import serve_training_stream
+from backend.api.utils import (
+    build_mlp_payload,
+    check_mlp_size,
+    custom_samples_from_body,
+    parse_run_options,
+    requested_dataset,
+)
+from backend.api.wire import Wire, get_wire
+from backend.services.mlp_service import STEP_FIELDS, MlpService
+from backend.services.sessions import Session
 
 router = APIRouter(prefix="/mlp")
 
 
-def _parse_custom_payload(body: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Tuple[int, int]]:
-    rows, cols = validate_grid_shape(body.get("grid_rows"), body.get("grid_cols"))
-    samples = normalize_samples(body.get("samples", []), rows, cols)
-    return samples, (rows, cols)
+@router.get("/state")
+def mlp_state(
+    full_weights: bool | None = None,
+    preview_side: int = 16,
+    fields: str | None = None,
+    mlp_service: MlpService = Depends(get_mlp_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        payload_options = parse_payload_options({"full_weights": full_weights, "preview_side": preview_side})
+        selected = parse_fields({"fields": fields})
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return wire.response(compact_mlp_snapshot(mlp_service.snapshot(selected), payload_options))
 
 
-@router.get("/state")
-def mlp_state() -> Dict[str, Any]:
-    return mlp_service.snapshot()
+@router.get("/boundary")
+def mlp_boundary(
+    query: RasterQuery = Depends(raster_query),
+    mlp_service: MlpService = Depends(get_mlp_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        source = mlp_service.boundary()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return boundary_response(wire, source, query)
 
 
 @router.post("/reset")
-def mlp_reset(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, Any]:
-    if "hidden_dim" in body or "lr" in body or "seed" in body:
-        try:
-            hidden_dim = int(body["hidden_dim"]) if "hidden_dim" in body else None
-            lr = float(body["lr"]) if "lr" in body else None
-            seed = int(body["seed"]) if "seed" in body else None
-        except (TypeError, ValueError) as exc:
-            raise HTTPException(status_code=400, detail="hidden_dim, lr, and seed must be numeric") from exc
-        try:
-            mlp_service.set_hyperparams(hidden_dim=hidden_dim, lr=lr, seed=seed)
-        except ValueError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-    dataset = body.get("dataset")
-    if dataset:
-        if dataset == "custom":
-            try:
-                custom = _parse_custom_payload(body)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
-            mlp_service.set_dataset("custom", custom=custom)
+def mlp_reset(
+    body: Dict[str, Any] = Body(default_factory=dict),
+    mlp_service: MlpService = Depends(get_mlp_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        payload_options = parse_payload_options(body)
+        fields = parse_fields(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    try:
+        hidden_dim = int(body["hidden_dim"]) if "hidden_dim" in body else None
+        lr = float(body["lr"]) if "lr" in body else None
+        seed = int(body["seed"]) if "seed" in body else None
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="hidden_dim, lr, and seed must be numeric") from exc
+    try:
+        dataset = requested_dataset(body)
+        custom = custom_samples_from_body(body) if dataset == "custom" else None
+        if dataset in ("or", "xor"):
+            rows, cols = 1, 2
+        elif custom is not None:
+            rows, cols = custom[1]
+        else:
+            rows, cols = mlp_service.grid_rows, mlp_service.grid_cols
+        check_mlp_size(mlp_service.hidden_dim if hidden_dim is None else hidden_dim, rows, cols)
+        mlp_service.set_hyperparams(hidden_dim=hidden_dim, lr=lr, seed=seed)
+        if dataset:
+            mlp_service.set_dataset(dataset, custom=custom)
         else:
-            try:
-                mlp_service.set_dataset(dataset)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail=str(exc)) from exc
-    else:
-        mlp_service.reset_model()
-    return mlp_service.snapshot()
+            mlp_service.reset_model()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return wire.response(compact_mlp_snapshot(mlp_service.snapshot(fields), payload_options))
 
 
-@router.post("/step")
-def mlp_step() -> Dict[str, Any]:
-    snapshot, internals = mlp_service.step()
+@router.post("/step", dependencies=[Depends(cpu_pool.limit("train"))])
+def mlp_step(
+    body: Dict[str, Any] = Body(default_factory=dict),
+    mlp_service: MlpService = Depends(get_mlp_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        run_options = parse_run_options(body)
+        payload_options = parse_payload_options(body)
+        fields = parse_fields(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if run_options is not None:
+        return wire.response(compact_mlp_snapshot(mlp_service.run(run_options, fields), payload_options))
+    need_internals = fields is None or not fields.isdisjoint(STEP_FIELDS)
+    snapshot, internals = mlp_service.step(fields, need_internals=need_internals)
+    if internals is None:
+        return wire.response(compact_mlp_snapshot(snapshot, payload_options))
     step_payload = build_mlp_payload(
         internals=internals,
         rows=mlp_service.grid_rows,
@@ -63,5 +114,11 @@ def mlp_step() -> Dict[str, Any]:
         sample_index=(mlp_service.idx - 1) % len(mlp_service.samples),
         sample_count=len(mlp_service.samples),
         dataset=mlp_service.dataset,
+        fields=fields,
     )
-    return {**snapshot, "step": step_payload}
+    return wire.response(compact_mlp_snapshot({**snapshot, "step": step_payload}, payload_options))
+
+
+@router.websocket("/stream")
+async def mlp_stream(websocket: WebSocket, session: Session = Depends(get_ws_session)) -> None:
+    await serve_training_stream(websocket, session, lambda current: current.mlp, compact=compact_mlp_snapshot)
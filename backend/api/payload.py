@@ -0,0 +1,145 @@
+"""Response-size controls for large grids.
+
+Grids up to 5x5 (the classic limit) always get full payloads. Larger
+grids default to a compact payload: per-cell vectors (weights, inputs,
+gradients) are replaced by block-mean previews of at most preview_side
+cells per side, and per-step weight snapshots are dropped from
+trajectories. "full_weights": true opts back into everything.
+
+MLP routes also take "fields", a sparse fieldset: only the listed
+sections (see MLP_FIELDS) are computed and sent.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Mapping, Sequence
+
+from backend.nn.grid_mlp import downsample_template
+from backend.services.mlp_service import MLP_FIELDS
+
+FULL_PAYLOAD_MAX_CELLS = 25
+DEFAULT_PREVIEW_SIDE = 16
+MAX_PREVIEW_SIDE = 64
+
+
+@dataclass(frozen=True)
+class PayloadOptions:
+    full_weights: bool | None = None
+    preview_side: int = DEFAULT_PREVIEW_SIDE
+
+    def is_full(self, rows: int, cols: int) -> bool:
+        if self.full_weights is None:
+            return rows * cols <= FULL_PAYLOAD_MAX_CELLS
+        return self.full_weights
+
+
+def parse_payload_options(params: Mapping[str, Any]) -> PayloadOptions:
+    """Read full_weights / preview_side from a JSON body or query parameters."""
+    full = params.get("full_weights")
+    if isinstance(full, str):
+        full = full.lower() in ("1", "true", "yes")
+    try:
+        side = int(params.get("preview_side", DEFAULT_PREVIEW_SIDE))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("preview_side must be an integer") from exc
+    if not 1 <= side <= MAX_PREVIEW_SIDE:
+        raise ValueError(f"preview_side must be between 1 and {MAX_PREVIEW_SIDE}")
+    return PayloadOptions(full_weights=None if full is None else bool(full), preview_side=side)
+
+
+def parse_fields(params: Mapping[str, Any], allowed: Sequence[str] = MLP_FIELDS) -> FrozenSet[str] | None:
+    """Read "fields" (a list, or a comma-separated string) from a JSON body or query; None means all."""
+    value = params.get("fields")
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [part.strip() for part in value.split(",") if part.strip()]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError("fields must be a list of strings or a comma-separated string")
+    unknown = sorted(set(value) - set(allowed))
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)} (expected some of: {', '.join(allowed)})")
+    return frozenset(value)
+
+
+def _preview(values: Any, rows: int, cols: int, side: int) -> List[List[float]] | None:
+    if values is None:
+        return None
+    return downsample_template(values, rows, cols, side)
+
+
+def _mark(payload: Dict[str, Any], options: PayloadOptions) -> Dict[str, Any]:
+    payload["payload"] = "compact"
+    payload["preview_side"] = options.preview_side
+    return payload
+
+
+def compact_perceptron(payload: Dict[str, Any], options: PayloadOptions) -> Dict[str, Any]:
+    """Perceptron state/step/run payload, compacted for large grids."""
+    rows, cols = payload["grid_rows"], payload["grid_cols"]
+    if options.is_full(rows, cols):
+        return payload
+    side = options.preview_side
+    out = dict(payload)
+    for key in ("w", "delta_w", "x", "next_x", "w_avg"):
+        if key in out:
+            out[f"{key}_preview"] = _preview(out.pop(key), rows, cols, side)
+    if "trajectory" in out:
+        out["trajectory"] = {k: v for k, v in out["trajectory"].items() if k != "w"}
+    return _mark(out, options)
+
+
+def _template_previews(section: Mapping[str, Any], keys: Sequence[str], rows: int, cols: int, side: int) -> List[Any] | None:
+    """Previews of the first of keys present in section (flat weight rows or 2D templates)."""
+    for key in keys:
+        if key in section:
+            return [_preview(row, rows, cols, side) for row in section[key]]
+    return None
+
+
+def _pick(section: Mapping[str, Any], keys: Sequence[str]) -> Dict[str, Any]:
+    return {key: section[key] for key in keys if key in section}
+
+
+def compact_mlp_snapshot(snapshot: Dict[str, Any], options: PayloadOptions) -> Dict[str, Any]:
+    """MLP state/run payload: hidden weights become template previews, evals lose x."""
+    rows, cols = snapshot["grid_rows"], snapshot["grid_cols"]
+    if options.is_full(rows, cols):
+        return snapshot
+    side = options.preview_side
+    out = dict(snapshot)
+    out["next_x_preview"] = _preview(out.pop("next_x"), rows, cols, side)
+    if "hidden" in out:
+        hidden = out["hidden"]
+        out["hidden"] = _pick(hidden, ("bias",))
+        out["hidden"]["templates"] = _template_previews(hidden, ("weights", "templates"), rows, cols, side)
+    if "evals" in out:
+        out["evals"] = [{k: v for k, v in item.items() if k != "x"} for item in out["evals"]]
+    if "trajectory" in out:
+        out["trajectory"] = {k: v for k, v in out["trajectory"].items() if k != "hidden_W"}
+    if "step" in out:
+        out["step"] = compact_mlp_step(out["step"], options)
+    return _mark(out, options)
+
+
+def compact_mlp_step(step: Dict[str, Any], options: PayloadOptions) -> Dict[str, Any]:
+    """build_mlp_payload output: keeps scalars and previews of the per-cell tensors."""
+    rows, cols = step["grid_rows"], step["grid_cols"]
+    if options.is_full(rows, cols):
+        return step
+    side = options.preview_side
+    out = dict(step)
+    out["x_preview"] = _preview(out.pop("x"), rows, cols, side)
+    if "hidden" in out:
+        hidden = out["hidden"]
+        out["hidden"] = _pick(hidden, ("bias_before", "bias_after", "z", "a"))
+        for when in ("before", "after"):
+            keys = (f"weights_{when}", f"templates_{when}")
+            if any(key in hidden for key in keys):
+                out["hidden"][f"templates_{when}"] = _template_previews(hidden, keys, rows, cols, side)
+    if "gradients" in out:
+        gradients = out["gradients"]
+        out["gradients"] = _pick(gradients, ("hidden_b", "out_W", "out_b"))
+        out["gradients"]["templates"] = _template_previews(gradients, ("hidden_W", "templates"), rows, cols, side)
+    return _mark(out, options)
@@ -1,63 +1,128 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Tuple
 
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, WebSocket
 
-from backend.api.deps import perceptron_service
-from backend.api.utils import normalize_samples, validate_grid_shape
+from backend.api.boundary import RasterQuery, boundary_response, raster_query
+from backend.api.deps import cpu_pool, get_perceptron_service, get_ws_session
+from backend.api.payload import compact_perceptron, parse_payload_options
+from backend.api.stream import serve_training_stream
+from backend.api.utils import custom_samples_from_body, has_custom_payload, parse_run_options, requested_dataset
+from backend.api.wire import Wire, get_wire
+from backend.core.sample_matrix import SampleMatrix
+from backend.services.perceptron_service import PerceptronService
+from backend.services.sessions import Session
 
 router = APIRouter()
 
 
 @router.get("/state")
-def state() -> Dict[str, Any]:
-    return perceptron_service.state()
+def state(
+    full_weights: bool | None = None,
+    preview_side: int = 16,
+    perceptron_service: PerceptronService = Depends(get_perceptron_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        payload_options = parse_payload_options({"full_weights": full_weights, "preview_side": preview_side})
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return wire.response(compact_perceptron(perceptron_service.state(), payload_options))
 
 
-@router.post("/step")
-def step(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, Any]:
+@router.get("/boundary")
+def boundary(
+    query: RasterQuery = Depends(raster_query),
+    perceptron_service: PerceptronService = Depends(get_perceptron_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        source = perceptron_service.boundary()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return boundary_response(wire, source, query)
+
+
+@router.post("/step", dependencies=[Depends(cpu_pool.limit("train"))])
+def step(
+    body: Dict[str, Any] = Body(default_factory=dict),
+    perceptron_service: PerceptronService = Depends(get_perceptron_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        run_options = parse_run_options(body)
+        payload_options = parse_payload_options(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if "lr" in body:
         try:
             perceptron_service.set_lr(float(body["lr"]))
         except (TypeError, ValueError) as exc:
             raise HTTPException(status_code=400, detail="lr must be a number") from exc
-    custom_payload: Tuple[List[Dict[str, Any]], Tuple[int, int]] | None = None
-    if body.get("dataset") == "custom" and "samples" in body:
+    if "variant" in body or "kernel" in body:
         try:
-            rows, cols = validate_grid_shape(body.get("grid_rows"), body.get("grid_cols"))
-            samples = normalize_samples(body.get("samples", []), rows, cols)
-            custom_payload = (samples, (rows, cols))
+            kernel = body.get("kernel")
+            if kernel is not None and not isinstance(kernel, dict):
+                raise ValueError("kernel must be an object")
+            perceptron_service.set_variant(body.get("variant", perceptron_service.variant), kernel=kernel)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
-    dataset = body.get("dataset")
+    custom_payload: Tuple[SampleMatrix, Tuple[int, int]] | None = None
+    try:
+        dataset = requested_dataset(body)
+        if has_custom_payload(body):
+            custom_payload = custom_samples_from_body(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if dataset and dataset != perceptron_service.dataset:
         try:
             perceptron_service.set_dataset(dataset, custom=custom_payload)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return perceptron_service.step()
+    if run_options is not None:
+        return wire.response(compact_perceptron(perceptron_service.run(run_options), payload_options))
+    return wire.response(compact_perceptron(perceptron_service.step(), payload_options))
 
 
 @router.post("/reset")
-def reset(body: Dict[str, Any] = Body(default_factory=dict)) -> Dict[str, Any]:
+def reset(
+    body: Dict[str, Any] = Body(default_factory=dict),
+    perceptron_service: PerceptronService = Depends(get_perceptron_service),
+    wire: Wire = Depends(get_wire),
+) -> Response:
+    try:
+        payload_options = parse_payload_options(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if "lr" in body:
         try:
             perceptron_service.set_lr(float(body["lr"]))
         except (TypeError, ValueError) as exc:
             raise HTTPException(status_code=400, detail="lr must be a number") from exc
-    custom_payload: Tuple[List[Dict[str, Any]], Tuple[int, int]] | None = None
-    if body.get("dataset") == "custom" and "samples" in body:
+    if "variant" in body or "kernel" in body:
         try:
-            rows, cols = validate_grid_shape(body.get("grid_rows"), body.get("grid_cols"))
-            samples = normalize_samples(body.get("samples", []), rows, cols)
-            custom_payload = (samples, (rows, cols))
+            kernel = body.get("kernel")
+            if kernel is not None and not isinstance(kernel, dict):
+                raise ValueError("kernel must be an object")
+            perceptron_service.set_variant(body.get("variant", perceptron_service.variant), kernel=kernel)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
-    dataset = body.get("dataset")
+    custom_payload: Tuple[SampleMatrix, Tuple[int, int]] | None = None
+    try:
+        dataset = requested_dataset(body)
+        if has_custom_payload(body):
+            custom_payload = custom_samples_from_body(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if dataset:
         try:
             perceptron_service.set_dataset(dataset, custom=custom_payload)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return perceptron_service.reset()
+    return wire.response(compact_perceptron(perceptron_service.reset(), payload_options))
+
+
+@router.websocket("/stream")
+async def stream(websocket: WebSocket, session: Session = Depends(get_ws_session)) -> None:
+    await serve_training_stream(websocket, session, lambda current: current.perceptron, compact=compact_perceptron)
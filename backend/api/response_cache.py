@@ -0,0 +1,141 @@
+"""Memoized JSON responses for endpoints that are pure functions of their body.
+
+The key is a hash of the build id, the route name and the canonical JSON of
+the request body (sorted keys, no whitespace), which doubles as a strong
+ETag: a client sending it back in If-None-Match gets a 304 without the
+server recomputing, or even still holding, the response. The build id
+changes with the package version, PAYLOAD_VERSION and PERCEPTRON_BUILD_ID,
+so tags issued before a deploy stop matching after it. Cached values are
+the serialized response bytes, so the LRU bound is an exact byte count.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from importlib import metadata
+from typing import Any, Awaitable, Callable, Dict, Mapping
+import hashlib
+import json
+import os
+import threading
+
+from fastapi import Request, Response
+
+from backend.api.wire import WireFormat
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+BUILD_ID_ENV = "PERCEPTRON_BUILD_ID"
+# Bump when a cached route's payload changes shape without a version bump.
+PAYLOAD_VERSION = 1
+
+
+def default_build_id() -> str:
+    """Package version and PAYLOAD_VERSION, plus PERCEPTRON_BUILD_ID (e.g. a git SHA) if set."""
+    try:
+        package = metadata.version("perceptron-visual-lab")
+    except metadata.PackageNotFoundError:
+        package = "dev"
+    build = f"{package}+p{PAYLOAD_VERSION}"
+    extra = os.environ.get(BUILD_ID_ENV)
+    return f"{build}+{extra}" if extra else build
+
+
+def request_key(route: str, body: Mapping[str, Any]) -> str:
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(f"{route}\n{canonical}".encode()).hexdigest()
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    """Whether If-None-Match names etag. "*" never matches: these views have no stored current representation."""
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return etag in tags or f"W/{etag}" in tags
+
+
+class ResponseCache:
+    """Byte-bounded LRU of serialized responses with hit/miss counters."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, build_id: str | None = None) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.build_id = default_build_id() if build_id is None else build_id
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            content = self._entries.get(key)
+            if content is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return content
+
+    def put(self, key: str, content: bytes) -> None:
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            self._entries[key] = content
+            self._total_bytes += len(content)
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+        }
+
+    async def respond(
+        self,
+        request: Request,
+        route: str,
+        body: Mapping[str, Any],
+        compute: Callable[[], Awaitable[bytes]],
+        wire: WireFormat = WireFormat(),
+    ) -> Response:
+        """Serve route for body from cache (or 304), awaiting compute (encoded as wire) on a miss.
+
+        Each encoding is cached (and tagged) separately. Errors raised by
+        compute (HTTPException) propagate and are not cached.
+        """
+        key = request_key(f"{self.build_id}|{route}|{wire.token}", body)
+        etag = f'"{key[:32]}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        content = self.get(key)
+        headers["X-Cache"] = "hit" if content is not None else "miss"
+        if content is None:
+            content = await compute()
+            self.put(key, content)
+        return Response(content=content, media_type=wire.media_type, headers=headers)
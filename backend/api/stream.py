@@ -0,0 +1,206 @@
+"""WebSocket training streams shared by the perceptron, LMS and MLP routers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Protocol
+import asyncio
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from backend.api.deps import registry
+from backend.api.payload import PayloadOptions, parse_payload_options
+from backend.services.sessions import Session
+from backend.services.trajectory import RunOptions
+
+MAX_FPS = 60.0
+MAX_STEPS_PER_FRAME = 1000
+
+
+Compactor = Callable[[Dict[str, Any], PayloadOptions], Dict[str, Any]]
+
+
+class RunnableService(Protocol):
+    def run(self, options: RunOptions) -> Dict[str, Any]: ...
+
+
+@dataclass
+class StreamConfig:
+    fps: float = 10.0
+    steps_per_frame: int = 1
+    max_steps: int | None = None
+    until_converged: bool = False
+
+
+def parse_stream_config(params: Mapping[str, str]) -> StreamConfig:
+    try:
+        fps = float(params.get("fps", 10.0))
+        steps_per_frame = int(params.get("steps_per_frame", 1))
+        max_steps = int(params["max_steps"]) if params.get("max_steps") is not None else None
+    except (TypeError, ValueError) as exc:
+        raise ValueError("fps, steps_per_frame, and max_steps must be numeric") from exc
+    if not 0 < fps <= MAX_FPS:
+        raise ValueError(f"fps must be in (0, {MAX_FPS:g}]")
+    if steps_per_frame < 1 or steps_per_frame > MAX_STEPS_PER_FRAME:
+        raise ValueError(f"steps_per_frame must be between 1 and {MAX_STEPS_PER_FRAME}")
+    if max_steps is not None and max_steps < 1:
+        raise ValueError("max_steps must be positive")
+    until_converged = str(params.get("until_converged", "false")).lower() in ("1", "true", "yes")
+    return StreamConfig(fps=fps, steps_per_frame=steps_per_frame, max_steps=max_steps, until_converged=until_converged)
+
+
+class TrainingStream:
+    """Trains on a ticker and pushes the newest state to one WebSocket client.
+
+    Training advances steps_per_frame steps per tick on a worker thread (under
+    the session lock), so the event loop stays free and the training rate does
+    not depend on the client. Frames the client has not drained yet are
+    replaced by newer ones and counted in "coalesced".
+
+    Client messages: {"type": "pause" | "resume" | "stop"}.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        session: Session,
+        service: Callable[[Session], RunnableService],
+        config: StreamConfig,
+        compact: Compactor | None = None,
+        payload_options: PayloadOptions | None = None,
+    ) -> None:
+        self.websocket = websocket
+        self.compact = compact
+        self.payload_options = payload_options or PayloadOptions()
+        self.session = session
+        self.service = service
+        self.config = config
+        self.steps = 0
+        self._settled_streak = 0
+        self.seq = 0
+        self.coalesced = 0
+        self._latest: Dict[str, Any] | None = None
+        self._frame_ready = asyncio.Event()
+        self._running = asyncio.Event()
+        self._running.set()
+        self._send_lock = asyncio.Lock()
+
+    def _run_chunk(self, n: int) -> Dict[str, Any]:
+        with self.session.lock:
+            service = self.service(self.session)
+            if self.config.max_steps is not None:
+                n = min(n, self.config.max_steps - self.steps)
+            options = RunOptions(
+                n=n,
+                stride=n,
+                until_converged=self.config.until_converged,
+                settled_streak=self._settled_streak,
+            )
+            frame = service.run(options)
+            registry.touch(self.session)
+        # Convergence is checked per step; the streak carries over chunk boundaries.
+        self._settled_streak = frame["trajectory"]["settled_streak"]
+        if self.compact is not None:
+            frame = self.compact(frame, self.payload_options)
+        return frame
+
+    def _publish(self, frame: Dict[str, Any]) -> None:
+        if self._latest is not None:
+            self.coalesced += 1
+        self._latest = frame
+        self._frame_ready.set()
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        async with self._send_lock:
+            await self.websocket.send_json(message)
+
+    async def _send_latest(self) -> None:
+        frame, self._latest = self._latest, None
+        if frame is None:
+            return
+        self.seq += 1
+        await self._send(
+            {"type": "frame", "seq": self.seq, "steps": self.steps, "coalesced": self.coalesced, "state": frame}
+        )
+
+    async def _train(self) -> str:
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self.config.fps
+        next_tick = loop.time()
+        while True:
+            if not self._running.is_set():
+                await self._running.wait()
+                next_tick = loop.time()
+            frame = await asyncio.to_thread(self._run_chunk, self.config.steps_per_frame)
+            trajectory = frame["trajectory"]
+            self.steps += trajectory["steps"]
+            self._publish(frame)
+            if trajectory["converged"]:
+                return "converged"
+            if self.config.max_steps is not None and self.steps >= self.config.max_steps:
+                return "max_steps"
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    async def _pump_frames(self) -> None:
+        while True:
+            await self._frame_ready.wait()
+            self._frame_ready.clear()
+            await self._send_latest()
+
+    async def _receive(self) -> str:
+        while True:
+            try:
+                message = await self.websocket.receive_json()
+            except WebSocketDisconnect:
+                return "disconnected"
+            except ValueError:
+                message = None
+            kind = message.get("type") if isinstance(message, dict) else None
+            if kind == "pause":
+                self._running.clear()
+                await self._send({"type": "status", "status": "paused", "steps": self.steps})
+            elif kind == "resume":
+                self._running.set()
+                await self._send({"type": "status", "status": "running", "steps": self.steps})
+            elif kind == "stop":
+                return "stopped"
+            else:
+                await self._send({"type": "error", "detail": "message type must be pause, resume, or stop"})
+
+    async def serve(self) -> None:
+        trainer = asyncio.create_task(self._train())
+        pump = asyncio.create_task(self._pump_frames())
+        receiver = asyncio.create_task(self._receive())
+        done, _ = await asyncio.wait({trainer, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        for task in (trainer, pump, receiver):
+            if task not in done:
+                task.cancel()
+        await asyncio.gather(trainer, pump, receiver, return_exceptions=True)
+        if receiver in done and receiver.result() == "disconnected":
+            return
+        if trainer in done and trainer.exception() is not None:
+            await self._send({"type": "error", "detail": str(trainer.exception())})
+            await self.websocket.close(code=1011)
+            return
+        reason = trainer.result() if trainer in done else receiver.result()
+        await self._send_latest()
+        await self._send({"type": "status", "status": "done", "reason": reason, "steps": self.steps})
+        await self.websocket.close()
+
+
+async def serve_training_stream(
+    websocket: WebSocket,
+    session: Session,
+    service: Callable[[Session], RunnableService],
+    compact: Compactor | None = None,
+) -> None:
+    await websocket.accept()
+    try:
+        config = parse_stream_config(websocket.query_params)
+        payload_options = parse_payload_options(websocket.query_params)
+    except ValueError as exc:
+        await websocket.send_json({"type": "error", "detail": str(exc)})
+        await websocket.close(code=1008)
+        return
+    await TrainingStream(websocket, session, service, config, compact=compact, payload_options=payload_options).serve()
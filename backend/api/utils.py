@@ -1,70 +1,188 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import AbstractSet, Any, Dict, Iterable, List, Mapping, Tuple
 
+import numpy as np
+
+from backend.api.deps import datasets
 from backend.core.datasets import make_or_dataset_pm1, make_xor_dataset_pm1
+from backend.core.sample_matrix import SampleMatrix
 from backend.nn.grid_mlp import reshape_template
 from backend.nn.mlp import MlpInternals
+from backend.services.trajectory import RunOptions
+
+MAX_RUN_STEPS = 10_000
+MAX_BOARD_SIDE = 512
+MAX_GRID_SIDE = 5
+MAX_LARGE_GRID_SIDE = 128
+# Per-request cap on samples x cells (32 MB as float64).
+MAX_REQUEST_CELLS = 4_000_000
+MAX_HIDDEN_DIM = 1024
+# Cap on hidden_dim x grid cells, the MLP hidden weight matrix (32 MB as float64).
+MAX_HIDDEN_WEIGHTS = 4_000_000
 
 
-def validate_grid_shape(rows: Any, cols: Any) -> Tuple[int, int]:
+def validate_grid_shape(rows: Any, cols: Any, max_side: int = MAX_GRID_SIDE) -> Tuple[int, int]:
     try:
         r = int(rows)
         c = int(cols)
     except (TypeError, ValueError) as exc:
         raise ValueError("grid_rows and grid_cols must be integers") from exc
-    if r < 1 or c < 1 or r > 5 or c > 5:
-        raise ValueError("grid_rows and grid_cols must be between 1 and 5")
+    if r < 1 or c < 1 or r > max_side or c > max_side:
+        raise ValueError(f"grid_rows and grid_cols must be between 1 and {max_side}")
     return r, c
 
 
+def grid_side_limit(body: Dict[str, Any]) -> int:
+    """Largest grid side a request may use: 5, or 128 with "large_grid": true."""
+    return MAX_LARGE_GRID_SIDE if body.get("large_grid") else MAX_GRID_SIDE
+
+
+def check_request_size(sample_count: int, dim: int, max_cells: int = MAX_REQUEST_CELLS) -> None:
+    if sample_count * dim > max_cells:
+        raise ValueError(f"dataset too large: {sample_count} samples x {dim} cells exceeds {max_cells} cells")
+
+
+def check_mlp_size(hidden_dim: int, rows: int, cols: int) -> None:
+    if not 1 <= hidden_dim <= MAX_HIDDEN_DIM:
+        raise ValueError(f"hidden_dim must be between 1 and {MAX_HIDDEN_DIM}")
+    if hidden_dim * rows * cols > MAX_HIDDEN_WEIGHTS:
+        raise ValueError(
+            f"model too large: {hidden_dim} hidden units x {rows * cols} cells exceeds {MAX_HIDDEN_WEIGHTS} weights"
+        )
+
+
+def _pm1_row(values: Any, length: int, length_error: str, value_error: str) -> np.ndarray:
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError(length_error)
+    row = np.asarray(values)
+    if row.dtype.kind not in "biuf" or row.shape != (length,) or not np.all((row == 1) | (row == -1)):
+        raise ValueError(value_error)
+    return row
+
+
 def normalize_samples(
     samples: Iterable[Dict[str, Any]],
     rows: int,
     cols: int,
-) -> List[Dict[str, Any]]:
-    normalized: List[Dict[str, Any]] = []
-    for sample in samples:
-        y = sample.get("y")
-        if y not in (-1, 1):
+) -> SampleMatrix:
+    """Validate API samples ({x} or {grid}, values in {-1, +1}) straight into a SampleMatrix.
+
+    Each sample is checked and converted row-wise with NumPy, so large grids
+    never pass through per-cell Python floats.
+    """
+    samples = list(samples)
+    dim = rows * cols
+    check_request_size(len(samples), dim)
+    X = np.empty((len(samples), dim), dtype=np.float64)
+    y: List[int] = []
+    for i, sample in enumerate(samples):
+        label = sample.get("y")
+        if label not in (-1, 1):
             raise ValueError("each sample y must be -1 or +1")
         grid = sample.get("grid")
         x = sample.get("x")
         if grid is not None:
             if not isinstance(grid, list) or len(grid) != rows:
                 raise ValueError("grid rows must match grid_rows")
-            flat: List[float] = []
-            for row in grid:
-                if not isinstance(row, list) or len(row) != cols:
-                    raise ValueError("grid cols must match grid_cols")
-                for cell in row:
-                    if cell not in (-1, 1):
-                        raise ValueError("grid values must be -1 or +1")
-                    flat.append(float(cell))
-            x = flat
-        if x is None:
+            for r, row in enumerate(grid):
+                X[i, r * cols:(r + 1) * cols] = _pm1_row(
+                    row, cols, "grid cols must match grid_cols", "grid values must be -1 or +1"
+                )
+        elif x is None:
             raise ValueError("each sample must include grid or x")
-        if not isinstance(x, list) or len(x) != rows * cols:
-            raise ValueError("x length must match grid_rows * grid_cols")
-        for cell in x:
-            if cell not in (-1, 1):
-                raise ValueError("x values must be -1 or +1")
-        normalized.append({"x": [float(val) for val in x], "y": int(y)})
-    if not normalized:
+        else:
+            X[i] = _pm1_row(x, dim, "x length must match grid_rows * grid_cols", "x values must be -1 or +1")
+        y.append(int(label))
+    if not y:
         raise ValueError("samples must be non-empty")
-    return normalized
+    return SampleMatrix(X, y, grid_shape=(rows, cols))
+
+
+def requested_dataset(body: Dict[str, Any], default: str | None = None) -> str | None:
+    """Dataset name a request asks for; a dataset_id always means "custom"."""
+    dataset = body.get("dataset", default)
+    if "dataset_id" in body:
+        if "dataset" in body and dataset != "custom":
+            raise ValueError("dataset_id requires dataset 'custom'")
+        return "custom"
+    return dataset
+
+
+def has_custom_payload(body: Dict[str, Any]) -> bool:
+    return "dataset_id" in body or (body.get("dataset") == "custom" and "samples" in body)
 
 
-def load_samples_from_body(body: Dict[str, Any]) -> Tuple[str, List[Dict[str, Any]], Tuple[int, int]]:
-    dataset = body.get("dataset", "or")
+def custom_samples_from_body(body: Dict[str, Any]) -> Tuple[SampleMatrix, Tuple[int, int]]:
+    """Custom samples from an uploaded dataset_id, or inline grid_rows/grid_cols/samples."""
+    dataset_id = body.get("dataset_id")
+    if dataset_id is not None:
+        try:
+            entry = datasets.get(str(dataset_id))
+        except KeyError as exc:
+            raise ValueError(f"unknown dataset_id: {dataset_id}") from exc
+        return entry.to_matrix(), entry.grid_shape
+    rows, cols = validate_grid_shape(body.get("grid_rows"), body.get("grid_cols"), grid_side_limit(body))
+    return normalize_samples(body.get("samples", []), rows, cols), (rows, cols)
+
+
+def parse_board(board: Any, max_side: int = MAX_BOARD_SIDE) -> np.ndarray:
+    """Validate a rectangular numeric board (list of rows) and return it as a float matrix."""
+    if not isinstance(board, list) or not board or not all(isinstance(row, list) for row in board):
+        raise ValueError("board must be a non-empty list of rows")
+    width = len(board[0])
+    if width == 0 or any(len(row) != width for row in board):
+        raise ValueError("board rows must all have the same non-zero length")
+    if len(board) > max_side or width > max_side:
+        raise ValueError(f"board must be at most {max_side}x{max_side}")
+    try:
+        grid = np.asarray(board, dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("board values must be numeric") from exc
+    if not np.all(np.isfinite(grid)):
+        raise ValueError("board values must be finite")
+    return grid
+
+
+def parse_bool(body: Mapping[str, Any], key: str, default: bool = False) -> bool:
+    """body[key] as a JSON boolean (default when absent or null); strings like "false" are rejected."""
+    value = body.get(key)
+    if value is None:
+        return default
+    if not isinstance(value, bool):
+        raise ValueError(f"{key} must be true or false")
+    return value
+
+
+def parse_run_options(body: Dict[str, Any]) -> RunOptions | None:
+    """Read n / until_converged / stride / tol; None means a plain single step."""
+    until_converged = parse_bool(body, "until_converged")
+    if "n" not in body and not until_converged:
+        return None
+    try:
+        n = int(body.get("n", MAX_RUN_STEPS))
+        stride = int(body.get("stride", 1))
+        tol = float(body["tol"]) if body.get("tol") is not None else None
+    except (TypeError, ValueError) as exc:
+        raise ValueError("n, stride, and tol must be numeric") from exc
+    if n < 1 or n > MAX_RUN_STEPS:
+        raise ValueError(f"n must be between 1 and {MAX_RUN_STEPS}")
+    if stride < 1:
+        raise ValueError("stride must be positive")
+    if tol is not None and tol < 0:
+        raise ValueError("tol must be non-negative")
+    return RunOptions(n=n, stride=stride, until_converged=until_converged, tol=tol)
+
+
+def load_samples_from_body(body: Dict[str, Any]) -> Tuple[str, SampleMatrix, Tuple[int, int]]:
+    dataset = requested_dataset(body, "or")
     if dataset == "or":
         return "or", make_or_dataset_pm1(), (1, 2)
     if dataset == "xor":
         return "xor", make_xor_dataset_pm1(), (1, 2)
     if dataset == "custom":
-        rows, cols = validate_grid_shape(body.get("grid_rows"), body.get("grid_cols"))
-        samples = normalize_samples(body.get("samples", []), rows, cols)
-        return "custom", samples, (rows, cols)
+        samples, grid_shape = custom_samples_from_body(body)
+        return "custom", samples, grid_shape
     raise ValueError("dataset must be 'or', 'xor', or 'custom'")
 
 
@@ -76,11 +194,14 @@ def build_mlp_payload(
     sample_index: int,
     sample_count: int,
     dataset: str,
+    fields: AbstractSet[str] | None = None,
 ) -> Dict[str, Any]:
-    templates_before = [reshape_template(row, rows, cols) for row in internals.hidden_W_before]
-    templates_after = [reshape_template(row, rows, cols) for row in internals.hidden_W_after]
-    gradient_templates = [reshape_template(row, rows, cols) for row in internals.grad_hidden_W]
-    return {
+    """Step record; fields (see MLP_FIELDS, None = all) picks which of
+    internals, gradients, and templates are built."""
+    want_internals = fields is None or "internals" in fields
+    want_gradients = fields is None or "gradients" in fields
+    want_templates = fields is None or "templates" in fields
+    payload: Dict[str, Any] = {
         "dataset": dataset,
         "grid_rows": rows,
         "grid_cols": cols,
@@ -92,29 +213,42 @@ def build_mlp_payload(
         "y01": internals.y01,
         "loss": internals.loss,
         "p_hat": internals.output_a,
-        "hidden": {
-            "weights_before": internals.hidden_W_before,
-            "bias_before": internals.hidden_b_before,
-            "weights_after": internals.hidden_W_after,
-            "bias_after": internals.hidden_b_after,
-            "z": internals.hidden_z,
-            "a": internals.hidden_a,
-            "templates_before": templates_before,
-            "templates_after": templates_after,
-        },
-        "output": {
+    }
+    hidden: Dict[str, Any] = {}
+    if want_internals:
+        hidden.update(
+            weights_before=internals.hidden_W_before,
+            bias_before=internals.hidden_b_before,
+            weights_after=internals.hidden_W_after,
+            bias_after=internals.hidden_b_after,
+            z=internals.hidden_z,
+            a=internals.hidden_a,
+        )
+    if want_templates:
+        before = hidden.get("weights_before") or internals.hidden_W_before
+        hidden["templates_before"] = [reshape_template(row, rows, cols) for row in before]
+        hidden["templates_after"] = [reshape_template(row, rows, cols) for row in internals.hidden_W_after]
+    if hidden:
+        payload["hidden"] = hidden
+    if want_internals:
+        payload["output"] = {
             "weights_before": internals.out_W_before,
             "bias_before": internals.out_b_before,
             "weights_after": internals.out_W_after,
             "bias_after": internals.out_b_after,
             "z": internals.output_z,
             "a": internals.output_a,
-        },
-        "gradients": {
-            "hidden_W": internals.grad_hidden_W,
-            "hidden_b": internals.grad_hidden_b,
-            "out_W": internals.grad_out_W,
-            "out_b": internals.grad_out_b,
-            "templates": gradient_templates,
-        },
-    }
+        }
+    gradients: Dict[str, Any] = {}
+    if want_gradients:
+        gradients.update(
+            hidden_W=internals.grad_hidden_W,
+            hidden_b=internals.grad_hidden_b,
+            out_W=internals.grad_out_W,
+            out_b=internals.grad_out_b,
+        )
+    if want_templates:
+        gradients["templates"] = [reshape_template(row, rows, cols) for row in internals.grad_hidden_W]
+    if gradients:
+        payload["gradients"] = gradients
+    return payload
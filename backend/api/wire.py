@@ -0,0 +1,249 @@
+"""Response encodings chosen by the Accept header.
+
+- application/json (default): compact JSON, via orjson when it is
+  installed. "application/json; precision=4" (or ?precision=4) rounds
+  every float to that many decimals, which shrinks weight-heavy payloads
+  considerably.
+- application/x-perceptron-frame: numeric arrays are sent as raw
+  little-endian buffers (float32, int32 for integer data, one byte per
+  value for booleans) next to a small JSON header that holds everything
+  else:
+
+      b"PVLF" | u8 version (1) | 3 pad bytes | u32 header length
+      | header JSON | zero pad to 8 | buffers (each 8-byte aligned)
+
+  The header is {"payload": ..., "arrays": [{dtype, shape, offset,
+  nbytes}, ...]}; inside payload each array is replaced by
+  {"__array__": i}, offsets are relative to the first buffer. An array
+  whose values were converted (float64 rounded to float32, int64 narrowed
+  to int32) also carries "source_dtype", the dtype before conversion.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+import json
+import struct
+
+import numpy as np
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+FRAME_MEDIA_TYPE = "application/x-perceptron-frame"
+FRAME_MAGIC = b"PVLF"
+FRAME_VERSION = 1
+MAX_PRECISION = 15
+# Shorter numeric lists stay inline in the frame header.
+MIN_FRAME_ARRAY = 8
+_INT32 = np.iinfo(np.int32)
+
+
+@dataclass(frozen=True)
+class WireFormat:
+    """A negotiated encoding; picklable, so workers can encode too."""
+
+    media_type: str = JSON_MEDIA_TYPE
+    precision: int | None = None
+
+    @property
+    def token(self) -> str:
+        """Distinguishes representations of one resource (cache keys, ETags)."""
+        if self.media_type == FRAME_MEDIA_TYPE:
+            return "frame"
+        return "json" if self.precision is None else f"json;p={self.precision}"
+
+    def encode(self, payload: Any) -> bytes:
+        if self.media_type == FRAME_MEDIA_TYPE:
+            return encode_frame(payload)
+        return encode_json(payload, self.precision)
+
+
+class Wire:
+    """Per-request encoder: builds the final response, keeping headers and
+    cookies that other dependencies (e.g. the session) set on FastAPI's
+    shared response object."""
+
+    def __init__(self, wire_format: WireFormat, base: Response) -> None:
+        self.format = wire_format
+        self._base = base
+
+    def response(self, payload: Any) -> Response:
+        return self.content_response(self.format.encode(payload))
+
+    def content_response(self, content: bytes) -> Response:
+        return self._with_base_headers(
+            Response(content=content, media_type=self.format.media_type, headers={"Vary": "Accept"})
+        )
+
+    def stream_response(self, chunks: Iterable[bytes], media_type: str) -> StreamingResponse:
+        """Chunks sent as they are produced (sync iterables run in the threadpool)."""
+        return self._with_base_headers(StreamingResponse(chunks, media_type=media_type, headers={"Vary": "Accept"}))
+
+    def _with_base_headers(self, response: Response) -> Response:
+        for name, value in self._base.raw_headers:
+            if name not in (b"content-length", b"content-type"):
+                response.raw_headers.append((name, value))
+        return response
+
+
+def render(wire: WireFormat, fn: Callable[..., Any], *args: Any) -> bytes:
+    """fn(*args) encoded as wire; run on the CPU pool so big payloads are encoded off the event loop."""
+    return wire.encode(fn(*args))
+
+
+def _parse_precision(value: str) -> int:
+    try:
+        precision = int(value)
+    except ValueError as exc:
+        raise ValueError("precision must be an integer") from exc
+    if not 0 <= precision <= MAX_PRECISION:
+        raise ValueError(f"precision must be between 0 and {MAX_PRECISION}")
+    return precision
+
+
+def parse_accept(accept: str | None, precision: str | None = None) -> WireFormat:
+    """Pick the first supported media type in Accept (order, not q-values); JSON otherwise."""
+    chosen: Tuple[str, Dict[str, str]] | None = None
+    for item in (accept or "").split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        if media_type.lower() in (FRAME_MEDIA_TYPE, JSON_MEDIA_TYPE):
+            options = dict(p.split("=", 1) for p in params if "=" in p)
+            chosen = (media_type.lower(), {k.strip().lower(): v.strip() for k, v in options.items()})
+            break
+    if chosen is not None and chosen[0] == FRAME_MEDIA_TYPE:
+        return WireFormat(FRAME_MEDIA_TYPE)
+    value = precision if precision is not None else (chosen[1].get("precision") if chosen else None)
+    return WireFormat(JSON_MEDIA_TYPE, None if value is None else _parse_precision(value))
+
+
+def get_wire(request: Request, response: Response) -> Wire:
+    """FastAPI dependency: the response encoding this request asked for."""
+    try:
+        wire_format = parse_accept(request.headers.get("accept"), request.query_params.get("precision"))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return Wire(wire_format, response)
+
+
+def _numeric_array(value: list) -> np.ndarray | None:
+    """value as an ndarray if it is a non-empty rectangular list of numbers, else None."""
+    if not value or isinstance(value[0], (dict, str)) or value[0] is None:
+        return None
+    try:
+        array = np.asarray(value)
+    except ValueError:  # ragged
+        return None
+    if array.dtype.kind not in "biuf":
+        return None
+    return array
+
+
+def _walk(value: Any, on_array, on_float) -> Any:
+    if isinstance(value, dict):
+        return {key: _walk(item, on_array, on_float) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        array = _numeric_array(list(value))
+        if array is not None:
+            return on_array(array, value)
+        return [_walk(item, on_array, on_float) for item in value]
+    if isinstance(value, np.ndarray):
+        return on_array(value, value)
+    if isinstance(value, (float, np.floating)):
+        return on_float(float(value))
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def round_floats(payload: Any, precision: int) -> Any:
+    """payload with every float rounded to precision decimals (ints and structure untouched)."""
+
+    def on_array(array: np.ndarray, original: Any) -> Any:
+        if array.dtype.kind != "f":
+            return original
+        return np.round(array, precision).tolist()
+
+    return _walk(payload, on_array, lambda x: round(x, precision))
+
+
+def encode_json(payload: Any, precision: int | None = None) -> bytes:
+    if precision is not None:
+        payload = round_floats(payload, precision)
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, separators=(",", ":"), allow_nan=False, default=_json_default).encode()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _frame_dtype(array: np.ndarray) -> np.dtype:
+    if array.dtype.kind == "b":
+        return np.dtype(bool)
+    if array.dtype.kind in "iu" and (array.size == 0 or (array.min() >= _INT32.min and array.max() <= _INT32.max)):
+        return np.dtype("<i4")
+    return np.dtype("<f4")
+
+
+def encode_frame(payload: Any) -> bytes:
+    buffers: List[bytes] = []
+    arrays: List[Dict[str, Any]] = []
+    offset = 0
+
+    def on_array(array: np.ndarray, original: Any) -> Any:
+        nonlocal offset
+        if array.size < MIN_FRAME_ARRAY:
+            return array.tolist()
+        dtype = _frame_dtype(array)
+        data = np.ascontiguousarray(array, dtype=dtype).tobytes()
+        meta = {"dtype": dtype.name, "shape": list(array.shape), "offset": offset, "nbytes": len(data)}
+        if array.dtype != dtype:
+            meta["source_dtype"] = array.dtype.name
+        arrays.append(meta)
+        pad = -len(data) % 8
+        buffers.append(data + b"\0" * pad)
+        offset += len(data) + pad
+        return {"__array__": len(arrays) - 1}
+
+    body = _walk(payload, on_array, lambda x: x)
+    header = json.dumps({"payload": body, "arrays": arrays}, separators=(",", ":"), allow_nan=False).encode()
+    prefix = FRAME_MAGIC + struct.pack("<B3xI", FRAME_VERSION, len(header))
+    header += b"\0" * (-(len(prefix) + len(header)) % 8)
+    return b"".join([prefix, header, *buffers])
+
+
+def decode_frame(data: bytes) -> Any:
+    """Inverse of encode_frame (arrays come back as nested lists); used by tests and Python clients."""
+    if data[:4] != FRAME_MAGIC:
+        raise ValueError("not a perceptron frame")
+    version, header_len = struct.unpack_from("<B3xI", data, 4)
+    if version != FRAME_VERSION:
+        raise ValueError(f"unsupported frame version {version}")
+    start = 12
+    header = json.loads(data[start:start + header_len])
+    base = start + header_len + (-(start + header_len) % 8)
+
+    def restore(value: Any) -> Any:
+        if isinstance(value, dict):
+            if set(value) == {"__array__"}:
+                meta = header["arrays"][value["__array__"]]
+                array = np.frombuffer(data, dtype=meta["dtype"], count=int(np.prod(meta["shape"])), offset=base + meta["offset"])
+                return array.reshape(meta["shape"]).tolist()
+            return {key: restore(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [restore(item) for item in value]
+        return value
+
+    return restore(header["payload"])
@@ -2,24 +2,39 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.api import diagnostics_router, lms_router, mlp_router, perceptron_router
+from backend.api import dataset_router, diagnostics_router, job_router, lms_router, mlp_router, perceptron_router
+from backend.api.deps import SESSION_HEADER, cpu_pool, jobs
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    jobs.shutdown()
+    cpu_pool.executor.shutdown()
+
 
-app = FastAPI(title="Perceptron Visual Lab API")
+app = FastAPI(title="Perceptron Visual Lab API", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[SESSION_HEADER],
 )
 
 app.include_router(perceptron_router)
 app.include_router(diagnostics_router)
 app.include_router(lms_router)
 app.include_router(mlp_router)
+app.include_router(dataset_router)
+app.include_router(job_router)
 
 
 def run(host: str = "127.0.0.1", port: int = 8000) -> None:
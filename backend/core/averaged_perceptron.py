@@ -0,0 +1,65 @@
+"""Averaged perceptron with lazy (timestamped) averaging."""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+from backend.core.perceptron import Perceptron, StepResult, _dot
+
+
+class AveragedPerceptron(Perceptron):
+    """Perceptron that predicts with the mean of its weights over every step.
+
+    Training updates w exactly like Perceptron. Alongside, each mistake adds
+    c * delta to an accumulator u, where c counts the steps seen so far; the
+    average over all c states (initial weights included) is then w - u / c.
+    So averaging costs O(dim) per mistake and O(1) per correct step, and the
+    averaged vector is only materialized when predicting, once per step
+    count.
+
+    predict_score keeps returning the live score (train_step relies on it);
+    predict_label and averaged_score use the averaged weights.
+    """
+
+    def __init__(self, dim: int, lr: float = 1.0, seed: int | None = None, init: str = "zeros") -> None:
+        super().__init__(dim, lr=lr, seed=seed, init=init)
+        self._u = [0.0 for _ in range(dim)]
+        self._ub = 0.0
+        self._c = 1
+        self._avg: Tuple[List[float], float] | None = None
+        self._avg_at = 0
+
+    @property
+    def steps(self) -> int:
+        return self._c - 1
+
+    def train_step(self, x: Sequence[float], y: int, lr: float | None = None) -> StepResult:
+        result = super().train_step(x, y, lr=lr)
+        if result.mistake:
+            c = self._c
+            u = self._u
+            for i, delta in enumerate(result.delta_w):
+                u[i] += c * delta
+            self._ub += c * result.delta_b
+        else:
+            self.version += 1  # the average moves on every step, mistake or not
+        self._c += 1
+        return result
+
+    def averaged_weights(self) -> Tuple[List[float], float]:
+        """(w_avg, b_avg), recomputed only when steps were taken since the last call."""
+        if self._avg is None or self._avg_at != self._c:
+            inv = 1.0 / self._c
+            w_avg = [wi - ui * inv for wi, ui in zip(self.w, self._u)]
+            self._avg = (w_avg, self.b - self._ub * inv)
+            self._avg_at = self._c
+        return self._avg
+
+    def averaged_score(self, x: Sequence[float]) -> float:
+        if len(x) != self.dim:
+            raise ValueError("x has wrong dimension")
+        w_avg, b_avg = self.averaged_weights()
+        return _dot(w_avg, x) + b_avg
+
+    def predict_label(self, x: Sequence[float]) -> int:
+        return 1 if self.averaged_score(x) >= 0 else -1
@@ -0,0 +1,122 @@
+"""Bit-packed {-1, +1} inputs and bitwise scoring.
+
+Inputs are packed one bit per feature (+1 -> 1, -1 -> 0) with np.packbits,
+the same layout PackedShapeDataset stores, and padded to whole 64-bit
+words. For x in {-1, +1}:
+
+    w . x = 2 * sum(w_i for x_i = +1) - sum(w)
+
+so scoring only needs the sum of weights over set bits:
+
+- integer weights (lr=1 from zero init keeps them integral): split
+  w - min(w) into bit planes and count AND-ed bits per plane, i.e. pure
+  AND/popcount on words; for weights in {-1, +1} this reduces to the
+  classic dim - 2 * popcount(w XOR x);
+- real weights: a sign-masked sum, done as one 256-entry lookup table per
+  input byte holding the sum of that byte's weights for every bit pattern.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+_WORD_BYTES = 8
+_BYTE_POPCOUNT = np.array([bin(v).count("1") for v in range(256)], dtype=np.uint8)
+# Bit j (MSB first, as np.packbits writes it) of every byte value.
+_BYTE_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).astype(np.float64)
+
+
+def is_pm1(X: np.ndarray | Sequence[Sequence[float]]) -> bool:
+    values = np.asarray(X)
+    return bool(np.all((values == 1) | (values == -1)))
+
+
+def pack_pm1(X: np.ndarray | Sequence[Sequence[float]]) -> np.ndarray:
+    """Pack an (n, dim) {-1, +1} matrix into (n, words) uint64, one bit per feature."""
+    values = np.asarray(X)
+    if values.ndim == 1:
+        values = values[None, :]
+    if values.ndim != 2:
+        raise ValueError("X must be a 2D matrix")
+    if not is_pm1(values):
+        raise ValueError("binary packing requires inputs in {-1, +1}")
+    return bytes_to_words(np.packbits(values > 0, axis=1))
+
+
+def bytes_to_words(bits: np.ndarray) -> np.ndarray:
+    """View packbits output (n, nbytes) uint8 as (n, words) uint64, zero-padding the tail."""
+    bits = np.asarray(bits, dtype=np.uint8)
+    pad = -bits.shape[1] % _WORD_BYTES
+    if pad:
+        bits = np.pad(bits, ((0, 0), (0, pad)))
+    return np.ascontiguousarray(bits).view(np.uint64)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits per row of a uint64 word matrix."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _BYTE_POPCOUNT[words.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+class BinaryScorer:
+    """Scores packed {-1, +1} inputs against fixed weights (w, b).
+
+    mode is "popcount" when every weight is an integer, else "table".
+    """
+
+    def __init__(self, w: Sequence[float] | np.ndarray, b: float = 0.0) -> None:
+        w = np.asarray(w, dtype=np.float64).reshape(-1)
+        if w.size == 0:
+            raise ValueError("w must be non-empty")
+        self.dim = w.size
+        self.b = float(b)
+        self.words = -(-self.dim // (8 * _WORD_BYTES))
+        self._w_sum = float(w.sum())
+        if np.all(w == np.round(w)) and np.all(np.abs(w) < 2**31):
+            self.mode = "popcount"
+            self._build_planes(w.astype(np.int64))
+        else:
+            self.mode = "table"
+            self._build_table(w)
+
+    def _build_planes(self, w: np.ndarray) -> None:
+        self._offset = int(w.min())
+        shifted = (w - self._offset).astype(np.uint64)
+        depth = int(shifted.max()).bit_length()
+        planes = [(shifted >> np.uint64(k)) & np.uint64(1) for k in range(depth)]
+        self._planes = (
+            bytes_to_words(np.packbits(np.stack(planes).astype(bool), axis=1))
+            if planes
+            else np.zeros((0, self.words), dtype=np.uint64)
+        )
+
+    def _build_table(self, w: np.ndarray) -> None:
+        nbytes = -(-self.dim // 8)
+        padded = np.zeros(nbytes * 8, dtype=np.float64)
+        padded[: self.dim] = w
+        # table[j, v] = sum of the weights of byte j whose bits are set in v
+        self._table = padded.reshape(nbytes, 8) @ _BYTE_BITS.T
+        self._byte_index = np.arange(nbytes)
+
+    def positive_sums(self, words: np.ndarray) -> np.ndarray:
+        """sum(w_i for x_i = +1) for every packed row."""
+        words = np.ascontiguousarray(np.atleast_2d(words))
+        if words.shape[1] != self.words:
+            raise ValueError("packed rows do not match weight dimension")
+        if self.mode == "popcount":
+            total = self._offset * popcount(words)
+            for k, plane in enumerate(self._planes):
+                total += popcount(words & plane) << k
+            return total.astype(np.float64)
+        nbytes = self._table.shape[0]
+        as_bytes = words.view(np.uint8)[:, :nbytes]
+        return self._table[self._byte_index, as_bytes].sum(axis=1)
+
+    def scores(self, words: np.ndarray) -> np.ndarray:
+        return 2.0 * self.positive_sums(words) - self._w_sum + self.b
+
+    def predict_labels(self, words: np.ndarray) -> np.ndarray:
+        return np.where(self.scores(words) >= 0, 1, -1).astype(np.int8)
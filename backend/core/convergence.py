@@ -0,0 +1,85 @@
+"""Early stopping for epoch-based perceptron training."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Dict, Sequence
+
+import numpy as np
+
+CONVERGED = "converged"
+CYCLE = "cycle"
+MAX_EPOCHS = "max_epochs"
+
+
+def state_key(w: Sequence[float] | np.ndarray, b: float) -> bytes:
+    """16-byte digest of (w, b); -0.0 and 0.0 hash the same."""
+    state = np.append(np.asarray(w, dtype=np.float64), float(b)) + 0.0
+    return blake2b(state.tobytes(), digest_size=16).digest()
+
+
+@dataclass
+class FitResult:
+    mistakes: list
+    stop_reason: str
+    stop_epoch: int
+    cycle_start: int | None = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "mistakes": self.mistakes,
+            "stop_reason": self.stop_reason,
+            "stop_epoch": self.stop_epoch,
+            "cycle_start": self.cycle_start,
+        }
+
+
+class EarlyStopper:
+    """Decides after each epoch whether more epochs can change anything.
+
+    A mistake-free epoch means converged. A (w, b) seen at the end of an
+    earlier epoch means cycling: on separable data every update strictly
+    increases w . w* (for any separating w*), so a state can never recur
+    once a mistake has been made, whatever the shuffle order. A repeat is
+    therefore proof of non-separable data, not just a heuristic.
+    """
+
+    def __init__(self, w: Sequence[float] | np.ndarray, b: float, detect_cycles: bool = True) -> None:
+        self.detect_cycles = detect_cycles
+        self.reason: str | None = None
+        self.epoch = 0
+        self.cycle_start: int | None = None
+        self._seen: Dict[bytes, int] = {}
+        if detect_cycles:
+            self._seen[state_key(w, b)] = 0
+
+    def update(self, mistakes: int, w: Sequence[float] | np.ndarray, b: float) -> bool:
+        """Record one finished epoch; return True when training should stop.
+
+        Once a stop is reported, further calls keep returning True without
+        changing the reason or stop epoch.
+        """
+        if self.reason is not None:
+            return True
+        self.epoch += 1
+        if mistakes == 0:
+            self.reason = CONVERGED
+            return True
+        if self.detect_cycles:
+            key = state_key(w, b)
+            first = self._seen.get(key)
+            if first is not None:
+                self.reason = CYCLE
+                self.cycle_start = first
+                return True
+            self._seen[key] = self.epoch
+        return False
+
+    def result(self, mistakes: list) -> FitResult:
+        return FitResult(
+            mistakes=mistakes,
+            stop_reason=self.reason or MAX_EPOCHS,
+            stop_epoch=self.epoch,
+            cycle_start=self.cycle_start,
+        )
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence, Tuple
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
-
-Sample = dict
+from backend.core.sample_matrix import Sample, SampleMatrix
 
 
 def _pm1(val: int) -> int:
@@ -16,7 +15,11 @@ def _flatten(grid: Sequence[Sequence[int]]) -> List[int]:
     return [cell for row in grid for cell in row]
 
 
-def make_or_dataset_pm1() -> List[Sample]:
+def _logic_matrix(data: Sequence[Tuple[List[int], int]]) -> SampleMatrix:
+    return SampleMatrix(X=[x for x, _ in data], y=[y for _, y in data], grid_shape=(1, 2))
+
+
+def make_or_dataset_pm1() -> SampleMatrix:
     # Inputs are in {-1, +1}. OR is positive if any input is +1.
     data = [
         ([-1, 1], 1),
@@ -24,10 +27,10 @@ def make_or_dataset_pm1() -> List[Sample]:
         ([1, 1], 1),
         ([-1, -1], -1),
     ]
-    return [{"x": x, "y": y} for x, y in data]
+    return _logic_matrix(data)
 
 
-def make_and_dataset_pm1() -> List[Sample]:
+def make_and_dataset_pm1() -> SampleMatrix:
     # AND is positive only if both inputs are +1.
     data = [
         ([-1, 1], -1),
@@ -35,10 +38,10 @@ def make_and_dataset_pm1() -> List[Sample]:
         ([1, 1], 1),
         ([-1, -1], -1),
     ]
-    return [{"x": x, "y": y} for x, y in data]
+    return _logic_matrix(data)
 
 
-def make_xor_dataset_pm1() -> List[Sample]:
+def make_xor_dataset_pm1() -> SampleMatrix:
     # XOR is positive if exactly one input is +1.
     data = [
         ([-1, 1], 1),
@@ -46,7 +49,36 @@ def make_xor_dataset_pm1() -> List[Sample]:
         ([1, 1], -1),
         ([-1, -1], -1),
     ]
-    return [{"x": x, "y": y} for x, y in data]
+    return _logic_matrix(data)
+
+
+def _check_shape_fits(shape_mask: Sequence[Sequence[int]], board_h: int, board_w: int) -> Tuple[int, int]:
+    shape_h = len(shape_mask)
+    shape_w = len(shape_mask[0]) if shape_h > 0 else 0
+    if shape_h == 0 or shape_w == 0:
+        raise ValueError("shape_mask must be non-empty")
+    if board_h < shape_h or board_w < shape_w:
+        raise ValueError("board must be at least as large as shape")
+    return shape_h, shape_w
+
+
+def iter_translations(
+    shape_mask: Sequence[Sequence[int]],
+    board_h: int,
+    board_w: int,
+) -> Iterator[Tuple[List[List[int]], Tuple[int, int]]]:
+    """Yield (grid, (top, left)) for each valid translation, one board at a time.
+
+    Same boards and order as generate_translations, without holding them all.
+    """
+    shape_h, shape_w = _check_shape_fits(shape_mask, board_h, board_w)
+    on_cells = [(r, c) for r in range(shape_h) for c in range(shape_w) if _pm1(shape_mask[r][c]) == 1]
+    for top in range(board_h - shape_h + 1):
+        for left in range(board_w - shape_w + 1):
+            grid = [[-1] * board_w for _ in range(board_h)]
+            for r, c in on_cells:
+                grid[top + r][left + c] = 1
+            yield grid, (top, left)
 
 
 def generate_translations(
@@ -59,23 +91,26 @@ def generate_translations(
     Cells belonging to the shape are +1, empty cells are -1.
     Returns list of (grid, (top, left)).
     """
-    shape_h = len(shape_mask)
-    shape_w = len(shape_mask[0]) if shape_h > 0 else 0
-    if shape_h == 0 or shape_w == 0:
-        raise ValueError("shape_mask must be non-empty")
-    if board_h < shape_h or board_w < shape_w:
-        raise ValueError("board must be at least as large as shape")
+    return list(iter_translations(shape_mask, board_h, board_w))
 
-    positions: List[Tuple[List[List[int]], Tuple[int, int]]] = []
-    for top in range(board_h - shape_h + 1):
-        for left in range(board_w - shape_w + 1):
-            grid = [[-1 for _ in range(board_w)] for _ in range(board_h)]
-            for r in range(shape_h):
-                for c in range(shape_w):
-                    if _pm1(shape_mask[r][c]) == 1:
-                        grid[top + r][left + c] = 1
-            positions.append((grid, (top, left)))
-    return positions
+
+def iter_shape_samples(
+    good_mask: Sequence[Sequence[int]],
+    bad_mask: Sequence[Sequence[int]],
+    board_size: Tuple[int, int],
+    translations: bool = True,
+) -> Iterator[Sample]:
+    """Lazily yield the samples of make_shape_dataset, in the same order."""
+    board_h, board_w = board_size
+    for mask, label in ((good_mask, 1), (bad_mask, -1)):
+        if translations:
+            for grid, pos in iter_translations(mask, board_h, board_w):
+                yield {"x": _flatten(grid), "y": label, "grid": grid, "pos": pos}
+        else:
+            if len(mask) != board_h or len(mask[0]) != board_w:
+                raise ValueError("mask must match board size when translations=False")
+            grid = [[_pm1(cell) for cell in row] for row in mask]
+            yield {"x": _flatten(grid), "y": label, "grid": grid, "pos": (0, 0)}
 
 
 def make_shape_dataset(
@@ -83,28 +118,14 @@ def make_shape_dataset(
     bad_mask: Sequence[Sequence[int]],
     board_size: Tuple[int, int],
     translations: bool = True,
-) -> List[Sample]:
+) -> SampleMatrix:
     """Create a dataset of good vs bad shapes on a grid.
 
-    Each sample includes:
+    Each sample (dict view of the returned SampleMatrix) includes:
     - x: flattened grid in {-1, +1}
     - y: label (+1 for good, -1 for bad)
     - grid: 2D grid for visualization
     - pos: (top, left) if translations are used
     """
-    board_h, board_w = board_size
-    samples: List[Sample] = []
-
-    def _add(mask: Sequence[Sequence[int]], label: int) -> None:
-        if translations:
-            for grid, pos in generate_translations(mask, board_h, board_w):
-                samples.append({"x": _flatten(grid), "y": label, "grid": grid, "pos": pos})
-        else:
-            if len(mask) != board_h or len(mask[0]) != board_w:
-                raise ValueError("mask must match board size when translations=False")
-            grid = [[_pm1(cell) for cell in row] for row in mask]
-            samples.append({"x": _flatten(grid), "y": label, "grid": grid, "pos": (0, 0)})
-
-    _add(good_mask, 1)
-    _add(bad_mask, -1)
-    return samples
+    samples = iter_shape_samples(good_mask, bad_mask, board_size, translations=translations)
+    return SampleMatrix.from_samples(samples, grid_shape=board_size)
@@ -0,0 +1,211 @@
+"""Dual (kernel) perceptron with an LRU-bounded Gram-matrix cache."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+import random
+
+import numpy as np
+
+from backend.core.sample_matrix import SampleMatrix
+
+KERNELS = ("rbf", "poly")
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class KernelSpec:
+    """rbf: exp(-gamma * |a - b|^2); poly: (gamma * a.b + coef0) ** degree."""
+
+    name: str = "rbf"
+    gamma: float = 1.0
+    degree: int = 2
+    coef0: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.name not in KERNELS:
+            raise ValueError("kernel must be 'rbf' or 'poly'")
+        if self.gamma <= 0:
+            raise ValueError("gamma must be positive")
+        if self.degree < 1:
+            raise ValueError("degree must be at least 1")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "KernelSpec":
+        try:
+            gamma = float(data.get("gamma", 1.0))
+            degree = int(data.get("degree", 2))
+            coef0 = float(data.get("coef0", 1.0))
+        except (TypeError, ValueError) as exc:
+            raise ValueError("gamma, degree, and coef0 must be numeric") from exc
+        return cls(name=str(data.get("name", "rbf")), gamma=gamma, degree=degree, coef0=coef0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "gamma": self.gamma, "degree": self.degree, "coef0": self.coef0}
+
+    def matrix(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
+        """Kernel values between every row of A and every row of B."""
+        if self.name == "poly":
+            return (self.gamma * (A @ B.T) + self.coef0) ** self.degree
+        sq = (A * A).sum(axis=1)[:, None] + (B * B).sum(axis=1)[None, :] - 2.0 * (A @ B.T)
+        return np.exp(-self.gamma * np.maximum(sq, 0.0))
+
+
+class GramCache:
+    """Rows of the training Gram matrix, computed on first use and kept LRU.
+
+    At most max_rows rows (n floats each) are held, so memory stays bounded
+    for large custom datasets while repeated epochs over a working set hit
+    the cache.
+    """
+
+    def __init__(self, X: np.ndarray, spec: KernelSpec, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.X = X
+        self.spec = spec
+        self.max_rows = max(1, min(len(X), max_bytes // max(1, X.shape[0] * 8)))
+        self._rows: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(row.nbytes for row in self._rows.values())
+
+    def row(self, index: int) -> np.ndarray:
+        row = self._rows.get(index)
+        if row is not None:
+            self.hits += 1
+            self._rows.move_to_end(index)
+            return row
+        self.misses += 1
+        row = self.spec.matrix(self.X[index:index + 1], self.X)[0]
+        self._rows[index] = row
+        if len(self._rows) > self.max_rows:
+            self._rows.popitem(last=False)
+        return row
+
+    def stats(self) -> Dict[str, int]:
+        return {"rows": len(self), "max_rows": self.max_rows, "hits": self.hits, "misses": self.misses}
+
+
+@dataclass
+class KernelStepResult:
+    score: float
+    pred: int
+    mistake: bool
+    delta_alpha: float
+    delta_b: float
+
+
+class KernelPerceptron:
+    """Perceptron in dual form: f(x) = sum_j alpha_j y_j k(x_j, x) + b.
+
+    The model is tied to its training set; alpha_j grows by lr each time
+    sample j is misclassified. With an rbf or poly kernel it separates XOR.
+    """
+
+    def __init__(
+        self,
+        samples: Iterable[dict],
+        kernel: KernelSpec | None = None,
+        lr: float = 1.0,
+        seed: int | None = None,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ) -> None:
+        matrix = SampleMatrix.from_samples(samples)
+        self.X = matrix.X
+        self.y = matrix.y_float
+        self.dim = matrix.dim
+        self.kernel = kernel or KernelSpec()
+        self.lr = lr
+        self.alpha = np.zeros(len(self.y), dtype=np.float64)
+        self.b = 0.0
+        self._rng = random.Random(seed)
+        self.cache = GramCache(self.X, self.kernel, max_bytes=cache_bytes)
+        # Bumped on every alpha/b update; keys caches of derived views.
+        self.version = 0
+
+    @property
+    def support(self) -> np.ndarray:
+        return np.flatnonzero(self.alpha)
+
+    def train_score(self, index: int) -> float:
+        """Score of training sample index, read from the cached Gram row."""
+        support = self.support
+        if support.size == 0:
+            return self.b
+        row = self.cache.row(index)
+        return float(np.dot(row[support], self.alpha[support] * self.y[support])) + self.b
+
+    def train_index(self, index: int, lr: float | None = None) -> KernelStepResult:
+        score = self.train_score(index)
+        y = self.y[index]
+        mistake = bool(y * score <= 0)
+        step_lr = self.lr if lr is None else lr
+        delta_alpha = 0.0
+        delta_b = 0.0
+        if mistake:
+            delta_alpha = step_lr
+            delta_b = step_lr * float(y)
+            self.alpha[index] += delta_alpha
+            self.b += delta_b
+            self.version += 1
+        return KernelStepResult(
+            score=score,
+            pred=1 if score >= 0 else -1,
+            mistake=mistake,
+            delta_alpha=delta_alpha,
+            delta_b=delta_b,
+        )
+
+    def train_epoch(self, lr: float | None = None, shuffle: bool = True) -> List[KernelStepResult]:
+        order = list(range(len(self.y)))
+        if shuffle:
+            self._rng.shuffle(order)
+        return [self.train_index(i, lr=lr) for i in order]
+
+    def decision_function(self, points: np.ndarray, chunk: int = 4096) -> np.ndarray:
+        """Scores for an (m, dim) batch, kernelized against support vectors only."""
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        if points.shape[1] != self.dim:
+            raise ValueError("points have wrong dimension")
+        support = self.support
+        out = np.full(points.shape[0], self.b, dtype=np.float64)
+        if support.size == 0:
+            return out
+        coef = self.alpha[support] * self.y[support]
+        sv = self.X[support]
+        for start in range(0, points.shape[0], chunk):
+            stop = start + chunk
+            out[start:stop] += self.kernel.matrix(points[start:stop], sv) @ coef
+        return out
+
+    def predict_score(self, x: Iterable[float]) -> float:
+        return float(self.decision_function(np.asarray(list(x), dtype=np.float64)[None, :])[0])
+
+    def predict_label(self, x: Iterable[float]) -> int:
+        return 1 if self.predict_score(x) >= 0 else -1
+
+    def decision_grid(
+        self,
+        x_range: Tuple[float, float] = (-1.5, 1.5),
+        y_range: Tuple[float, float] = (-1.5, 1.5),
+        steps: int = 50,
+    ) -> np.ndarray:
+        """(steps, steps) scores over a 2D grid; row r is y = y_range[0] + r * dy."""
+        if self.dim != 2:
+            raise ValueError("decision grid requires 2D inputs")
+        if steps < 2:
+            raise ValueError("steps must be at least 2")
+        xs = np.linspace(x_range[0], x_range[1], steps)
+        ys = np.linspace(y_range[0], y_range[1], steps)
+        gx, gy = np.meshgrid(xs, ys)
+        points = np.column_stack([gx.ravel(), gy.ravel()])
+        return self.decision_function(points).reshape(steps, steps)
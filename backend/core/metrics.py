@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+from backend.core.sample_matrix import SampleMatrix
 
 
 def count_mistakes(results: Iterable[dict]) -> int:
@@ -10,6 +14,9 @@ def count_mistakes(results: Iterable[dict]) -> int:
 
 
 def accuracy(samples: Iterable[dict], predict_fn) -> float:
+    if isinstance(samples, SampleMatrix):
+        correct = sum(1 for x, y in zip(samples.rows, samples.labels) if predict_fn(x) == y)
+        return correct / len(samples)
     samples_list = list(samples)
     if not samples_list:
         return 0.0
@@ -27,3 +34,12 @@ def margin(y: int, score: float) -> float:
 
 def margins(samples: Iterable[dict], score_fn) -> list[float]:
     return [margin(s["y"], score_fn(s["x"])) for s in samples]
+
+
+def batch_accuracy(samples: SampleMatrix, predict_labels_fn: Callable[[np.ndarray], np.ndarray]) -> float:
+    """Accuracy from one vectorized prediction over samples.X."""
+    return float(np.mean(np.asarray(predict_labels_fn(samples.X)) == samples.y))
+
+
+def batch_margins(samples: SampleMatrix, scores_fn: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+    return samples.y * np.asarray(scores_fn(samples.X), dtype=np.float64)
@@ -0,0 +1,212 @@
+"""Bit-packed storage for {-1, +1} board datasets."""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from backend.core.binary import BinaryScorer, bytes_to_words
+from backend.core.datasets import Sample, _check_shape_fits, _pm1
+from backend.core.sample_matrix import SampleMatrix
+
+
+class PackedShapeDataset:
+    """Boards stored one bit per cell (+1 -> 1, -1 -> 0) with int8 labels.
+
+    A 64x64 board takes 512 bytes instead of 4096 Python ints twice over.
+    Indexing returns the same dict as make_shape_dataset; x and grid are
+    unpacked only when a sample is accessed. For training, to_matrix and
+    iter_batches unpack straight into {-1, +1} arrays.
+    """
+
+    _CHUNK = 512
+
+    def __init__(
+        self,
+        bits: np.ndarray,
+        y: np.ndarray,
+        positions: np.ndarray,
+        board_shape: Tuple[int, int],
+    ) -> None:
+        rows, cols = board_shape
+        if rows <= 0 or cols <= 0:
+            raise ValueError("board_shape must be positive")
+        n = bits.shape[0]
+        if y.shape != (n,) or positions.shape != (n, 2):
+            raise ValueError("bits, y, and positions must have matching lengths")
+        if bits.shape[1] != (rows * cols + 7) // 8:
+            raise ValueError("bits width does not match board_shape")
+        self.bits = bits
+        self.y = y
+        self.positions = positions
+        self.board_shape = (rows, cols)
+        self.dim = rows * cols
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[Sample], board_shape: Tuple[int, int]) -> "PackedShapeDataset":
+        """Pack samples as they are consumed, so a generator is never materialized."""
+        dim = board_shape[0] * board_shape[1]
+        packed: List[bytes] = []
+        labels: List[int] = []
+        positions: List[Tuple[int, int]] = []
+        for sample in samples:
+            x = np.asarray(sample["x"])
+            if x.shape != (dim,):
+                raise ValueError("x length must match board_shape")
+            packed.append(np.packbits(x > 0).tobytes())
+            labels.append(int(sample["y"]))
+            positions.append(tuple(sample.get("pos", (0, 0))))
+        width = (dim + 7) // 8
+        bits = np.frombuffer(b"".join(packed), dtype=np.uint8).reshape(len(packed), width)
+        return cls(
+            bits=bits,
+            y=np.asarray(labels, dtype=np.int8),
+            positions=np.asarray(positions, dtype=np.int32).reshape(-1, 2),
+            board_shape=board_shape,
+        )
+
+    @classmethod
+    def from_shapes(
+        cls,
+        good_mask: Sequence[Sequence[int]],
+        bad_mask: Sequence[Sequence[int]],
+        board_size: Tuple[int, int],
+        translations: bool = True,
+    ) -> "PackedShapeDataset":
+        """Packed equivalent of make_shape_dataset (same samples, same order).
+
+        Boards are built a chunk of placements at a time straight into bits,
+        without going through list-of-lists grids.
+        """
+        board_h, board_w = board_size
+        parts: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        for mask, label in ((good_mask, 1), (bad_mask, -1)):
+            if translations:
+                offsets, positions = _translation_offsets(mask, board_h, board_w)
+            else:
+                if len(mask) != board_h or len(mask[0]) != board_w:
+                    raise ValueError("mask must match board size when translations=False")
+                offsets = np.asarray(
+                    [r * board_w + c for r in range(board_h) for c in range(board_w) if _pm1(mask[r][c]) == 1],
+                    dtype=np.intp,
+                )
+                positions = np.zeros((1, 2), dtype=np.int32)
+            starts = positions[:, 0].astype(np.intp) * board_w + positions[:, 1]
+            bits = _pack_placements(starts, offsets, board_h * board_w, cls._CHUNK)
+            parts.append((bits, np.full(len(positions), label, dtype=np.int8), positions))
+        return cls(
+            bits=np.concatenate([p[0] for p in parts]),
+            y=np.concatenate([p[1] for p in parts]),
+            positions=np.concatenate([p[2] for p in parts]),
+            board_shape=board_size,
+        )
+
+    def __len__(self) -> int:
+        return self.bits.shape[0]
+
+    def __getitem__(self, index: int) -> Sample:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sample index out of range")
+        row = self.row(index)
+        rows, cols = self.board_shape
+        x = row.tolist()
+        return {
+            "x": x,
+            "y": int(self.y[index]),
+            "grid": [x[r * cols:(r + 1) * cols] for r in range(rows)],
+            "pos": (int(self.positions[index, 0]), int(self.positions[index, 1])),
+        }
+
+    def __iter__(self) -> Iterator[Sample]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        return self.bits.nbytes + self.y.nbytes + self.positions.nbytes
+
+    def row(self, index: int) -> np.ndarray:
+        """Board index as a flat int8 {-1, +1} vector."""
+        return self._unpack(self.bits[index:index + 1], np.int8)[0]
+
+    def grid(self, index: int) -> List[List[int]]:
+        return self[index]["grid"]
+
+    def to_matrix(self, indices: Sequence[int] | np.ndarray | None = None, dtype=np.float64) -> np.ndarray:
+        """Unpack the selected boards (all by default) into an (n, dim) {-1, +1} matrix."""
+        bits = self.bits if indices is None else self.bits[np.asarray(indices, dtype=np.intp)]
+        return self._unpack(bits, dtype)
+
+    def to_sample_matrix(self) -> SampleMatrix:
+        """Unpack everything into a SampleMatrix (float X, grid shape and positions kept)."""
+        return SampleMatrix(self.to_matrix(), self.y, grid_shape=self.board_shape, positions=self.positions)
+
+    def to_words(self) -> np.ndarray:
+        """The bits as (n, words) uint64, the layout backend.core.binary scores."""
+        return bytes_to_words(self.bits)
+
+    def scores(self, w: Sequence[float] | np.ndarray, b: float = 0.0, batch_size: int = 65536) -> np.ndarray:
+        """w . x + b for every board, computed on the packed bits without unpacking."""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        scorer = BinaryScorer(w, b)
+        if scorer.dim != self.dim:
+            raise ValueError("w length must match board size")
+        out = np.empty(len(self), dtype=np.float64)
+        for start in range(0, len(self), batch_size):
+            stop = start + batch_size
+            out[start:stop] = scorer.scores(bytes_to_words(self.bits[start:stop]))
+        return out
+
+    def accuracy(self, w: Sequence[float] | np.ndarray, b: float = 0.0) -> float:
+        if len(self) == 0:
+            return 0.0
+        labels = np.where(self.scores(w, b) >= 0, 1, -1)
+        return float(np.mean(labels == self.y))
+
+    def iter_batches(self, batch_size: int, dtype=np.float64) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Stream (X, y) batches so only batch_size boards are unpacked at once."""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        for start in range(0, len(self), batch_size):
+            stop = start + batch_size
+            yield self._unpack(self.bits[start:stop], dtype), self.y[start:stop].astype(dtype)
+
+    def _unpack(self, bits: np.ndarray, dtype) -> np.ndarray:
+        on = np.unpackbits(bits, axis=1, count=self.dim)
+        return (on.astype(dtype) * 2 - 1).astype(dtype, copy=False)
+
+
+def _translation_offsets(
+    shape_mask: Sequence[Sequence[int]],
+    board_h: int,
+    board_w: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Flat offsets of the shape's +1 cells and every (top, left) placement, row-major."""
+    shape_h, shape_w = _check_shape_fits(shape_mask, board_h, board_w)
+    offsets = np.asarray(
+        [r * board_w + c for r in range(shape_h) for c in range(shape_w) if _pm1(shape_mask[r][c]) == 1],
+        dtype=np.intp,
+    )
+    tops, lefts = np.meshgrid(
+        np.arange(board_h - shape_h + 1, dtype=np.int32),
+        np.arange(board_w - shape_w + 1, dtype=np.int32),
+        indexing="ij",
+    )
+    positions = np.stack([tops.ravel(), lefts.ravel()], axis=1)
+    return offsets, positions
+
+
+def _pack_placements(starts: np.ndarray, offsets: np.ndarray, dim: int, chunk: int) -> np.ndarray:
+    width = (dim + 7) // 8
+    out = np.empty((len(starts), width), dtype=np.uint8)
+    for begin in range(0, len(starts), chunk):
+        block = starts[begin:begin + chunk]
+        on = np.zeros((len(block), dim), dtype=bool)
+        if offsets.size:
+            on[np.arange(len(block))[:, None], block[:, None] + offsets[None, :]] = True
+        out[begin:begin + len(block)] = np.packbits(on, axis=1)
+    return out
@@ -6,6 +6,11 @@ from dataclasses import dataclass
 from typing import Iterable, List, Sequence
 import random
 
+import numpy as np
+
+from backend.core.binary import BinaryScorer
+from backend.core.convergence import EarlyStopper, FitResult
+
 
 def _dot(a: Sequence[float], b: Sequence[float]) -> float:
     return sum(x * y for x, y in zip(a, b))
@@ -35,6 +40,8 @@ class Perceptron:
             self.b = self._rng.uniform(-0.5, 0.5)
         else:
             raise ValueError("init must be 'zeros' or 'random'")
+        # Bumped whenever the predictor changes; keys caches of derived views.
+        self.version = 0
 
     def predict_score(self, x: Sequence[float]) -> float:
         if len(x) != self.dim:
@@ -45,6 +52,10 @@ class Perceptron:
         score = self.predict_score(x)
         return 1 if score >= 0 else -1
 
+    def scores_packed(self, words: np.ndarray) -> np.ndarray:
+        """Scores for bit-packed {-1, +1} rows (see backend.core.binary.pack_pm1)."""
+        return BinaryScorer(self.w, self.b).scores(words)
+
     def train_step(self, x: Sequence[float], y: int, lr: float | None = None) -> StepResult:
         if y not in (-1, 1):
             raise ValueError("y must be -1 or +1")
@@ -60,6 +71,7 @@ class Perceptron:
                 self.w[i] += delta_w[i]
             delta_b = step_lr * y
             self.b += delta_b
+            self.version += 1
         return StepResult(score=score, pred=pred, mistake=mistake, delta_w=delta_w, delta_b=delta_b)
 
     def train_epoch(self, samples: Iterable[dict], lr: float | None = None, shuffle: bool = True) -> List[StepResult]:
@@ -70,3 +82,21 @@ class Perceptron:
         for sample in data:
             results.append(self.train_step(sample["x"], sample["y"], lr=lr))
         return results
+
+    def fit(
+        self,
+        samples: Iterable[dict],
+        epochs: int,
+        lr: float | None = None,
+        shuffle: bool = True,
+        detect_cycles: bool = True,
+    ) -> FitResult:
+        """Train up to epochs, stopping after a mistake-free epoch or a repeated (w, b)."""
+        data = list(samples)
+        stopper = EarlyStopper(self.w, self.b, detect_cycles=detect_cycles)
+        mistakes: List[int] = []
+        for _ in range(epochs):
+            mistakes.append(sum(1 for r in self.train_epoch(data, lr=lr, shuffle=shuffle) if r.mistake))
+            if stopper.update(mistakes[-1], self.w, self.b):
+                break
+        return stopper.result(mistakes)
@@ -0,0 +1,136 @@
+"""Columnar (struct-of-arrays) dataset shared by services, metrics and viz."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, overload
+
+import numpy as np
+
+Sample = dict
+
+
+class SampleMatrix(SequenceABC):
+    """Dataset held as an (n, dim) float matrix X and an int8 label vector y.
+
+    Vectorized consumers read X / y directly. Everything else sees a sequence
+    of {"x", "y"} dicts (plus "grid" and "pos" for shape datasets), so code
+    written against List[dict] keeps working. The row lists behind those
+    dicts are converted once and cached, not per access, unless the matrix
+    is large (over ROW_CACHE_CELLS cells); then each access converts just
+    its own row, so big grids are never held twice as Python floats.
+    """
+
+    ROW_CACHE_CELLS = 1 << 20
+
+    def __init__(
+        self,
+        X: Any,
+        y: Any,
+        grid_shape: Tuple[int, int] | None = None,
+        positions: Any = None,
+    ) -> None:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.asarray(y).reshape(-1)
+        if X.ndim != 2 or X.shape[0] == 0 or X.shape[1] == 0:
+            raise ValueError("X must be a non-empty 2D matrix")
+        if y.shape[0] != X.shape[0]:
+            raise ValueError("X and y must have the same length")
+        if np.any((y != 1) & (y != -1)):
+            raise ValueError("y must be -1 or +1")
+        if grid_shape is not None and grid_shape[0] * grid_shape[1] != X.shape[1]:
+            raise ValueError("grid_shape does not match sample dimension")
+        if positions is not None:
+            positions = np.asarray(positions, dtype=np.int32).reshape(-1, 2)
+            if positions.shape[0] != X.shape[0]:
+                raise ValueError("positions must have one entry per sample")
+        self.X = X
+        self.y = y.astype(np.int8)
+        self.grid_shape = grid_shape
+        self.positions = positions
+        self._rows: List[List[float]] | None = None
+        self._labels: List[int] | None = None
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: Iterable[Sample],
+        grid_shape: Tuple[int, int] | None = None,
+    ) -> "SampleMatrix":
+        """Build from sample dicts; an existing SampleMatrix is returned as-is."""
+        if isinstance(samples, SampleMatrix):
+            if grid_shape is not None and samples.grid_shape is None:
+                return cls(samples.X, samples.y, grid_shape=grid_shape, positions=samples.positions)
+            return samples
+        data = list(samples)
+        if not data:
+            raise ValueError("samples must be non-empty")
+        positions = [s["pos"] for s in data] if all("pos" in s for s in data) else None
+        return cls(
+            X=[s["x"] for s in data],
+            y=[s["y"] for s in data],
+            grid_shape=grid_shape,
+            positions=positions,
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Row/label list caches are rebuilt on demand; don't ship them to worker processes.
+        state = dict(self.__dict__)
+        state["_rows"] = None
+        state["_labels"] = None
+        return state
+
+    @property
+    def dim(self) -> int:
+        return self.X.shape[1]
+
+    @property
+    def rows(self) -> List[List[float]]:
+        """X as Python lists, converted once on first use."""
+        if self._rows is None:
+            self._rows = self.X.tolist()
+        return self._rows
+
+    @property
+    def labels(self) -> List[int]:
+        if self._labels is None:
+            self._labels = self.y.tolist()
+        return self._labels
+
+    @property
+    def y_float(self) -> np.ndarray:
+        return self.y.astype(np.float64)
+
+    def __len__(self) -> int:
+        return self.X.shape[0]
+
+    @overload
+    def __getitem__(self, index: int) -> Sample: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Sample]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self.X.size > self.ROW_CACHE_CELLS:
+            x = self.X[index].tolist()
+            label = int(self.y[index])
+        else:
+            x = self.rows[index]
+            label = self.labels[index]
+        sample: Dict[str, Any] = {"x": x, "y": label}
+        if self.positions is not None:
+            if self.grid_shape is not None:
+                rows, cols = self.grid_shape
+                sample["grid"] = [x[r * cols:(r + 1) * cols] for r in range(rows)]
+            top, left = self.positions[index]
+            sample["pos"] = (int(top), int(left))
+        return sample
+
+    def __iter__(self) -> Iterator[Sample]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_samples(self) -> List[Sample]:
+        return list(self)
@@ -0,0 +1,134 @@
+"""Array-backed perceptron engine (NumPy) mirroring the reference Perceptron."""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence, Tuple
+import random
+
+import numpy as np
+
+from backend.core.binary import BinaryScorer
+from backend.core.convergence import EarlyStopper, FitResult
+from backend.core.sample_matrix import SampleMatrix
+
+
+def samples_to_arrays(samples: Iterable[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return a contiguous (n, dim) matrix and a float label vector."""
+    matrix = SampleMatrix.from_samples(samples)
+    return matrix.X, matrix.y_float
+
+
+class VectorPerceptron:
+    """Rosenblatt perceptron holding the dataset as one matrix.
+
+    Uses the same RNG sequence as :class:`backend.core.perceptron.Perceptron`
+    for init and shuffling, so a given seed yields the same weights and
+    mistake counts. Between mistakes the weights are constant, so each epoch
+    scores a block of upcoming samples at once and only drops back to Python
+    to apply an update.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        lr: float = 1.0,
+        seed: int | None = None,
+        init: str = "zeros",
+        block: int = 64,
+    ) -> None:
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+        if block <= 0:
+            raise ValueError("block must be positive")
+        self.dim = dim
+        self.lr = lr
+        self.block = block
+        self._rng = random.Random(seed)
+        if init == "zeros":
+            self.w = np.zeros(dim, dtype=np.float64)
+            self.b = 0.0
+        elif init == "random":
+            self.w = np.array([self._rng.uniform(-0.5, 0.5) for _ in range(dim)], dtype=np.float64)
+            self.b = self._rng.uniform(-0.5, 0.5)
+        else:
+            raise ValueError("init must be 'zeros' or 'random'")
+
+    def predict_score(self, x: Sequence[float]) -> float:
+        if len(x) != self.dim:
+            raise ValueError("x has wrong dimension")
+        return float(np.dot(self.w, np.asarray(x, dtype=np.float64))) + self.b
+
+    def predict_label(self, x: Sequence[float]) -> int:
+        return 1 if self.predict_score(x) >= 0 else -1
+
+    def scores(self, X: np.ndarray) -> np.ndarray:
+        """Score every row of X in one matrix-vector product."""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self.dim:
+            raise ValueError("X has wrong dimension")
+        return X @ self.w + self.b
+
+    def scores_packed(self, words: np.ndarray) -> np.ndarray:
+        """Scores for bit-packed {-1, +1} rows (see backend.core.binary.pack_pm1)."""
+        return BinaryScorer(self.w, self.b).scores(words)
+
+    def predict_labels(self, X: np.ndarray) -> np.ndarray:
+        return np.where(self.scores(X) >= 0, 1, -1)
+
+    def accuracy(self, X: np.ndarray, y: np.ndarray) -> float:
+        if len(y) == 0:
+            return 0.0
+        return float(np.mean(self.predict_labels(X) == y))
+
+    def train_epoch(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        lr: float | None = None,
+        shuffle: bool = True,
+    ) -> int:
+        """Run one mistake-driven pass over (X, y) and return the mistake count."""
+        if X.ndim != 2 or X.shape[1] != self.dim:
+            raise ValueError("X has wrong dimension")
+        n = X.shape[0]
+        if len(y) != n:
+            raise ValueError("X and y must have the same length")
+        order = list(range(n))
+        if shuffle:
+            self._rng.shuffle(order)
+        idx = np.asarray(order, dtype=np.intp)
+        step_lr = self.lr if lr is None else lr
+        w = self.w
+        mistakes = 0
+        pos = 0
+        while pos < n:
+            chunk = idx[pos:pos + self.block]
+            margins = y[chunk] * (X[chunk] @ w + self.b)
+            bad = np.flatnonzero(margins <= 0)
+            if bad.size == 0:
+                pos += chunk.size
+                continue
+            i = chunk[bad[0]]
+            w += (step_lr * y[i]) * X[i]
+            self.b += step_lr * float(y[i])
+            mistakes += 1
+            pos += int(bad[0]) + 1
+        return mistakes
+
+    def fit(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        epochs: int,
+        lr: float | None = None,
+        shuffle: bool = True,
+        detect_cycles: bool = True,
+    ) -> FitResult:
+        """Array counterpart of Perceptron.fit (same stops for the same seed)."""
+        stopper = EarlyStopper(self.w, self.b, detect_cycles=detect_cycles)
+        mistakes = []
+        for _ in range(epochs):
+            mistakes.append(self.train_epoch(X, y, lr=lr, shuffle=shuffle))
+            if stopper.update(mistakes[-1], self.w, self.b):
+                break
+        return stopper.result(mistakes)
@@ -1,18 +1,31 @@
 """Neural network primitives (activations, losses, layers)."""
 
-from .activations import relu, relu_prime, sigmoid, sigmoid_prime_from_output, step_pm1, tanh, tanh_prime_from_output
-from .losses import bce_grad_wrt_logit, bce_loss, mse_grad, mse_loss, perceptron_loss, pm1_to_01
+from .activations import (
+    relu,
+    relu_prime,
+    sigmoid,
+    sigmoid_array,
+    sigmoid_prime_from_output,
+    step_pm1,
+    tanh,
+    tanh_array,
+    tanh_prime_from_output,
+)
+from .losses import bce_grad_wrt_logit, bce_loss, bce_loss_array, mse_grad, mse_loss, perceptron_loss, pm1_to_01
 
 __all__ = [
     "relu",
     "relu_prime",
     "sigmoid",
+    "sigmoid_array",
     "sigmoid_prime_from_output",
     "step_pm1",
     "tanh",
+    "tanh_array",
     "tanh_prime_from_output",
     "bce_grad_wrt_logit",
     "bce_loss",
+    "bce_loss_array",
     "mse_grad",
     "mse_loss",
     "perceptron_loss",
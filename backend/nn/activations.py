@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 
 def step_pm1(x: float) -> int:
     """Hard step returning -1 or +1."""
@@ -19,6 +21,13 @@ def sigmoid(x: float) -> float:
     return z / (1.0 + z)
 
 
+def sigmoid_array(z: np.ndarray) -> np.ndarray:
+    """Elementwise logistic sigmoid, stable for large |z|."""
+    z = np.asarray(z, dtype=np.float64)
+    ez = np.exp(-np.abs(z))
+    return np.where(z >= 0, 1.0 / (1.0 + ez), ez / (1.0 + ez))
+
+
 def sigmoid_prime_from_output(p: float) -> float:
     """Derivative of sigmoid given output p."""
     return p * (1.0 - p)
@@ -29,6 +38,11 @@ def tanh(x: float) -> float:
     return math.tanh(x)
 
 
+def tanh_array(z: np.ndarray) -> np.ndarray:
+    """Elementwise hyperbolic tangent."""
+    return np.tanh(z)
+
+
 def tanh_prime_from_output(t: float) -> float:
     """Derivative of tanh given output t."""
     return 1.0 - t * t
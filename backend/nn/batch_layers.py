@@ -0,0 +1,79 @@
+"""Matrix-backed dense layers operating on mini-batches (NumPy)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Tuple
+import random
+
+import numpy as np
+
+ArrayFn = Callable[[np.ndarray], np.ndarray]
+
+
+@dataclass
+class BatchDenseStep:
+    z: np.ndarray
+    a: np.ndarray
+
+
+class BatchDenseLayer:
+    """Dense layer whose forward/backward take a (batch, dim) matrix.
+
+    Weights are drawn from the same RNG sequence as DenseLayer, so a given
+    seed starts from identical parameters. Gradients are summed over the
+    batch; callers scale the upstream gradient to get a mean.
+    """
+
+    def __init__(
+        self,
+        input_dim: int,
+        output_dim: int,
+        activation: ArrayFn,
+        activation_prime_from_output: ArrayFn,
+        seed: int | None = 0,
+    ) -> None:
+        if input_dim <= 0 or output_dim <= 0:
+            raise ValueError("dimensions must be positive")
+        self.input_dim = input_dim
+        self.output_dim = output_dim
+        rng = random.Random(seed)
+        self.W = np.array(
+            [[rng.uniform(-0.5, 0.5) for _ in range(input_dim)] for _ in range(output_dim)],
+            dtype=np.float64,
+        )
+        self.b = np.zeros(output_dim, dtype=np.float64)
+        self.activation = activation
+        self.activation_prime_from_output = activation_prime_from_output
+        self.last_input: np.ndarray | None = None
+        self.last_output: np.ndarray | None = None
+
+    def forward(self, X: np.ndarray) -> BatchDenseStep:
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        if X.shape[1] != self.input_dim:
+            raise ValueError("x has wrong dimension")
+        self.last_input = X
+        z = X @ self.W.T + self.b
+        a = self.activation(z)
+        self.last_output = a
+        return BatchDenseStep(z=z, a=a)
+
+    def backward(self, grad_out: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.last_input is None or self.last_output is None:
+            raise ValueError("forward must be called before backward")
+        grad_out = np.atleast_2d(np.asarray(grad_out, dtype=np.float64))
+        if grad_out.shape != self.last_output.shape:
+            raise ValueError("grad_out has wrong dimension")
+        grad_z = grad_out * self.activation_prime_from_output(self.last_output)
+        grad_W = grad_z.T @ self.last_input
+        grad_b = grad_z.sum(axis=0)
+        grad_x = grad_z @ self.W
+        return grad_W, grad_b, grad_x
+
+    def apply_gradients(self, grad_W: np.ndarray, grad_b: np.ndarray, lr: float) -> None:
+        if np.shape(grad_W) != self.W.shape:
+            raise ValueError("grad_W has wrong dimension")
+        if np.shape(grad_b) != self.b.shape:
+            raise ValueError("grad_b has wrong dimension")
+        self.W -= lr * grad_W
+        self.b -= lr * grad_b
@@ -0,0 +1,116 @@
+"""Two-layer MLP trained in mini-batches with matrix products (NumPy)."""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+import random
+
+import numpy as np
+
+from backend.core.sample_matrix import SampleMatrix
+from backend.nn.activations import sigmoid_array, sigmoid_prime_from_output, tanh_array, tanh_prime_from_output
+from backend.nn.batch_layers import BatchDenseLayer
+from backend.nn.losses import bce_loss_array
+from backend.nn.mlp import MlpStep
+
+
+def _labels_01(y_pm1: np.ndarray) -> np.ndarray:
+    y = np.asarray(y_pm1, dtype=np.float64).reshape(-1)
+    if np.any((y != 1) & (y != -1)):
+        raise ValueError("y must be -1 or +1")
+    return (y + 1.0) / 2.0
+
+
+class BatchMlpTwoLayer:
+    """Array-backed counterpart of MlpTwoLayer.
+
+    Same architecture, init and update rule; with batch_size=1 and no shuffle,
+    train() reproduces MlpTwoLayer.train up to float rounding. Larger batches
+    average the gradient over the batch.
+    """
+
+    def __init__(self, input_dim: int, hidden_dim: int = 2, lr: float = 0.5, seed: int | None = 0) -> None:
+        if input_dim <= 0:
+            raise ValueError("input_dim must be positive")
+        self.input_dim = input_dim
+        self.hidden_dim = hidden_dim
+        self.lr = lr
+        self._rng = random.Random(seed)
+        self.hidden = BatchDenseLayer(
+            input_dim,
+            hidden_dim,
+            activation=tanh_array,
+            activation_prime_from_output=tanh_prime_from_output,
+            seed=seed,
+        )
+        self.output = BatchDenseLayer(
+            hidden_dim,
+            1,
+            activation=sigmoid_array,
+            activation_prime_from_output=sigmoid_prime_from_output,
+            seed=seed,
+        )
+        self.last_grad_hidden: np.ndarray | None = None
+        self.last_grad_hidden_b: np.ndarray | None = None
+
+    def forward_batch(self, X: np.ndarray) -> np.ndarray:
+        """Return p_hat for every row of X."""
+        hidden = self.hidden.forward(X).a
+        return self.output.forward(hidden).a[:, 0]
+
+    def forward(self, x: Sequence[float]) -> float:
+        return float(self.forward_batch(np.asarray(x, dtype=np.float64)[None, :])[0])
+
+    def train_batch(self, X: np.ndarray, y_pm1: np.ndarray) -> np.ndarray:
+        """One gradient step on a mini-batch; returns per-sample losses before the update."""
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        y01 = _labels_01(y_pm1)
+        if X.shape[0] != y01.shape[0]:
+            raise ValueError("X and y must have the same length")
+        p_hat = self.forward_batch(X)
+        losses = bce_loss_array(y01, p_hat)
+        grad_z_out = ((p_hat - y01) / X.shape[0])[:, None]
+        grad_W_out, grad_b_out, grad_hidden = self.output.backward(grad_z_out)
+        grad_W_hidden, grad_b_hidden, _ = self.hidden.backward(grad_hidden)
+        self.output.apply_gradients(grad_W_out, grad_b_out, self.lr)
+        self.hidden.apply_gradients(grad_W_hidden, grad_b_hidden, self.lr)
+        self.last_grad_hidden = grad_W_hidden
+        self.last_grad_hidden_b = grad_b_hidden
+        return losses
+
+    def step(self, x: Sequence[float], y_pm1: int) -> MlpStep:
+        loss = float(self.train_batch(np.asarray(x, dtype=np.float64)[None, :], np.array([y_pm1]))[0])
+        grad_hidden = self.last_grad_hidden
+        grad_norm = float(np.abs(grad_hidden).sum() + np.abs(self.last_grad_hidden_b).sum())
+        return MlpStep(
+            loss=loss,
+            p_hat=float(self.output.last_output[0, 0]),
+            grad_norm=grad_norm,
+            grad_hidden=grad_hidden.tolist(),
+        )
+
+    def train(
+        self,
+        samples: Sequence[dict],
+        epochs: int,
+        batch_size: int = 1,
+        shuffle: bool = False,
+    ) -> List[float]:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        matrix = SampleMatrix.from_samples(samples)
+        X = matrix.X
+        y = matrix.y_float
+        n = X.shape[0]
+        order = list(range(n))
+        losses: List[float] = []
+        for _ in range(epochs):
+            if shuffle:
+                self._rng.shuffle(order)
+            idx = np.asarray(order, dtype=np.intp)
+            epoch_loss = 0.0
+            for start in range(0, n, batch_size):
+                chunk = idx[start:start + batch_size]
+                epoch_loss += float(self.train_batch(X[chunk], y[chunk]).sum())
+            losses.append(epoch_loss / n)
+        return losses
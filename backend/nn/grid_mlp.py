@@ -5,8 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Sequence, Tuple
 
+import numpy as np
+
+from backend.nn.batch_mlp import BatchMlpTwoLayer
 from backend.nn.mlp import MlpTwoLayer
 
+ENGINES = ("python", "numpy")
+
 
 def reshape_template(weights: Sequence[float], rows: int, cols: int) -> List[List[float]]:
     if len(weights) != rows * cols:
@@ -18,6 +23,22 @@ def reshape_template(weights: Sequence[float], rows: int, cols: int) -> List[Lis
     return grid
 
 
+def downsample_template(weights: Sequence[float], rows: int, cols: int, max_side: int) -> List[List[float]]:
+    """Block-mean a rows x cols template down to at most max_side per side (unchanged if it fits)."""
+    if max_side <= 0:
+        raise ValueError("max_side must be positive")
+    grid = np.asarray(weights, dtype=np.float64).reshape(rows, cols)
+    fr = -(-rows // max_side)
+    fc = -(-cols // max_side)
+    if fr == 1 and fc == 1:
+        return grid.tolist()
+    out_r = -(-rows // fr)
+    out_c = -(-cols // fc)
+    padded = np.full((out_r * fr, out_c * fc), np.nan)
+    padded[:rows, :cols] = grid
+    return np.nanmean(padded.reshape(out_r, fr, out_c, fc), axis=(1, 3)).tolist()
+
+
 @dataclass
 class GridMlpStep:
     loss: float
@@ -25,26 +46,49 @@ class GridMlpStep:
 
 
 class GridMlp:
-    """MLP specialized for grid inputs with template visualization."""
+    """MLP specialized for grid inputs with template visualization.
+
+    engine="numpy" swaps in the array-backed BatchMlpTwoLayer, which also
+    supports mini-batch training via train(..., batch_size=k).
+    """
 
-    def __init__(self, rows: int, cols: int, hidden_dim: int = 4, lr: float = 0.5, seed: int | None = 0) -> None:
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        hidden_dim: int = 4,
+        lr: float = 0.5,
+        seed: int | None = 0,
+        engine: str = "python",
+    ) -> None:
         if rows <= 0 or cols <= 0:
             raise ValueError("rows and cols must be positive")
+        if engine not in ENGINES:
+            raise ValueError("engine must be one of: python, numpy")
         self.rows = rows
         self.cols = cols
-        self.model = MlpTwoLayer(input_dim=rows * cols, hidden_dim=hidden_dim, lr=lr, seed=seed)
+        self.engine = engine
+        self.model: MlpTwoLayer | BatchMlpTwoLayer
+        if engine == "numpy":
+            self.model = BatchMlpTwoLayer(input_dim=rows * cols, hidden_dim=hidden_dim, lr=lr, seed=seed)
+        else:
+            self.model = MlpTwoLayer(input_dim=rows * cols, hidden_dim=hidden_dim, lr=lr, seed=seed)
 
     def step(self, x: Sequence[float], y: int) -> GridMlpStep:
         step = self.model.step(x, y)
         return GridMlpStep(loss=step.loss, p_hat=step.p_hat)
 
-    def train(self, samples: Sequence[dict], epochs: int) -> List[float]:
+    def train(self, samples: Sequence[dict], epochs: int, batch_size: int = 1) -> List[float]:
+        if isinstance(self.model, BatchMlpTwoLayer):
+            return self.model.train(samples, epochs, batch_size=batch_size)
+        if batch_size != 1:
+            raise ValueError("mini-batch training requires engine='numpy'")
         return self.model.train(samples, epochs)
 
     def weight_templates(self) -> List[List[List[float]]]:
-        return [reshape_template(w_row, self.rows, self.cols) for w_row in self.model.hidden.W]
+        return [reshape_template(list(map(float, w_row)), self.rows, self.cols) for w_row in self.model.hidden.W]
 
     def gradient_templates(self) -> List[List[List[float]]] | None:
         if self.model.last_grad_hidden is None:
             return None
-        return [reshape_template(row, self.rows, self.cols) for row in self.model.last_grad_hidden]
+        return [reshape_template(list(map(float, row)), self.rows, self.cols) for row in self.model.last_grad_hidden]
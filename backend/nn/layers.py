@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import mul
 from typing import Callable, List, Sequence
 import random
 
@@ -39,43 +40,70 @@ class DenseLayer:
     def forward(self, x: Sequence[float]) -> DenseStep:
         if len(x) != self.input_dim:
             raise ValueError("x has wrong dimension")
-        self.last_input = list(x)
-        z: List[float] = []
-        a: List[float] = []
-        for i in range(self.output_dim):
-            z_i = sum(self.W[i][j] * x[j] for j in range(self.input_dim)) + self.b[i]
-            a_i = self.activation(z_i)
-            z.append(z_i)
-            a.append(a_i)
+        x_list = list(x)
+        self.last_input = x_list
+        activation = self.activation
+        z: List[float] = [
+            sum(map(mul, row, x_list)) + b_i for row, b_i in zip(self.W, self.b)
+        ]
+        a: List[float] = [activation(z_i) for z_i in z]
         self.last_output = a
         return DenseStep(z=z, a=a)
 
-    def backward(self, grad_out: Sequence[float]) -> tuple[List[List[float]], List[float], List[float]]:
+    def backward(
+        self,
+        grad_out: Sequence[float],
+        compute_grad_x: bool = True,
+    ) -> tuple[List[List[float]], List[float], List[float]]:
+        """Return (grad_W, grad_b, grad_x); grad_x is empty when compute_grad_x is False."""
         if self.last_input is None or self.last_output is None:
             raise ValueError("forward must be called before backward")
         if len(grad_out) != self.output_dim:
             raise ValueError("grad_out has wrong dimension")
-        grad_z: List[float] = []
-        for i in range(self.output_dim):
-            grad_z.append(grad_out[i] * self.activation_prime_from_output(self.last_output[i]))
-        grad_W: List[List[float]] = [
-            [grad_z[i] * self.last_input[j] for j in range(self.input_dim)]
-            for i in range(self.output_dim)
-        ]
+        prime = self.activation_prime_from_output
+        grad_z: List[float] = [g * prime(a) for g, a in zip(grad_out, self.last_output)]
+        x = self.last_input
+        grad_W: List[List[float]] = [[g * x_j for x_j in x] for g in grad_z]
         grad_b: List[float] = grad_z[:]
-        grad_x: List[float] = [0.0 for _ in range(self.input_dim)]
-        for j in range(self.input_dim):
-            grad_x[j] = sum(self.W[i][j] * grad_z[i] for i in range(self.output_dim))
+        grad_x: List[float] = []
+        if compute_grad_x:
+            grad_x = [sum(map(mul, col, grad_z)) for col in zip(*self.W)]
         return grad_W, grad_b, grad_x
 
+    def backward_apply(
+        self,
+        grad_out: Sequence[float],
+        lr: float,
+        compute_grad_x: bool = True,
+    ) -> tuple[List[float], List[float]]:
+        """Backward pass fused with the SGD update; returns (grad_z, grad_x).
+
+        grad_W is never materialized: each weight moves by lr * (grad_z[i] * x[j]),
+        which is the same update apply_gradients would make. grad_x uses the
+        pre-update weights.
+        """
+        if self.last_input is None or self.last_output is None:
+            raise ValueError("forward must be called before backward")
+        if len(grad_out) != self.output_dim:
+            raise ValueError("grad_out has wrong dimension")
+        prime = self.activation_prime_from_output
+        grad_z: List[float] = [g * prime(a) for g, a in zip(grad_out, self.last_output)]
+        grad_x: List[float] = []
+        if compute_grad_x:
+            grad_x = [sum(map(mul, col, grad_z)) for col in zip(*self.W)]
+        x = self.last_input
+        for i, (row, g) in enumerate(zip(self.W, grad_z)):
+            row[:] = [w - lr * (g * x_j) for w, x_j in zip(row, x)]
+            self.b[i] -= lr * g
+        return grad_z, grad_x
+
     def apply_gradients(self, grad_W: Sequence[Sequence[float]], grad_b: Sequence[float], lr: float) -> None:
         if len(grad_W) != self.output_dim:
             raise ValueError("grad_W has wrong dimension")
         if len(grad_b) != self.output_dim:
             raise ValueError("grad_b has wrong dimension")
-        for i in range(self.output_dim):
-            if len(grad_W[i]) != self.input_dim:
+        for i, (row, grad_row) in enumerate(zip(self.W, grad_W)):
+            if len(grad_row) != self.input_dim:
                 raise ValueError("grad_W has wrong dimension")
-            for j in range(self.input_dim):
-                self.W[i][j] -= lr * grad_W[i][j]
+            row[:] = [w - lr * g for w, g in zip(row, grad_row)]
             self.b[i] -= lr * grad_b[i]
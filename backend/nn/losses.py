@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
 
 def perceptron_loss(y: int, score: float) -> float:
     """Perceptron hinge-like loss for y in {-1, +1}."""
@@ -31,6 +33,12 @@ def bce_loss(y: float, p_hat: float, eps: float = 1e-12) -> float:
     return -(y * math.log(p) + (1.0 - y) * math.log(1.0 - p))
 
 
+def bce_loss_array(y: np.ndarray, p_hat: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    """Per-sample binary cross-entropy for arrays of {0, 1} targets."""
+    p = np.clip(p_hat, eps, 1.0 - eps)
+    return -(y * np.log(p) + (1.0 - y) * np.log(1.0 - p))
+
+
 def bce_grad_wrt_logit(p_hat: float, y: float) -> float:
     """Gradient of BCE with sigmoid output w.r.t. logit (z)."""
     if y not in (0.0, 1.0):
@@ -20,6 +20,13 @@ class MlpStep:
 
 @dataclass
 class MlpInternals:
+    """Forward/backward signals of one inspected step.
+
+    Only the post-update parameters are copied. Pre-update parameters are
+    derived on access from the update itself (before = after + lr * grad),
+    so an inspected step costs one snapshot instead of four.
+    """
+
     x: List[float]
     y: int
     y01: int
@@ -28,19 +35,49 @@ class MlpInternals:
     output_z: float
     output_a: float
     loss: float
+    lr: float
     grad_hidden_W: List[List[float]]
     grad_hidden_b: List[float]
     grad_out_W: List[List[float]]
     grad_out_b: List[float]
-    hidden_W_before: List[List[float]]
-    hidden_b_before: List[float]
-    out_W_before: List[List[float]]
-    out_b_before: List[float]
     hidden_W_after: List[List[float]]
     hidden_b_after: List[float]
     out_W_after: List[List[float]]
     out_b_after: List[float]
 
+    def _undo(self, after: List[float], grad: List[float]) -> List[float]:
+        return [a + self.lr * g for a, g in zip(after, grad)]
+
+    @property
+    def hidden_W_before(self) -> List[List[float]]:
+        return [self._undo(row, grad) for row, grad in zip(self.hidden_W_after, self.grad_hidden_W)]
+
+    @property
+    def hidden_b_before(self) -> List[float]:
+        return self._undo(self.hidden_b_after, self.grad_hidden_b)
+
+    @property
+    def out_W_before(self) -> List[List[float]]:
+        return [self._undo(row, grad) for row, grad in zip(self.out_W_after, self.grad_out_W)]
+
+    @property
+    def out_b_before(self) -> List[float]:
+        return self._undo(self.out_b_after, self.grad_out_b)
+
+
+@dataclass
+class _Backprop:
+    hidden_z: List[float]
+    hidden_a: List[float]
+    output_z: float
+    p_hat: float
+    y01: int
+    loss: float
+    grad_hidden_W: List[List[float]]
+    grad_hidden_b: List[float]
+    grad_out_W: List[List[float]]
+    grad_out_b: List[float]
+
 
 class MlpTwoLayer:
     """Minimal 2-layer MLP for binary classification."""
@@ -65,32 +102,27 @@ class MlpTwoLayer:
             activation_prime_from_output=sigmoid_prime_from_output,
             seed=seed,
         )
-        self.last_grad_hidden: List[List[float]] | None = None
+        self._last_grad_hidden: List[List[float]] | None = None
+        self._last_grad_factors: tuple[List[float], List[float]] | None = None
+        # Bumped on every parameter update; keys caches of derived views.
+        self.version = 0
+
+    @property
+    def last_grad_hidden(self) -> List[List[float]] | None:
+        """Hidden-layer weight gradient of the latest update, built on demand after train()."""
+        if self._last_grad_factors is not None:
+            grad_z, x = self._last_grad_factors
+            self._last_grad_hidden = [[g * x_j for x_j in x] for g in grad_z]
+            self._last_grad_factors = None
+        return self._last_grad_hidden
 
     def forward(self, x: Sequence[float]) -> float:
         hidden = self.hidden.forward(x).a
         out = self.output.forward(hidden).a[0]
         return out
 
-    def step(self, x: Sequence[float], y_pm1: int) -> MlpStep:
-        internals = self.inspect_step(x, y_pm1)
-        grad_norm = sum(abs(val) for row in internals.grad_hidden_W for val in row) + sum(
-            abs(val) for val in internals.grad_hidden_b
-        )
-        return MlpStep(
-            loss=internals.loss,
-            p_hat=internals.output_a,
-            grad_norm=grad_norm,
-            grad_hidden=internals.grad_hidden_W,
-        )
-
-    def inspect_step(self, x: Sequence[float], y_pm1: int) -> MlpInternals:
+    def _update(self, x: Sequence[float], y_pm1: int) -> _Backprop:
         y01 = pm1_to_01(y_pm1)
-        hidden_W_before = [row[:] for row in self.hidden.W]
-        hidden_b_before = self.hidden.b[:]
-        out_W_before = [row[:] for row in self.output.W]
-        out_b_before = self.output.b[:]
-
         hidden_step = self.hidden.forward(x)
         output_step = self.output.forward(hidden_step.a)
         p_hat = output_step.a[0]
@@ -98,29 +130,69 @@ class MlpTwoLayer:
 
         grad_z_out = bce_grad_wrt_logit(p_hat, float(y01))
         grad_W_out, grad_b_out, grad_hidden = self.output.backward([grad_z_out])
-        grad_W_hidden, grad_b_hidden, _ = self.hidden.backward(grad_hidden)
+        grad_W_hidden, grad_b_hidden, _ = self.hidden.backward(grad_hidden, compute_grad_x=False)
 
         self.output.apply_gradients(grad_W_out, grad_b_out, self.lr)
         self.hidden.apply_gradients(grad_W_hidden, grad_b_hidden, self.lr)
-        self.last_grad_hidden = grad_W_hidden
-
-        return MlpInternals(
-            x=list(x),
-            y=y_pm1,
-            y01=y01,
+        self.version += 1
+        self._last_grad_hidden = grad_W_hidden
+        self._last_grad_factors = None
+        return _Backprop(
             hidden_z=hidden_step.z,
             hidden_a=hidden_step.a,
             output_z=output_step.z[0],
-            output_a=p_hat,
+            p_hat=p_hat,
+            y01=y01,
             loss=loss,
             grad_hidden_W=grad_W_hidden,
             grad_hidden_b=grad_b_hidden,
             grad_out_W=grad_W_out,
             grad_out_b=grad_b_out,
-            hidden_W_before=hidden_W_before,
-            hidden_b_before=hidden_b_before,
-            out_W_before=out_W_before,
-            out_b_before=out_b_before,
+        )
+
+    def _train_update(self, x: Sequence[float], y_pm1: int) -> float:
+        """Fastest path: fused backward/update, no gradient matrices; returns the loss."""
+        y01 = pm1_to_01(y_pm1)
+        hidden_a = self.hidden.forward(x).a
+        p_hat = self.output.forward(hidden_a).a[0]
+        loss = bce_loss(float(y01), p_hat)
+        grad_z_out = bce_grad_wrt_logit(p_hat, float(y01))
+        _, grad_hidden = self.output.backward_apply([grad_z_out], self.lr)
+        grad_z_hidden, _ = self.hidden.backward_apply(grad_hidden, self.lr, compute_grad_x=False)
+        self.version += 1
+        self._last_grad_factors = (grad_z_hidden, self.hidden.last_input)
+        return loss
+
+    def step(self, x: Sequence[float], y_pm1: int) -> MlpStep:
+        """Apply one SGD update without snapshotting parameters."""
+        bp = self._update(x, y_pm1)
+        grad_norm = sum(abs(val) for row in bp.grad_hidden_W for val in row) + sum(
+            abs(val) for val in bp.grad_hidden_b
+        )
+        return MlpStep(
+            loss=bp.loss,
+            p_hat=bp.p_hat,
+            grad_norm=grad_norm,
+            grad_hidden=bp.grad_hidden_W,
+        )
+
+    def inspect_step(self, x: Sequence[float], y_pm1: int) -> MlpInternals:
+        """Apply one SGD update and record its internals for visualization."""
+        bp = self._update(x, y_pm1)
+        return MlpInternals(
+            x=list(x),
+            y=y_pm1,
+            y01=bp.y01,
+            hidden_z=bp.hidden_z,
+            hidden_a=bp.hidden_a,
+            output_z=bp.output_z,
+            output_a=bp.p_hat,
+            loss=bp.loss,
+            lr=self.lr,
+            grad_hidden_W=bp.grad_hidden_W,
+            grad_hidden_b=bp.grad_hidden_b,
+            grad_out_W=bp.grad_out_W,
+            grad_out_b=bp.grad_out_b,
             hidden_W_after=[row[:] for row in self.hidden.W],
             hidden_b_after=self.hidden.b[:],
             out_W_after=[row[:] for row in self.output.W],
@@ -132,7 +204,6 @@ class MlpTwoLayer:
         for _ in range(epochs):
             epoch_loss = 0.0
             for sample in samples:
-                step = self.step(sample["x"], sample["y"])
-                epoch_loss += step.loss
+                epoch_loss += self._train_update(sample["x"], sample["y"])
             losses.append(epoch_loss / len(samples))
         return losses
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import argparse
-from typing import Dict, List
+import sys
+from typing import Any, Dict, List, Sequence
 
+from backend.core.convergence import MAX_EPOCHS, EarlyStopper, FitResult
 from backend.core.datasets import make_and_dataset_pm1, make_or_dataset_pm1, make_xor_dataset_pm1
 from backend.core.metrics import accuracy, count_mistakes
 from backend.core.perceptron import Perceptron
+from backend.core.vector_perceptron import VectorPerceptron, samples_to_arrays
 
 
 DATASETS = {
@@ -16,34 +19,94 @@ DATASETS = {
     "xor": make_xor_dataset_pm1,
 }
 
+ENGINES = ("python", "numpy")
 
-def run_training(dataset: str, epochs: int, lr: float, seed: int | None = 0) -> Dict[str, List[float]]:
+
+def run_training(
+    dataset: str,
+    epochs: int,
+    lr: float,
+    seed: int | None = 0,
+    engine: str = "python",
+    init: str = "zeros",
+    early_stop: bool = False,
+) -> Dict[str, Any]:
+    """Train for up to epochs and return per-epoch mistakes/accuracy plus why training stopped.
+
+    With early_stop, training ends after a mistake-free epoch ("converged")
+    or once a (w, b) state repeats ("cycle", non-separable data); otherwise
+    all epochs run and stop_reason is always "max_epochs". converged_epoch
+    is the first mistake-free epoch (or None) either way.
+    """
     if dataset not in DATASETS:
         raise ValueError("dataset must be one of: or, and, xor")
+    if engine not in ENGINES:
+        raise ValueError("engine must be one of: python, numpy")
     samples = DATASETS[dataset]()
-    p = Perceptron(dim=2, lr=lr, seed=seed, init="zeros")
 
     mistake_history: List[float] = []
     accuracy_history: List[float] = []
 
+    if engine == "numpy":
+        X, y = samples_to_arrays(samples)
+        model = VectorPerceptron(dim=X.shape[1], lr=lr, seed=seed, init=init)
+
+        def epoch() -> float:
+            mistakes = model.train_epoch(X, y, lr=lr, shuffle=True)
+            accuracy_history.append(model.accuracy(X, y))
+            return mistakes
+    else:
+        model = Perceptron(dim=2, lr=lr, seed=seed, init=init)
+
+        def epoch() -> float:
+            results = model.train_epoch(samples, lr=lr, shuffle=True)
+            accuracy_history.append(accuracy(samples, model.predict_label))
+            return count_mistakes([r.__dict__ for r in results])
+
+    stopper = EarlyStopper(model.w, model.b) if early_stop else None
     for _ in range(epochs):
-        results = p.train_epoch(samples, lr=lr, shuffle=True)
-        mistake_history.append(count_mistakes([r.__dict__ for r in results]))
-        accuracy_history.append(accuracy(samples, p.predict_label))
+        mistake_history.append(epoch())
+        if stopper is not None and stopper.update(int(mistake_history[-1]), model.w, model.b):
+            break
+    if stopper is not None:
+        result = stopper.result(mistake_history)
+    else:
+        result = FitResult(mistakes=mistake_history, stop_reason=MAX_EPOCHS, stop_epoch=len(mistake_history))
+    return {
+        "mistakes": mistake_history,
+        "accuracy": accuracy_history,
+        "stop_reason": result.stop_reason,
+        "stop_epoch": result.stop_epoch,
+        "cycle_start": result.cycle_start,
+        "converged_epoch": next((i + 1 for i, m in enumerate(mistake_history) if m == 0), None),
+    }
 
-    return {"mistakes": mistake_history, "accuracy": accuracy_history}
 
+def main(argv: Sequence[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "sweep":
+        from backend.sweep import main as sweep_main
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Perceptron training runner")
+        sweep_main(argv[1:])
+        return
+    parser = argparse.ArgumentParser(description="Perceptron training runner (see also: perceptron-runner sweep)")
     parser.add_argument("--dataset", default="or", choices=DATASETS.keys())
     parser.add_argument("--epochs", type=int, default=10)
     parser.add_argument("--lr", type=float, default=1.0)
-    args = parser.parse_args()
+    parser.add_argument("--engine", default="python", choices=ENGINES)
+    parser.add_argument("--no-early-stop", dest="early_stop", action="store_false",
+                        help="run every epoch even after convergence or a detected cycle")
+    args = parser.parse_args(argv)
 
-    stats = run_training(args.dataset, args.epochs, args.lr)
+    stats = run_training(args.dataset, args.epochs, args.lr, engine=args.engine, early_stop=args.early_stop)
     for i, (m, acc) in enumerate(zip(stats["mistakes"], stats["accuracy"])):
         print(f"epoch {i + 1:02d}: mistakes={int(m)} accuracy={acc:.2f}")
+    if stats["stop_reason"] == "cycle":
+        print(f"stopped at epoch {stats['stop_epoch']}: (w, b) repeats the state after epoch {stats['cycle_start']}")
+    elif stats["stop_reason"] == "converged":
+        print(f"converged at epoch {stats['stop_epoch']}")
+    elif stats["converged_epoch"] is not None:
+        print(f"first mistake-free epoch: {stats['converged_epoch']}")
 
 
 if __name__ == "__main__":
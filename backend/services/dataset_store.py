@@ -0,0 +1,167 @@
+"""Content-addressed store of uploaded custom datasets.
+
+Clients upload a dataset once (POST /datasets) and then refer to it by
+dataset_id instead of resending every sample. Inputs are always {-1, +1},
+so each sample is kept bit-packed (one bit per cell, np.packbits layout)
+with an int8 label: a 128x128 grid costs 2 KB per sample instead of 128 KB
+as float64. The id is a hash of the packed content and grid shape, so
+uploading the same data again returns the same id.
+
+The store is shared, so each entry remembers which sessions uploaded it.
+A session's DELETE releases only its own reference; the data goes away
+once no session holds one (or when the LRU evicts it).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Set, Tuple
+import hashlib
+import threading
+
+import numpy as np
+
+from backend.core.sample_matrix import SampleMatrix
+
+_ID_PREFIX = "ds_"
+_ID_HEX_CHARS = 32
+
+
+@dataclass(frozen=True)
+class StoredDataset:
+    dataset_id: str
+    grid_shape: Tuple[int, int]
+    bits: np.ndarray
+    y: np.ndarray
+
+    @property
+    def dim(self) -> int:
+        return self.grid_shape[0] * self.grid_shape[1]
+
+    @property
+    def sample_count(self) -> int:
+        return int(self.y.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.bits.nbytes + self.y.nbytes)
+
+    def to_matrix(self) -> SampleMatrix:
+        X = np.unpackbits(self.bits, axis=1, count=self.dim).astype(np.float64)
+        X *= 2.0
+        X -= 1.0
+        return SampleMatrix(X, self.y, grid_shape=self.grid_shape)
+
+    def info(self) -> Dict[str, object]:
+        rows, cols = self.grid_shape
+        return {
+            "dataset_id": self.dataset_id,
+            "grid_rows": rows,
+            "grid_cols": cols,
+            "sample_count": self.sample_count,
+            "nbytes": self.nbytes,
+        }
+
+
+def pack_dataset(matrix: SampleMatrix, grid_shape: Tuple[int, int]) -> StoredDataset:
+    """Bit-pack a validated {-1, +1} matrix and derive its content id."""
+    bits = np.packbits(matrix.X > 0, axis=1)
+    y = np.ascontiguousarray(matrix.y, dtype=np.int8)
+    digest = hashlib.sha256()
+    digest.update(np.asarray(grid_shape, dtype=np.int64).tobytes())
+    digest.update(bits.tobytes())
+    digest.update(y.tobytes())
+    dataset_id = _ID_PREFIX + digest.hexdigest()[:_ID_HEX_CHARS]
+    return StoredDataset(dataset_id=dataset_id, grid_shape=grid_shape, bits=bits, y=y)
+
+
+class DatasetStore:
+    """LRU of packed datasets bounded by count and total packed bytes."""
+
+    def __init__(self, max_datasets: int = 128, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if max_datasets <= 0:
+            raise ValueError("max_datasets must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_datasets = max_datasets
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._datasets: "OrderedDict[str, StoredDataset]" = OrderedDict()
+        self._owners: Dict[str, Set[str]] = {}
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._datasets)
+
+    def __contains__(self, dataset_id: str) -> bool:
+        return dataset_id in self._datasets
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def put(
+        self,
+        matrix: SampleMatrix,
+        grid_shape: Tuple[int, int],
+        owner: str | None = None,
+    ) -> Tuple[StoredDataset, bool]:
+        """Store matrix (or refresh its existing copy), referenced by owner; returns (entry, created)."""
+        entry = pack_dataset(matrix, grid_shape)
+        if entry.nbytes > self.max_bytes:
+            raise ValueError(f"dataset too large to store: {entry.nbytes} bytes exceeds {self.max_bytes}")
+        with self._lock:
+            existing = self._datasets.get(entry.dataset_id)
+            created = existing is None
+            if created:
+                self._datasets[entry.dataset_id] = entry
+                self._owners[entry.dataset_id] = set()
+                self._total_bytes += entry.nbytes
+            else:
+                self._datasets.move_to_end(entry.dataset_id)
+                entry = existing
+            if owner is not None:
+                self._owners[entry.dataset_id].add(owner)
+            while len(self._datasets) > self.max_datasets or self._total_bytes > self.max_bytes:
+                self._remove(next(iter(self._datasets)))
+            return entry, created
+
+    def get(self, dataset_id: str) -> StoredDataset:
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            if entry is None:
+                raise KeyError(dataset_id)
+            self._datasets.move_to_end(dataset_id)
+            return entry
+
+    def references(self, dataset_id: str) -> int:
+        with self._lock:
+            return len(self._owners.get(dataset_id, ()))
+
+    def release(self, dataset_id: str, owner: str) -> int:
+        """Drop owner's reference and return how many remain; the entry is removed at zero.
+
+        Raises KeyError if owner holds no reference to dataset_id.
+        """
+        with self._lock:
+            owners = self._owners.get(dataset_id)
+            if owners is None or owner not in owners:
+                raise KeyError(dataset_id)
+            owners.discard(owner)
+            if not owners:
+                self._remove(dataset_id)
+            return len(owners)
+
+    def drop(self, dataset_id: str) -> bool:
+        """Remove dataset_id regardless of who references it."""
+        with self._lock:
+            if dataset_id not in self._datasets:
+                return False
+            self._remove(dataset_id)
+            return True
+
+    def _remove(self, dataset_id: str) -> None:
+        entry = self._datasets.pop(dataset_id)
+        del self._owners[dataset_id]
+        self._total_bytes -= entry.nbytes
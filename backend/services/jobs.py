@@ -0,0 +1,349 @@
+"""Background training jobs on a bounded process pool.
+
+A job trains a perceptron or an MLP for many epochs outside the request
+that created it. Work is shipped to the pool in chunks of epochs: each
+chunk gets the model (and early-stop state) pickled in and back out, so
+between chunks the manager can record progress and loss curves, honour a
+cancel request, and let other jobs' chunks take their turn on the workers.
+A running chunk cannot be interrupted; cancellation takes effect at the
+next chunk boundary. Inputs are {-1, +1}, so X travels as int8.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+import secrets
+import threading
+import time
+
+import numpy as np
+
+from backend.core.convergence import EarlyStopper
+from backend.core.sample_matrix import SampleMatrix
+from backend.core.vector_perceptron import VectorPerceptron
+from backend.nn.batch_mlp import BatchMlpTwoLayer
+
+MODELS = ("perceptron", "mlp")
+MAX_JOB_EPOCHS = 100_000
+# Chunks per job when chunk_epochs is not given: progress moves in ~5% steps.
+DEFAULT_CHUNKS = 20
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when the number of unfinished jobs is at the manager's limit."""
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    model: str
+    dataset: str
+    grid_shape: Tuple[int, int]
+    epochs: int
+    lr: float
+    seed: int | None = 0
+    hidden_dim: int = 2
+    batch_size: int = 1
+    init: str = "zeros"
+    early_stop: bool = True
+    chunk_epochs: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.model not in MODELS:
+            raise ValueError("model must be 'perceptron' or 'mlp'")
+        if not 1 <= self.epochs <= MAX_JOB_EPOCHS:
+            raise ValueError(f"epochs must be between 1 and {MAX_JOB_EPOCHS}")
+        if self.hidden_dim <= 0:
+            raise ValueError("hidden_dim must be positive")
+        if self.model == "mlp":
+            # Imported here: backend.api.deps imports this module.
+            from backend.api.utils import check_mlp_size
+
+            check_mlp_size(self.hidden_dim, *self.grid_shape)
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if self.init not in ("zeros", "random"):
+            raise ValueError("init must be 'zeros' or 'random'")
+        if self.chunk_epochs is not None and self.chunk_epochs <= 0:
+            raise ValueError("chunk_epochs must be positive")
+
+    @property
+    def chunk_size(self) -> int:
+        if self.chunk_epochs is not None:
+            return self.chunk_epochs
+        return max(1, -(-self.epochs // DEFAULT_CHUNKS))
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["grid_rows"], data["grid_cols"] = data.pop("grid_shape")
+        return data
+
+
+@dataclass
+class ChunkResult:
+    model: Any
+    stopper: EarlyStopper | None
+    losses: List[float]
+    accuracy: List[float]
+    stopped: bool
+
+
+def _build_model(spec: JobSpec, dim: int) -> Any:
+    if spec.model == "perceptron":
+        return VectorPerceptron(dim=dim, lr=spec.lr, seed=spec.seed, init=spec.init)
+    return BatchMlpTwoLayer(input_dim=dim, hidden_dim=spec.hidden_dim, lr=spec.lr, seed=spec.seed)
+
+
+def train_chunk(
+    spec: JobSpec,
+    model: Any,
+    stopper: EarlyStopper | None,
+    X_pm1: np.ndarray,
+    y: np.ndarray,
+    epochs: int,
+) -> ChunkResult:
+    """Train up to epochs more epochs; runs in a worker process.
+
+    Perceptron losses are mistakes per epoch (early stop ends the job on
+    convergence or a repeated state); MLP losses are mean BCE per epoch.
+    """
+    matrix = SampleMatrix(X_pm1, y)
+    X, y_float = matrix.X, matrix.y_float
+    if model is None:
+        model = _build_model(spec, matrix.dim)
+        if spec.model == "perceptron" and spec.early_stop:
+            stopper = EarlyStopper(model.w, model.b)
+    losses: List[float] = []
+    accuracy: List[float] = []
+    stopped = False
+    for _ in range(epochs):
+        if spec.model == "perceptron":
+            mistakes = model.train_epoch(X, y_float, shuffle=True)
+            losses.append(float(mistakes))
+            accuracy.append(model.accuracy(X, y_float))
+            if stopper is not None and stopper.update(mistakes, model.w, model.b):
+                stopped = True
+                break
+        else:
+            losses.extend(model.train(matrix, epochs=1, batch_size=spec.batch_size, shuffle=True))
+            pred = np.where(model.forward_batch(X) >= 0.5, 1, -1)
+            accuracy.append(float(np.mean(pred == matrix.y)))
+    return ChunkResult(model=model, stopper=stopper, losses=losses, accuracy=accuracy, stopped=stopped)
+
+
+def model_weights(spec: JobSpec, model: Any) -> Dict[str, Any]:
+    if spec.model == "perceptron":
+        return {"w": model.w.tolist(), "b": float(model.b)}
+    return {
+        "hidden_W": model.hidden.W.tolist(),
+        "hidden_b": model.hidden.b.tolist(),
+        "out_W": model.output.W.tolist(),
+        "out_b": model.output.b.tolist(),
+    }
+
+
+@dataclass
+class Job:
+    id: str
+    spec: JobSpec
+    X: np.ndarray
+    y: np.ndarray
+    created: float
+    status: str = QUEUED
+    epochs_done: int = 0
+    losses: List[float] = field(default_factory=list)
+    accuracy: List[float] = field(default_factory=list)
+    model: Any = None
+    stopper: EarlyStopper | None = None
+    stop_reason: str | None = None
+    error: str | None = None
+    finished: float | None = None
+    cancel_requested: bool = False
+    future: Future | None = None
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        status = self.status
+        if status == QUEUED and self.future is not None and self.future.running():
+            status = RUNNING
+        data: Dict[str, Any] = {
+            "job_id": self.id,
+            "status": status,
+            "spec": self.spec.to_dict(),
+            "sample_count": int(self.y.shape[0]),
+            "epochs_done": self.epochs_done,
+            "progress": self.epochs_done / self.spec.epochs,
+            "stop_reason": self.stop_reason,
+            "error": self.error,
+            "created": self.created,
+            "finished": self.finished,
+        }
+        if include_result:
+            loss_key = "mistakes" if self.spec.model == "perceptron" else "loss"
+            data["curves"] = {loss_key: self.losses, "accuracy": self.accuracy}
+            data["weights"] = None if self.model is None else model_weights(self.spec, self.model)
+        return data
+
+
+class JobManager:
+    """Queues jobs onto one shared executor and keeps their results.
+
+    At most max_active jobs may be unfinished at once (submit raises
+    JobQueueFull beyond that); the newest max_jobs jobs are retained, the
+    oldest finished ones dropped first. The pool is created on first
+    submit, so importing the API never spawns processes.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_active: int = 16,
+        max_jobs: int = 256,
+        executor_factory: Callable[[int | None], Executor] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_active <= 0:
+            raise ValueError("max_active must be positive")
+        if max_jobs < max_active:
+            raise ValueError("max_jobs must be at least max_active")
+        self.workers = workers
+        self.max_active = max_active
+        self.max_jobs = max_jobs
+        self._executor_factory = executor_factory or (lambda n: ProcessPoolExecutor(max_workers=n))
+        self._executor: Executor | None = None
+        self._clock = clock
+        # Re-entrant: a chunk that is already done runs its callback inside submit().
+        self._lock = threading.RLock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def active_count(self) -> int:
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.status not in FINISHED)
+
+    def submit(self, spec: JobSpec, samples: SampleMatrix) -> Job:
+        job = Job(
+            id=secrets.token_urlsafe(12),
+            spec=spec,
+            X=samples.X.astype(np.int8),
+            y=np.asarray(samples.y, dtype=np.int8),
+            created=self._clock(),
+        )
+        with self._lock:
+            if sum(1 for j in self._jobs.values() if j.status not in FINISHED) >= self.max_active:
+                raise JobQueueFull(f"too many unfinished jobs (limit {self.max_active})")
+            self._jobs[job.id] = job
+            self._evict()
+            self._submit_chunk(job)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> Job:
+        """Cancel a job: at once if its next chunk has not started, else after the running chunk."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise KeyError(job_id)
+            if job.status in FINISHED:
+                return job
+            job.cancel_requested = True
+            if job.future is not None:
+                # Succeeds only if the chunk is still queued; its callback then finishes the job.
+                job.future.cancel()
+        return job
+
+    def wait(self, job_id: str, timeout: float = 30.0, poll: float = 0.01) -> Job:
+        """Block until the job finishes (used by the CLI and tests)."""
+        deadline = time.monotonic() + timeout
+        job = self.get(job_id)
+        while job.status not in FINISHED:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"job {job_id} did not finish within {timeout}s")
+            time.sleep(poll)
+        return job
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status not in FINISHED:
+                    job.cancel_requested = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit_chunk(self, job: Job) -> None:
+        if self._executor is None:
+            self._executor = self._executor_factory(self.workers)
+        remaining = job.spec.epochs - job.epochs_done
+        future = self._executor.submit(
+            train_chunk, job.spec, job.model, job.stopper, job.X, job.y, min(job.spec.chunk_size, remaining)
+        )
+        job.future = future
+        future.add_done_callback(lambda done, job=job: self._on_chunk_done(job, done))
+
+    def _on_chunk_done(self, job: Job, future: Future) -> None:
+        with self._lock:
+            if future.cancelled() or job.status in FINISHED:
+                if job.status not in FINISHED:
+                    self._finish(job, CANCELLED)
+                return
+            job.status = RUNNING
+            error = future.exception()
+            if error is not None:
+                job.error = f"{type(error).__name__}: {error}"
+                self._finish(job, FAILED)
+                return
+            chunk: ChunkResult = future.result()
+            job.model = chunk.model
+            job.stopper = chunk.stopper
+            job.losses.extend(chunk.losses)
+            job.accuracy.extend(chunk.accuracy)
+            job.epochs_done += len(chunk.losses)
+            if chunk.stopped:
+                job.stop_reason = chunk.stopper.reason if chunk.stopper is not None else None
+                self._finish(job, DONE)
+            elif job.epochs_done >= job.spec.epochs:
+                job.stop_reason = "max_epochs"
+                self._finish(job, DONE)
+            elif job.cancel_requested:
+                self._finish(job, CANCELLED)
+            else:
+                try:
+                    self._submit_chunk(job)
+                except RuntimeError as exc:
+                    # Executor shut down between chunks.
+                    job.error = str(exc)
+                    self._finish(job, CANCELLED)
+
+    def _finish(self, job: Job, status: str) -> None:
+        job.status = status
+        job.finished = self._clock()
+        job.future = None
+
+    def _evict(self) -> None:
+        while len(self._jobs) > self.max_jobs:
+            victim = next((jid for jid, j in self._jobs.items() if j.status in FINISHED), None)
+            if victim is None:
+                break
+            del self._jobs[victim]
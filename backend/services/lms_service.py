@@ -1,30 +1,34 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from backend.core.datasets import make_or_dataset_pm1, make_xor_dataset_pm1
+from backend.core.sample_matrix import SampleMatrix
+from backend.services.trajectory import RunOptions, TrajectoryRecorder
+
+DEFAULT_RUN_TOL = 1e-4
 
 
 class LmsService:
     def __init__(self, lr: float = 0.1, dataset: str = "or") -> None:
         self.lr = lr
-        self.custom_samples: Optional[List[Dict[str, Any]]] = None
+        self.custom_samples: Optional[SampleMatrix] = None
         self.set_dataset(dataset)
 
-    def set_dataset(self, name: str, custom_samples: Optional[List[Dict[str, Any]]] = None) -> None:
+    def set_dataset(self, name: str, custom_samples: Optional[Sequence[Dict[str, Any]]] = None) -> None:
         if name == "or":
             samples = make_or_dataset_pm1()
         elif name == "xor":
             samples = make_xor_dataset_pm1()
         elif name == "custom":
             if custom_samples is not None:
-                self.custom_samples = custom_samples
+                self.custom_samples = SampleMatrix.from_samples(custom_samples)
             if self.custom_samples is None:
                 raise ValueError("custom dataset requires samples")
             samples = self.custom_samples
         else:
             raise ValueError("dataset must be 'or', 'xor', or 'custom'")
-        if any(len(sample.get("x", [])) != 2 for sample in samples):
+        if samples.dim != 2:
             raise ValueError("LMS requires 2D inputs")
         self.dataset = name
         self.samples = samples
@@ -39,6 +43,9 @@ class LmsService:
         self.b = 0.0
         return self.state()
 
+    def parameter_count(self) -> int:
+        return len(self.w) + 1
+
     def state(self) -> Dict[str, Any]:
         sample = self.samples[self.idx]
         return {
@@ -83,3 +90,22 @@ class LmsService:
             "idx": self.idx,
             "lr": self.lr,
         }
+
+    def run(self, options: RunOptions) -> Dict[str, Any]:
+        tol = DEFAULT_RUN_TOL if options.tol is None else options.tol
+        recorder = TrajectoryRecorder(options, len(self.samples))
+        while True:
+            idx = self.idx
+            result = self.step()
+            w_before = result["w_before"]
+            change = max(
+                abs(self.w[0] - w_before[0]),
+                abs(self.w[1] - w_before[1]),
+                abs(self.b - result["b_before"]),
+            )
+            done = recorder.advance(settled=change < tol)
+            if recorder.should_keep(done):
+                recorder.add(idx=idx, error=result["error"], w=self.w[:], b=self.b)
+            if done:
+                break
+        return {**self.state(), "trajectory": recorder.to_dict()}
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from backend.core.datasets import make_or_dataset_pm1, make_xor_dataset_pm1
+from backend.core.sample_matrix import SampleMatrix
+from backend.nn.activations import sigmoid_array, tanh_array
 from backend.nn.grid_mlp import reshape_template
 from backend.nn.mlp import MlpInternals, MlpTwoLayer
+from backend.services.trajectory import RunOptions, TrajectoryRecorder
+from backend.services.view_cache import ViewCache
+from backend.viz.viz_boundary import BoundarySource, RasterSpec, mlp_probability_raster
+
+DEFAULT_RUN_TOL = 0.05
+# Optional snapshot sections; scalars (dataset, idx, next_x, ...) are always included.
+SNAPSHOT_FIELDS = ("weights", "templates", "evals")
+# Sections of the per-step record; requesting any of them includes the record (x, y, loss, p_hat).
+STEP_FIELDS = ("step", "internals", "gradients")
+MLP_FIELDS = SNAPSHOT_FIELDS + STEP_FIELDS
 
 
 def _pred_from_prob(p_hat: float) -> int:
@@ -16,8 +31,10 @@ class MlpService:
         self.hidden_dim = hidden_dim
         self.lr = lr
         self.seed = seed
-        self.custom_samples: Optional[List[Dict[str, Any]]] = None
+        self.custom_samples: Optional[SampleMatrix] = None
         self.custom_shape: Optional[Tuple[int, int]] = None
+        # Evals, templates, and boundary rasters for the current weights; see _view.
+        self.views = ViewCache()
         self.set_dataset(dataset)
 
     def set_hyperparams(self, hidden_dim: int | None = None, lr: float | None = None, seed: int | None = None) -> None:
@@ -32,7 +49,7 @@ class MlpService:
         if seed is not None:
             self.seed = seed
 
-    def set_dataset(self, name: str, custom: Tuple[List[Dict[str, Any]], Tuple[int, int]] | None = None) -> None:
+    def set_dataset(self, name: str, custom: Tuple[Sequence[Dict[str, Any]], Tuple[int, int]] | None = None) -> None:
         if name == "or":
             self.samples = make_or_dataset_pm1()
             grid_shape = (1, 2)
@@ -41,7 +58,8 @@ class MlpService:
             grid_shape = (1, 2)
         elif name == "custom":
             if custom is not None:
-                self.custom_samples, self.custom_shape = custom
+                samples, self.custom_shape = custom
+                self.custom_samples = SampleMatrix.from_samples(samples, grid_shape=self.custom_shape)
             if self.custom_samples is None or self.custom_shape is None:
                 raise ValueError("custom dataset requires samples and grid size")
             self.samples = self.custom_samples
@@ -60,22 +78,20 @@ class MlpService:
             lr=self.lr,
             seed=self.seed,
         )
+        self.views = ViewCache()
+
+    def parameter_count(self) -> int:
+        dim = self.grid_rows * self.grid_cols
+        return self.hidden_dim * (dim + 1) + self.hidden_dim + 1
+
+    def _view(self, key: str, compute: Callable[[], Any]) -> Any:
+        """key's view of the current model, recomputed only after its weights change."""
+        return self.views.get(self.model.version, key, compute)
 
-    def snapshot(self) -> Dict[str, Any]:
-        templates = [reshape_template(row, self.grid_rows, self.grid_cols) for row in self.model.hidden.W]
-        evals = []
-        for sample in self.samples:
-            p_hat = self.model.forward(sample["x"])
-            evals.append(
-                {
-                    "x": sample["x"],
-                    "y": sample["y"],
-                    "p_hat": p_hat,
-                    "pred": _pred_from_prob(p_hat),
-                }
-            )
+    def snapshot(self, fields: AbstractSet[str] | None = None) -> Dict[str, Any]:
+        """Current state; fields (a subset of SNAPSHOT_FIELDS, None = all) limits what is computed."""
         next_sample = self.samples[self.idx]
-        return {
+        snapshot: Dict[str, Any] = {
             "dataset": self.dataset,
             "grid_rows": self.grid_rows,
             "grid_cols": self.grid_cols,
@@ -86,20 +102,93 @@ class MlpService:
             "sample_count": len(self.samples),
             "next_x": next_sample["x"],
             "next_y": next_sample["y"],
-            "hidden": {
-                "weights": self.model.hidden.W,
-                "bias": self.model.hidden.b,
-                "templates": templates,
-            },
-            "output": {
+        }
+        want_weights = fields is None or "weights" in fields
+        hidden: Dict[str, Any] = {}
+        if want_weights:
+            hidden["weights"] = self.model.hidden.W
+            hidden["bias"] = self.model.hidden.b
+        if fields is None or "templates" in fields:
+            hidden["templates"] = self._view("templates", self._templates)
+        if hidden:
+            snapshot["hidden"] = hidden
+        if want_weights:
+            snapshot["output"] = {
                 "weights": self.model.output.W,
                 "bias": self.model.output.b,
-            },
-            "evals": evals,
-        }
+            }
+        if fields is None or "evals" in fields:
+            snapshot["evals"] = self._view("evals", self._evals)
+        return snapshot
+
+    def _templates(self) -> List[List[List[float]]]:
+        return [reshape_template(row, self.grid_rows, self.grid_cols) for row in self.model.hidden.W]
+
+    def _evals(self) -> List[Dict[str, Any]]:
+        return [
+            {"x": sample["x"], "y": sample["y"], "p_hat": p_hat, "pred": _pred_from_prob(p_hat)}
+            for sample, p_hat in zip(self.samples, self._eval_probs())
+        ]
 
-    def step(self) -> Tuple[Dict[str, Any], MlpInternals]:
+    def boundary(self) -> BoundarySource:
+        """p(y=+1) over the 2D input plane at the current weights; rasters are cached per version."""
+        if self.grid_rows * self.grid_cols != 2:
+            raise ValueError("boundary requires 2D inputs (grid_rows * grid_cols == 2)")
+        model = self.model
+        compute = partial(
+            mlp_probability_raster,
+            [row[:] for row in model.hidden.W],
+            model.hidden.b[:],
+            [row[:] for row in model.output.W],
+            model.output.b[:],
+        )
+        views, version = self.views, model.version
+
+        def raster(spec: RasterSpec) -> np.ndarray:
+            return views.get(version, ("boundary", spec), lambda: compute(spec))
+
+        return BoundarySource(kind="probability", version=version, raster=raster)
+
+    def _eval_probs(self) -> List[float]:
+        """p_hat for every sample in one batched forward pass over samples.X."""
+        hidden = tanh_array(self.samples.X @ np.asarray(self.model.hidden.W).T + np.asarray(self.model.hidden.b))
+        logits = hidden @ np.asarray(self.model.output.W).T + np.asarray(self.model.output.b)
+        return sigmoid_array(logits[:, 0]).tolist()
+
+    def step(
+        self,
+        fields: AbstractSet[str] | None = None,
+        need_internals: bool = True,
+    ) -> Tuple[Dict[str, Any], MlpInternals | None]:
+        """One SGD step; internals are recorded (weights copied) only if need_internals."""
         sample = self.samples[self.idx]
-        internals = self.model.inspect_step(sample["x"], sample["y"])
+        internals: MlpInternals | None = None
+        if need_internals:
+            internals = self.model.inspect_step(sample["x"], sample["y"])
+        else:
+            self.model.step(sample["x"], sample["y"])
         self.idx = (self.idx + 1) % len(self.samples)
-        return self.snapshot(), internals
+        return self.snapshot(fields), internals
+
+    def run(self, options: RunOptions, fields: AbstractSet[str] | None = None) -> Dict[str, Any]:
+        tol = DEFAULT_RUN_TOL if options.tol is None else options.tol
+        recorder = TrajectoryRecorder(options, len(self.samples))
+        while True:
+            idx = self.idx
+            sample = self.samples[idx]
+            result = self.model.step(sample["x"], sample["y"])
+            self.idx = (idx + 1) % len(self.samples)
+            done = recorder.advance(settled=result.loss < tol)
+            if recorder.should_keep(done):
+                recorder.add(
+                    idx=idx,
+                    loss=result.loss,
+                    p_hat=result.p_hat,
+                    hidden_W=[row[:] for row in self.model.hidden.W],
+                    hidden_b=self.model.hidden.b[:],
+                    out_W=[row[:] for row in self.model.output.W],
+                    out_b=self.model.output.b[:],
+                )
+            if done:
+                break
+        return {**self.snapshot(fields), "trajectory": recorder.to_dict()}
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
 
+import numpy as np
+
+from backend.core.averaged_perceptron import AveragedPerceptron
 from backend.core.datasets import make_or_dataset_pm1, make_xor_dataset_pm1
+from backend.core.kernel_perceptron import KernelPerceptron, KernelSpec
 from backend.core.perceptron import Perceptron
+from backend.core.sample_matrix import SampleMatrix
+from backend.services.trajectory import RunOptions, TrajectoryRecorder
+from backend.services.view_cache import ViewCache
+from backend.viz.viz_boundary import BoundarySource, RasterSpec, kernel_score_raster, linear_score_raster
+
+VARIANTS = ("classic", "averaged", "kernel")
+_VARIANT_ERROR = "variant must be 'classic', 'averaged', or 'kernel'"
 
 
 class PerceptronService:
-    def __init__(self, dataset: str = "or", lr: float = 1.0, seed: int | None = 0) -> None:
+    def __init__(
+        self,
+        dataset: str = "or",
+        lr: float = 1.0,
+        seed: int | None = 0,
+        variant: str = "classic",
+        kernel: KernelSpec | None = None,
+    ) -> None:
+        if variant not in VARIANTS:
+            raise ValueError(_VARIANT_ERROR)
         self.lr = lr
         self.seed = seed
-        self.custom_samples: List[Dict[str, Any]] | None = None
+        self.variant = variant
+        self.kernel = kernel or KernelSpec()
+        self.custom_samples: SampleMatrix | None = None
         self.custom_shape: Tuple[int, int] | None = None
         self.set_dataset(dataset)
 
@@ -18,7 +41,18 @@ class PerceptronService:
         self.lr = lr
         self.perceptron.lr = lr
 
-    def set_dataset(self, name: str, custom: Tuple[List[Dict[str, Any]], Tuple[int, int]] | None = None) -> None:
+    def set_variant(self, variant: str, kernel: Mapping[str, Any] | None = None) -> None:
+        """Switch the model variant (and kernel settings); a real change restarts training."""
+        if variant not in VARIANTS:
+            raise ValueError(_VARIANT_ERROR)
+        spec = self.kernel if kernel is None else KernelSpec.from_dict(kernel)
+        if variant == self.variant and spec == self.kernel:
+            return
+        self.kernel = spec
+        self.variant = variant
+        self.set_dataset(self.dataset)
+
+    def set_dataset(self, name: str, custom: Tuple[Sequence[Dict[str, Any]], Tuple[int, int]] | None = None) -> None:
         if name == "or":
             self.samples = make_or_dataset_pm1()
             grid_shape = (1, 2)
@@ -27,7 +61,8 @@ class PerceptronService:
             grid_shape = (1, 2)
         elif name == "custom":
             if custom is not None:
-                self.custom_samples, self.custom_shape = custom
+                samples, self.custom_shape = custom
+                self.custom_samples = SampleMatrix.from_samples(samples, grid_shape=self.custom_shape)
             if self.custom_samples is None or self.custom_shape is None:
                 raise ValueError("custom dataset requires samples and grid size")
             self.samples = self.custom_samples
@@ -37,22 +72,60 @@ class PerceptronService:
         self.dataset = name
         self.idx = 0
         self.grid_rows, self.grid_cols = grid_shape
-        self.perceptron = Perceptron(dim=self.grid_rows * self.grid_cols, lr=self.lr, seed=self.seed, init="zeros")
+        dim = self.grid_rows * self.grid_cols
+        if self.variant == "kernel":
+            self.perceptron = KernelPerceptron(self.samples, kernel=self.kernel, lr=self.lr, seed=self.seed)
+        elif self.variant == "averaged":
+            self.perceptron = AveragedPerceptron(dim=dim, lr=self.lr, seed=self.seed, init="zeros")
+        else:
+            self.perceptron = Perceptron(dim=dim, lr=self.lr, seed=self.seed, init="zeros")
+        # Boundary rasters for the current model; see boundary().
+        self.views = ViewCache()
+
+    def _train(self, idx: int, sample: Dict[str, Any]):
+        if self.variant == "kernel":
+            return self.perceptron.train_index(idx, lr=self.lr)
+        return self.perceptron.train_step(sample["x"], sample["y"], lr=self.lr)
+
+    def _weights(self) -> list | None:
+        """Primal weights; the kernel model has none (its state is alpha)."""
+        return None if self.variant == "kernel" else self.perceptron.w
+
+    def parameter_count(self) -> int:
+        """Floats held by the model: alpha per sample (kernel), w and b, plus running sums (averaged)."""
+        if self.variant == "kernel":
+            return len(self.samples) + 1
+        params = self.grid_rows * self.grid_cols + 1
+        return 2 * params if self.variant == "averaged" else params
+
+    def predictor_weights(self) -> Tuple[List[float], float]:
+        """(w, b) the model predicts with: the averaged weights for "averaged"."""
+        if self.variant == "kernel":
+            raise ValueError("kernel perceptron has no primal weights")
+        model = self.perceptron
+        if isinstance(model, AveragedPerceptron):
+            return model.averaged_weights()
+        return model.w, model.b
 
     def step(self) -> Dict[str, Any]:
         sample = self.samples[self.idx]
-        result = self.perceptron.train_step(sample["x"], sample["y"], lr=self.lr)
+        result = self._train(self.idx, sample)
         self.idx = (self.idx + 1) % len(self.samples)
         next_sample = self.samples[self.idx]
+        deltas: Dict[str, Any] = (
+            {"delta_w": None, "delta_alpha": result.delta_alpha}
+            if self.variant == "kernel"
+            else {"delta_w": result.delta_w}
+        )
         return {
-            "w": self.perceptron.w,
+            "w": self._weights(),
             "b": self.perceptron.b,
             "x": sample["x"],
             "y": sample["y"],
             "score": result.score,
             "pred": result.pred,
             "mistake": result.mistake,
-            "delta_w": result.delta_w,
+            **deltas,
             "delta_b": result.delta_b,
             "idx": self.idx,
             "dataset": self.dataset,
@@ -62,15 +135,33 @@ class PerceptronService:
             "grid_rows": self.grid_rows,
             "grid_cols": self.grid_cols,
             "sample_count": len(self.samples),
+            **self._variant_state(),
         }
 
+    def run(self, options: RunOptions) -> Dict[str, Any]:
+        recorder = TrajectoryRecorder(options, len(self.samples))
+        mistakes = 0
+        while True:
+            idx = self.idx
+            sample = self.samples[idx]
+            result = self._train(idx, sample)
+            self.idx = (idx + 1) % len(self.samples)
+            mistakes += int(result.mistake)
+            done = recorder.advance(settled=not result.mistake)
+            if recorder.should_keep(done):
+                w = self._weights()
+                recorder.add(idx=idx, mistake=result.mistake, w=None if w is None else w[:], b=self.perceptron.b)
+            if done:
+                break
+        return {**self.state(), "trajectory": {**recorder.to_dict(), "mistakes": mistakes}}
+
     def reset(self) -> Dict[str, Any]:
         self.set_dataset(self.dataset)
         return self.state()
 
     def state(self) -> Dict[str, Any]:
         return {
-            "w": self.perceptron.w,
+            "w": self._weights(),
             "b": self.perceptron.b,
             "idx": self.idx,
             "dataset": self.dataset,
@@ -80,4 +171,37 @@ class PerceptronService:
             "grid_rows": self.grid_rows,
             "grid_cols": self.grid_cols,
             "sample_count": len(self.samples),
+            **self._variant_state(),
         }
+
+    def boundary(self) -> BoundarySource:
+        """Decision scores over the 2D input plane for the predictor in use (averaged weights for
+        "averaged", the dual form for "kernel"); rasters are cached per weight version."""
+        if self.grid_rows * self.grid_cols != 2:
+            raise ValueError("boundary requires 2D inputs (grid_rows * grid_cols == 2)")
+        model = self.perceptron
+        compute: Callable[[RasterSpec], np.ndarray]
+        if isinstance(model, KernelPerceptron):
+            support = model.support
+            sv, coef, b = model.X[support], model.alpha[support] * model.y[support], model.b
+            compute = partial(kernel_score_raster, model.kernel.matrix, sv, coef, b)
+        else:
+            w, b = self.predictor_weights()
+            compute = partial(linear_score_raster, list(w), b)
+        views, version = self.views, model.version
+
+        def raster(spec: RasterSpec) -> np.ndarray:
+            return views.get(version, ("boundary", spec), lambda: compute(spec))
+
+        return BoundarySource(kind="score", version=version, raster=raster)
+
+    def _variant_state(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = {"variant": self.variant}
+        if isinstance(self.perceptron, AveragedPerceptron):
+            state["w_avg"], state["b_avg"] = self.perceptron.averaged_weights()
+        elif isinstance(self.perceptron, KernelPerceptron):
+            state["kernel"] = self.kernel.to_dict()
+            state["alpha"] = self.perceptron.alpha.tolist()
+            state["support_count"] = int(self.perceptron.support.size)
+            state["gram_cache"] = self.perceptron.cache.stats()
+        return state
@@ -0,0 +1,171 @@
+"""Session-keyed registry of isolated service instances."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, List
+import re
+import secrets
+import threading
+import time
+
+from backend.services.lms_service import LmsService
+from backend.services.mlp_service import MlpService
+from backend.services.perceptron_service import PerceptronService
+
+_SESSION_ID_RE = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+
+
+def new_session_id() -> str:
+    return secrets.token_urlsafe(16)
+
+
+def is_valid_session_id(session_id: str | None) -> bool:
+    return bool(session_id) and _SESSION_ID_RE.match(session_id) is not None
+
+
+class Session:
+    """One client's services plus the lock that serializes access to them.
+
+    Services are created on first use so a tab that only visits the LMS page
+    does not pay for a perceptron and an MLP.
+    """
+
+    def __init__(self, session_id: str, now: float) -> None:
+        self.id = session_id
+        self.lock = threading.Lock()
+        self.last_seen = now
+        self._perceptron: PerceptronService | None = None
+        self._lms: LmsService | None = None
+        self._mlp: MlpService | None = None
+
+    @property
+    def perceptron(self) -> PerceptronService:
+        if self._perceptron is None:
+            self._perceptron = PerceptronService()
+        return self._perceptron
+
+    @property
+    def lms(self) -> LmsService:
+        if self._lms is None:
+            self._lms = LmsService()
+        return self._lms
+
+    @property
+    def mlp(self) -> MlpService:
+        if self._mlp is None:
+            self._mlp = MlpService()
+        return self._mlp
+
+    def size(self) -> int:
+        """Approximate memory weight in floats: dataset cells plus model parameters across services.
+
+        A custom dataset a service keeps while showing a built-in one counts too.
+        """
+        total = 0
+        for service in (self._perceptron, self._lms, self._mlp):
+            if service is None:
+                continue
+            total += service.samples.X.size + service.parameter_count()
+            custom = service.custom_samples
+            if custom is not None and custom is not service.samples:
+                total += custom.X.size
+        return total
+
+
+class SessionRegistry:
+    """LRU of sessions bounded by count, total stored floats (see Session.size) and idle TTL."""
+
+    def __init__(
+        self,
+        max_sessions: int = 256,
+        max_floats: int = 32_000_000,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_sessions <= 0:
+            raise ValueError("max_sessions must be positive")
+        if max_floats <= 0:
+            raise ValueError("max_floats must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self.max_sessions = max_sessions
+        self.max_floats = max_floats
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_size = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    @property
+    def total_size(self) -> int:
+        return self._total_size
+
+    def get_or_create(self, session_id: str | None) -> Session:
+        """Return the live session for session_id, creating it if needed.
+
+        Well-formed unknown ids (e.g. a client-generated per-tab UUID) are
+        adopted as-is; missing or malformed ids get a server-generated one.
+        """
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            if not is_valid_session_id(session_id):
+                session_id = new_session_id()
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = Session(session_id, now)
+                self._sessions[session_id] = session
+                self._sizes[session_id] = 0
+            else:
+                self._sessions.move_to_end(session_id)
+            session.last_seen = now
+            self._enforce_caps(keep=session.id)
+            return session
+
+    def touch(self, session: Session) -> None:
+        """Refresh a session's recency and memory weight after it was used."""
+        size = session.size()
+        now = self._clock()
+        with self._lock:
+            if session.id not in self._sessions:
+                return
+            session.last_seen = now
+            self._sessions.move_to_end(session.id)
+            self._total_size += size - self._sizes[session.id]
+            self._sizes[session.id] = size
+            self._enforce_caps(keep=session.id)
+
+    def drop(self, session_id: str) -> None:
+        with self._lock:
+            self._remove(session_id)
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._sessions)
+
+    def _remove(self, session_id: str) -> None:
+        if session_id in self._sessions:
+            del self._sessions[session_id]
+            self._total_size -= self._sizes.pop(session_id)
+
+    def _expire(self, now: float) -> None:
+        while self._sessions:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+            if now - oldest.last_seen < self.ttl_seconds:
+                break
+            self._remove(oldest_id)
+
+    def _enforce_caps(self, keep: str) -> None:
+        while len(self._sessions) > self.max_sessions or self._total_size > self.max_floats:
+            victim = next((sid for sid in self._sessions if sid != keep), None)
+            if victim is None:
+                break
+            self._remove(victim)
@@ -0,0 +1,66 @@
+"""Compact, column-oriented trajectories for multi-step training runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass
+class RunOptions:
+    """How many steps to run server-side and which states to keep.
+
+    A step is "settled" when it leaves the model unchanged (perceptron: no
+    mistake) or nearly so (LMS: parameter change below tol, MLP: loss below
+    tol). With until_converged, the run stops after a full pass of settled
+    steps, or after n steps, whichever comes first. settled_streak carries
+    the settled steps that ended a previous run (the trajectory's
+    "settled_streak"), so a run split into chunks, such as a live stream,
+    converges at the same step as one long run.
+    """
+
+    n: int
+    stride: int = 1
+    until_converged: bool = False
+    tol: float | None = None
+    settled_streak: int = 0
+
+
+class TrajectoryRecorder:
+    """Collects per-step values as parallel arrays, keeping every stride-th step.
+
+    The final step is always kept so a client can land on the exact end state.
+    """
+
+    def __init__(self, options: RunOptions, sample_count: int) -> None:
+        self.options = options
+        self.sample_count = sample_count
+        self.columns: Dict[str, List[Any]] = {"step": []}
+        self.steps = 0
+        self.converged = False
+        self._settled_streak = options.settled_streak
+
+    def advance(self, settled: bool) -> bool:
+        """Count one executed step and return True if the run should stop."""
+        self.steps += 1
+        self._settled_streak = self._settled_streak + 1 if settled else 0
+        if self.options.until_converged and self._settled_streak >= self.sample_count:
+            self.converged = True
+        return self.converged or self.steps >= self.options.n
+
+    def should_keep(self, done: bool) -> bool:
+        return done or self.steps % self.options.stride == 0
+
+    def add(self, **values: Any) -> None:
+        self.columns["step"].append(self.steps)
+        for key, value in values.items():
+            self.columns.setdefault(key, []).append(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "steps": self.steps,
+            "stride": self.options.stride,
+            "converged": self.converged,
+            "settled_streak": self._settled_streak,
+            **self.columns,
+        }
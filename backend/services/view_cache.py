@@ -0,0 +1,55 @@
+"""Derived views of a model, cached against its weight version.
+
+Models bump an integer `version` on every parameter update. A view (per-
+sample evals, weight templates, decision rasters, ...) computed at one
+version stays valid until the version moves, so repeated reads between
+training steps are dictionary lookups. Owners start a fresh cache when
+they swap the model or the data the views depend on.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable
+import threading
+
+
+class ViewCache:
+    """Views for the newest weight version seen; older ones are dropped.
+
+    A read at an older version (e.g. a streamed response that captured the
+    weights before a later step) is computed but not kept.
+    """
+
+    def __init__(self) -> None:
+        self.version: int | None = None
+        self._views: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def get(self, version: int, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """The view key at version, computing (and keeping) it if missing."""
+        with self._lock:
+            if self.version is None or version > self.version:
+                self._views.clear()
+                self.version = version
+            elif version == self.version and key in self._views:
+                self.hits += 1
+                return self._views[key]
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            if version == self.version:
+                self._views[key] = value
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._views.clear()
+            self.version = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"version": self.version, "views": len(self), "hits": self.hits, "misses": self.misses}
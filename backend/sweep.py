@@ -0,0 +1,223 @@
+"""Grid sweeps over runner.run_training, fanned out over a process pool."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, TextIO
+
+from backend.runner import DATASETS, ENGINES, run_training
+
+FORMATS = ("csv", "json")
+RESULT_FIELDS = (
+    "index",
+    "dataset",
+    "lr",
+    "seed",
+    "epochs",
+    "init",
+    "engine",
+    "final_mistakes",
+    "total_mistakes",
+    "final_accuracy",
+    "early_stop",
+    "converged_epoch",
+    "stop_reason",
+    "stop_epoch",
+    "seconds",
+)
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    index: int
+    dataset: str
+    lr: float
+    seed: int
+    epochs: int
+    init: str = "zeros"
+    engine: str = "python"
+    early_stop: bool = True
+
+
+def expand_grid(
+    datasets: Sequence[str],
+    lrs: Sequence[float],
+    seeds: Sequence[int],
+    epochs: Sequence[int],
+    inits: Sequence[str] = ("zeros",),
+    engine: str = "python",
+    early_stop: bool = True,
+) -> List[SweepConfig]:
+    """Cartesian product of the axes, in a fixed order (dataset varies slowest, init fastest).
+
+    Every config carries its own seed, and run_training builds a private
+    random.Random from it, so a config's result does not depend on which
+    worker runs it or in what order.
+    """
+    for name in datasets:
+        if name not in DATASETS:
+            raise ValueError(f"unknown dataset: {name}")
+    if engine not in ENGINES:
+        raise ValueError("engine must be one of: python, numpy")
+    if any(e <= 0 for e in epochs):
+        raise ValueError("epochs must be positive")
+    if any(init not in ("zeros", "random") for init in inits):
+        raise ValueError("init must be 'zeros' or 'random'")
+    axes = itertools.product(datasets, lrs, seeds, epochs, inits)
+    return [
+        SweepConfig(index=i, dataset=d, lr=lr, seed=seed, epochs=ep, init=init, engine=engine, early_stop=early_stop)
+        for i, (d, lr, seed, ep, init) in enumerate(axes)
+    ]
+
+
+def run_config(config: SweepConfig) -> Dict[str, Any]:
+    start = time.perf_counter()
+    stats = run_training(
+        config.dataset,
+        config.epochs,
+        config.lr,
+        seed=config.seed,
+        engine=config.engine,
+        init=config.init,
+        early_stop=config.early_stop,
+    )
+    seconds = time.perf_counter() - start
+    mistakes = stats["mistakes"]
+    row = asdict(config)
+    row.update(
+        final_mistakes=int(mistakes[-1]),
+        total_mistakes=int(sum(mistakes)),
+        final_accuracy=float(stats["accuracy"][-1]),
+        converged_epoch=stats["converged_epoch"],
+        stop_reason=stats["stop_reason"],
+        stop_epoch=stats["stop_epoch"],
+        seconds=seconds,
+    )
+    return row
+
+
+def _run_batch(configs: List[SweepConfig]) -> List[Dict[str, Any]]:
+    return [run_config(config) for config in configs]
+
+
+def _batches(configs: Sequence[SweepConfig], size: int) -> Iterator[List[SweepConfig]]:
+    for start in range(0, len(configs), size):
+        yield list(configs[start:start + size])
+
+
+def run_sweep(
+    configs: Sequence[SweepConfig],
+    workers: int | None = None,
+    batch_size: int | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one result row per config, in config order, as batches complete.
+
+    Configs are shipped to workers in batches so per-task IPC does not
+    dominate tiny runs; the default gives each worker about eight batches,
+    which keeps all cores busy without holding results back for long.
+    workers=None uses every core; workers=1 runs in-process. Arguments are
+    checked on the call, before the first row is requested.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if batch_size is None:
+        batch_size = max(1, min(256, len(configs) // (workers * 8)))
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    return _iter_sweep(configs, workers, batch_size)
+
+
+def _iter_sweep(configs: Sequence[SweepConfig], workers: int, batch_size: int) -> Iterator[Dict[str, Any]]:
+    if workers == 1:
+        for config in configs:
+            yield run_config(config)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for rows in pool.map(_run_batch, _batches(configs, batch_size)):
+            yield from rows
+
+
+def write_results(rows: Iterable[Dict[str, Any]], out: TextIO, fmt: str = "csv") -> int:
+    """Stream rows to out as they arrive (CSV with header, or one JSON array); return the count."""
+    if fmt not in FORMATS:
+        raise ValueError("format must be one of: csv, json")
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            out.flush()
+            count += 1
+        return count
+    out.write("[")
+    for row in rows:
+        out.write(("\n  " if count == 0 else ",\n  ") + json.dumps(row))
+        out.flush()
+        count += 1
+    out.write("\n]\n" if count else "]\n")
+    return count
+
+
+def _seed_list(seeds: Sequence[int] | None, seed_count: int | None) -> List[int]:
+    if seed_count is not None:
+        if seed_count <= 0:
+            raise ValueError("seed-count must be positive")
+        return list(range(seed_count))
+    return list(seeds or [0])
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="perceptron-runner sweep", description="Parallel perceptron grid sweep")
+    parser.add_argument("--datasets", nargs="+", default=["or"], choices=DATASETS.keys())
+    parser.add_argument("--lrs", nargs="+", type=float, default=[1.0])
+    parser.add_argument("--seeds", nargs="+", type=int, default=None)
+    parser.add_argument("--seed-count", type=int, default=None, help="use seeds 0..N-1 instead of --seeds")
+    parser.add_argument("--epochs", nargs="+", type=int, default=[10])
+    parser.add_argument("--inits", nargs="+", default=["zeros"], choices=("zeros", "random"))
+    parser.add_argument("--engine", default="python", choices=ENGINES)
+    parser.add_argument("--no-early-stop", dest="early_stop", action="store_false")
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--format", default="csv", choices=FORMATS)
+    parser.add_argument("--output", default="-", help="file path, or - for stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        configs = expand_grid(
+            args.datasets,
+            args.lrs,
+            _seed_list(args.seeds, args.seed_count),
+            args.epochs,
+            inits=args.inits,
+            engine=args.engine,
+            early_stop=args.early_stop,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    start = time.perf_counter()
+    try:
+        rows = run_sweep(configs, workers=args.workers, batch_size=args.batch_size)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.output == "-":
+        count = write_results(rows, sys.stdout, args.format)
+    else:
+        with open(args.output, "w", newline="") as out:
+            count = write_results(rows, out, args.format)
+    elapsed = time.perf_counter() - start
+    print(f"{count} configs in {elapsed:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
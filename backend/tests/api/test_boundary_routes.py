@@ -0,0 +1,57 @@
+import base64
+import json
+
+import numpy as np
+
+from backend.api.wire import FRAME_MEDIA_TYPE, decode_frame
+
+
+def test_mlp_boundary_raster_and_cache(client):
+    client.post("/mlp/reset", json={"dataset": "xor", "hidden_dim": 3, "seed": 1})
+    first = client.get("/mlp/boundary", params={"height": 6, "width": 5})
+    assert first.status_code == 200
+    body = first.json()
+    assert body["kind"] == "probability" and body["version"] == 0
+    values = np.array(body["values"])
+    assert values.shape == (6, 5) and ((values >= 0) & (values <= 1)).all()
+    assert client.get("/mlp/boundary", params={"height": 6, "width": 5}).content == first.content
+
+    client.post("/mlp/step", json={"fields": ["step"]})
+    moved = client.get("/mlp/boundary", params={"height": 6, "width": 5}).json()
+    assert moved["version"] == 1 and moved["values"] != body["values"]
+
+    quantized = client.get("/mlp/boundary", params={"height": 6, "width": 5, "quantize": True}).json()
+    codes = np.frombuffer(base64.b64decode(quantized["data"]), dtype=np.uint8).reshape(6, 5)
+    assert np.abs(codes / 255.0 - np.array(moved["values"])).max() <= 0.5 / 255 + 1e-12
+
+
+def test_boundary_progressive_levels(client):
+    client.post("/mlp/reset", json={"dataset": "or"})
+    with client.stream("GET", "/mlp/boundary", params={"height": 32, "width": 32, "progressive": True}) as response:
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+    assert [(line["level"], line["height"]) for line in lines] == [(0, 8), (1, 16), (2, 32)]
+    assert all(line["levels"] == 3 for line in lines)
+
+
+def test_perceptron_boundary_variants(client):
+    client.post("/reset", json={"dataset": "or"})
+    client.post("/step", json={})
+    frame = client.get("/boundary", params={"height": 4, "width": 4}, headers={"Accept": FRAME_MEDIA_TYPE})
+    payload = decode_frame(frame.content)
+    assert payload["kind"] == "score" and payload["version"] == 1
+    assert np.array(payload["values"]).shape == (4, 4)
+
+    client.post("/step", json={"variant": "kernel", "dataset": "xor"})
+    for _ in range(12):
+        client.post("/step", json={})
+    kernel = client.get("/boundary", params={"height": 3, "width": 3}).json()
+    signs = np.sign(np.array(kernel["values"]))
+    assert signs[0, 0] == signs[2, 2] == -1 and signs[0, 2] == signs[2, 0] == 1
+
+
+def test_boundary_rejects_bad_requests(client):
+    client.post("/reset", json={"dataset": "custom", "grid_rows": 2, "grid_cols": 2, "samples": [{"x": [1, -1, 1, -1], "y": 1}]})
+    assert "2D inputs" in client.get("/boundary").json()["detail"]
+    assert client.get("/mlp/boundary", params={"width": 1}).status_code == 400
+    assert client.get("/mlp/boundary", params={"x_min": 2, "x_max": 1}).status_code == 400
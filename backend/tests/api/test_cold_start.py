@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+
+def test_api_import_skips_plotting_modules():
+    code = (
+        "import sys, backend.api_app; "
+        "print(sorted(m for m in sys.modules if m.startswith('matplotlib') or m == 'backend.viz.viz_mlp_internals'))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_package_exports_resolve():
+    import backend.api as api
+    import backend.viz as viz
+
+    assert api.mlp_router.routes
+    assert callable(viz.plot_heatmap)
+    assert "plot_heatmap" in viz.__all__
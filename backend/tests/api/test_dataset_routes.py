@@ -0,0 +1,93 @@
+XOR_GRID = {
+    "grid_rows": 1,
+    "grid_cols": 2,
+    "samples": [
+        {"x": [-1, -1], "y": -1},
+        {"x": [-1, 1], "y": 1},
+        {"x": [1, -1], "y": 1},
+        {"x": [1, 1], "y": -1},
+    ],
+}
+
+
+def _upload(client, payload=XOR_GRID):
+    return client.post("/datasets", json=payload)
+
+
+def test_upload_returns_stable_id(client):
+    first = _upload(client)
+    assert first.status_code in (200, 201)
+    body = first.json()
+    assert body["dataset_id"].startswith("ds_")
+    assert body["sample_count"] == 4
+    assert (body["grid_rows"], body["grid_cols"]) == (1, 2)
+
+    as_grid = {**XOR_GRID, "samples": [{"grid": [s["x"]], "y": s["y"]} for s in XOR_GRID["samples"]]}
+    second = _upload(client, as_grid)
+    assert second.status_code == 200
+    assert second.json()["dataset_id"] == body["dataset_id"]
+    assert second.json()["created"] is False
+
+    info = client.get(f"/datasets/{body['dataset_id']}").json()
+    assert info["sample_count"] == 4
+
+
+def test_upload_validates(client):
+    assert _upload(client, {**XOR_GRID, "grid_rows": 9}).status_code == 400
+    assert _upload(client, {**XOR_GRID, "samples": [{"x": [0, 1], "y": 1}]}).status_code == 400
+    assert client.get("/datasets/ds_missing").status_code == 404
+
+
+def test_endpoints_accept_dataset_id(client):
+    dataset_id = _upload(client).json()["dataset_id"]
+
+    reset = client.post("/reset", json={"dataset_id": dataset_id}).json()
+    assert reset["dataset"] == "custom"
+    assert reset["sample_count"] == 4
+
+    lms = client.post("/lms/reset", json={"dataset": "custom", "dataset_id": dataset_id}).json()
+    assert lms["sample_count"] == 4
+
+    mlp = client.post("/mlp/reset", json={"dataset_id": dataset_id}).json()
+    assert mlp["dataset"] == "custom"
+    assert mlp["sample_count"] == 4
+
+    surface = client.post("/error-surface", json={"dataset_id": dataset_id, "steps": 5}).json()
+    assert surface["dataset"] == "custom"
+    internals = client.post("/mlp-internals", json={"dataset_id": dataset_id}).json()
+    assert internals["sample_count"] == 4
+
+
+def test_dataset_id_errors(client):
+    assert client.post("/reset", json={"dataset_id": "ds_missing"}).status_code == 400
+    dataset_id = _upload(client).json()["dataset_id"]
+    assert client.post("/reset", json={"dataset": "xor", "dataset_id": dataset_id}).status_code == 400
+
+
+def test_lms_rejects_non_2d_dataset(client):
+    payload = {"grid_rows": 2, "grid_cols": 2, "samples": [{"x": [1, 1, -1, -1], "y": 1}]}
+    dataset_id = _upload(client, payload).json()["dataset_id"]
+    assert client.post("/lms/reset", json={"dataset_id": dataset_id}).status_code == 400
+
+
+def test_delete_dataset(client):
+    payload = {"grid_rows": 1, "grid_cols": 3, "samples": [{"x": [1, -1, 1], "y": -1}]}
+    dataset_id = _upload(client, payload).json()["dataset_id"]
+    assert client.delete(f"/datasets/{dataset_id}").json()["deleted"] is True
+    assert client.delete(f"/datasets/{dataset_id}").status_code == 404
+
+
+def test_delete_releases_only_the_callers_reference(client):
+    payload = {"grid_rows": 1, "grid_cols": 3, "samples": [{"x": [-1, 1, 1], "y": 1}]}
+    first, second = {"X-Session-Id": "datasets-owner-1"}, {"X-Session-Id": "datasets-owner-2"}
+    dataset_id = client.post("/datasets", json=payload, headers=first).json()["dataset_id"]
+    client.post("/datasets", json=payload, headers=second)
+    assert client.delete(f"/datasets/{dataset_id}", headers={"X-Session-Id": "datasets-stranger"}).status_code == 404
+
+    released = client.delete(f"/datasets/{dataset_id}", headers=first).json()
+    assert (released["deleted"], released["references"]) == (False, 1)
+    assert client.post("/reset", json={"dataset_id": dataset_id}, headers=second).json()["sample_count"] == 1
+    assert client.delete(f"/datasets/{dataset_id}", headers=first).status_code == 404
+
+    assert client.delete(f"/datasets/{dataset_id}", headers=second).json()["deleted"] is True
+    assert client.get(f"/datasets/{dataset_id}").status_code == 404
@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_error_surface(client):
     surface = client.post(
         "/error-surface",
@@ -10,6 +13,13 @@ def test_error_surface(client):
     assert surface["sample_count"] == 4
     assert len(surface["grid"]) == 5
     assert all(len(row) == 5 for row in surface["grid"])
+    assert set(surface["minimum"]) == {"w1", "w2", "loss"}
+
+
+def test_error_surface_rejects_huge_grids(client):
+    response = client.post("/error-surface", json={"dataset": "or", "steps": 100_000})
+    assert response.status_code == 400
+    assert "steps must be between 2 and 512" in response.json()["detail"]
 
 
 def test_mlp_internals(client):
@@ -35,3 +45,76 @@ def test_mlp_internals(client):
     assert len(gradients["hidden_W"]) == 3
     assert len(gradients["hidden_W"][0]) == 2
     assert len(gradients["templates"]) == 3
+    too_wide = client.post("/mlp-internals", json={"dataset": "xor", "hidden_dim": 10**6})
+    assert too_wide.status_code == 400
+
+
+def test_detect_with_template_and_session_models(client):
+    board = [[-1] * 6 for _ in range(5)]
+    board[2][3] = 1
+    board[2][4] = 1
+    response = client.post(
+        "/detect", json={"board": board, "source": "template", "template": [[1, 1]], "bias": -1, "top_k": 1}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["template_rows"], data["template_cols"]) == (1, 2)
+    assert len(data["score_map"]) == 5 and len(data["score_map"][0]) == 5
+    assert data["peaks"] == [{"row": 2, "col": 3, "score": 1.0}]
+    assert data["method"] == "summed_area"
+
+    headers = {"X-Session-Id": "detect-session-1"}
+    client.post("/step", json={"n": 8}, headers=headers)
+    perceptron = client.post("/detect", json={"board": board}, headers=headers).json()
+    assert perceptron["source"] == "perceptron"
+    state = client.get("/state", headers=headers).json()
+    w1, w2 = state["w"]
+    assert perceptron["score_map"][2][3] == pytest.approx(w1 + w2 + state["b"])
+
+    mlp = client.post("/detect", json={"board": board, "source": "mlp", "include_hidden": True}, headers=headers)
+    assert mlp.status_code == 200
+    assert len(mlp.json()["hidden_maps"]) == 2
+    assert all(0.0 <= p <= 1.0 for row in mlp.json()["score_map"] for p in row)
+
+
+def test_detect_validation(client):
+    assert client.post("/detect", json={"board": [[1, 1], [1]]}).status_code == 400
+    assert client.post("/detect", json={"board": [[1]], "source": "nope"}).status_code == 400
+    assert client.post("/detect", json={"board": [[1]], "source": "template", "template": [[1, 1]]}).status_code == 400
+    not_bool = client.post("/detect", json={"board": [[1]], "include_hidden": "false"})
+    assert not_bool.status_code == 400
+    assert not_bool.json()["detail"] == "include_hidden must be true or false"
+    big = [[1] * 513]
+    assert client.post("/detect", json={"board": big}).status_code == 400
+
+
+def test_detect_releases_session_lock_before_scoring(client, monkeypatch):
+    from backend.api import deps
+
+    headers = {"X-Session-Id": "detect-lock-1"}
+    client.post("/step", json={"n": 4}, headers=headers)
+    session = deps.registry.get_or_create("detect-lock-1")
+    real_run = deps.cpu_pool.run
+    held = []
+
+    async def run(endpoint, fn, *args):
+        held.append(session.lock.locked())
+        return await real_run(endpoint, fn, *args)
+
+    monkeypatch.setattr(deps.cpu_pool, "run", run)
+    response = client.post("/detect", json={"board": [[1, -1], [-1, 1]]}, headers=headers)
+    assert response.status_code == 200
+    assert held == [False]
+
+
+def test_detect_scores_averaged_perceptron_with_averaged_weights(client):
+    headers = {"X-Session-Id": "detect-averaged-1"}
+    client.post("/reset", json={"dataset": "xor", "variant": "averaged"}, headers=headers)
+    state = client.post("/step", json={"n": 7}, headers=headers).json()
+    assert state["w_avg"] != state["w"]
+    board = [[1, -1, 1], [-1, 1, 1]]
+    scores = client.post("/detect", json={"board": board}, headers=headers).json()["score_map"]
+    (w1, w2), b = state["w_avg"], state["b_avg"]
+    for r, row in enumerate(board):
+        for c in range(len(row) - 1):
+            assert scores[r][c] == pytest.approx(w1 * row[c] + w2 * row[c + 1] + b)
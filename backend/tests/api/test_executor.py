@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api.executor import CpuExecutor, CpuPool, EndpointLimiter, Overloaded
+
+
+def _slow_square(x):
+    time.sleep(0.05)
+    return x * x
+
+
+def test_limiter_rejects_when_slots_and_queue_are_full():
+    async def scenario():
+        limiter = EndpointLimiter("demo", max_concurrent=1, max_queue=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        assert limiter.active == 1 and limiter.waiting == 1
+        with pytest.raises(Overloaded):
+            async with limiter.slot():
+                pass
+        release.set()
+        await asyncio.gather(holder, waiter)
+        return limiter.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["rejected"] == 1
+    assert stats["active"] == 0 and stats["waiting"] == 0
+
+
+def test_pool_runs_off_loop_and_returns_503_when_busy():
+    pool = CpuPool(executor=CpuExecutor(kind="thread", workers=2), limits={"square": (1, 0)})
+
+    async def scenario():
+        first = asyncio.create_task(pool.run("square", _slow_square, 3))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run("square", _slow_square, 4)
+        return await first, exc_info.value
+
+    try:
+        result, error = asyncio.run(scenario())
+    finally:
+        pool.executor.shutdown()
+    assert result == 9
+    assert error.status_code == 503
+    assert error.headers["Retry-After"] == "1"
+
+
+def test_executor_kind_validation(monkeypatch):
+    monkeypatch.setenv("PERCEPTRON_CPU_EXECUTOR", "gpu")
+    with pytest.raises(ValueError):
+        CpuExecutor()
+    monkeypatch.setenv("PERCEPTRON_CPU_EXECUTOR", "thread")
+    monkeypatch.setenv("PERCEPTRON_CPU_WORKERS", "3")
+    executor = CpuExecutor()
+    assert executor.kind == "thread" and executor.workers == 3
+
+
+def test_executor_stats_endpoint(client):
+    client.post("/error-surface", json={"dataset": "or", "steps": 3, "b": 0.5})
+    stats = client.get("/executor-stats").json()
+    assert stats["executor"] in ("process", "thread")
+    assert set(stats["endpoints"]) >= {"error-surface", "mlp-internals", "detect", "train"}
@@ -0,0 +1,39 @@
+from backend.api.deps import jobs
+
+
+def test_submit_poll_and_cancel(client):
+    created = client.post("/jobs", json={"model": "mlp", "dataset": "xor", "epochs": 20, "hidden_dim": 3})
+    assert created.status_code == 202
+    job_id = created.json()["job_id"]
+    assert created.json()["spec"]["model"] == "mlp"
+
+    jobs.wait(job_id, timeout=60)
+    done = client.get(f"/jobs/{job_id}").json()
+    assert done["status"] == "done"
+    assert len(done["curves"]["loss"]) == 20
+    assert set(done["weights"]) == {"hidden_W", "hidden_b", "out_W", "out_b"}
+    assert any(job["job_id"] == job_id for job in client.get("/jobs").json())
+
+    cancelled = client.post(f"/jobs/{job_id}/cancel").json()
+    assert cancelled["status"] == "done"
+
+
+def test_job_accepts_dataset_id(client):
+    upload = client.post(
+        "/datasets",
+        json={"grid_rows": 1, "grid_cols": 2, "samples": [{"x": [1, 1], "y": 1}, {"x": [-1, -1], "y": -1}]},
+    ).json()
+    job_id = client.post("/jobs", json={"dataset_id": upload["dataset_id"], "epochs": 10}).json()["job_id"]
+    job = jobs.wait(job_id, timeout=60).to_dict()
+    assert job["sample_count"] == 2
+    assert job["stop_reason"] == "converged"
+
+
+def test_job_errors(client):
+    assert client.post("/jobs", json={"model": "svm"}).status_code == 400
+    assert client.post("/jobs", json={"epochs": "many"}).status_code == 400
+    not_bool = client.post("/jobs", json={"early_stop": "false"})
+    assert not_bool.status_code == 400
+    assert not_bool.json()["detail"] == "early_stop must be true or false"
+    assert client.get("/jobs/missing").status_code == 404
+    assert client.post("/jobs/missing/cancel").status_code == 404
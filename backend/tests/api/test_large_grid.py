@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from backend.api.utils import MAX_REQUEST_CELLS, normalize_samples
+from backend.nn.grid_mlp import downsample_template
+
+
+def _dataset(side, count=4, seed=0):
+    rng = random.Random(seed)
+    return {
+        "dataset": "custom",
+        "large_grid": True,
+        "grid_rows": side,
+        "grid_cols": side,
+        "samples": [
+            {"grid": [[rng.choice((-1, 1)) for _ in range(side)] for _ in range(side)], "y": (-1) ** i}
+            for i in range(count)
+        ],
+    }
+
+
+def test_large_grids_need_opt_in(client):
+    body = _dataset(8)
+    body.pop("large_grid")
+    response = client.post("/reset", json=body)
+    assert response.status_code == 400
+    assert "between 1 and 5" in response.json()["detail"]
+    too_big = client.post("/reset", json={**_dataset(2), "grid_rows": 129, "grid_cols": 2})
+    assert "between 1 and 128" in too_big.json()["detail"]
+
+
+def test_perceptron_large_grid_compact_and_full(client):
+    headers = {"X-Session-Id": "large-grid-perceptron"}
+    reset = client.post("/reset", json=_dataset(64), headers=headers).json()
+    assert reset["payload"] == "compact"
+    assert "w" not in reset
+    assert len(reset["w_preview"]) == 16 and len(reset["w_preview"][0]) == 16
+
+    step = client.post("/step", json={"preview_side": 8}, headers=headers).json()
+    assert len(step["x_preview"]) == 8
+    assert step["delta_w_preview"] is not None
+
+    run = client.post("/step", json={"n": 4}, headers=headers).json()
+    assert "w" not in run["trajectory"]
+    assert len(run["trajectory"]["b"]) == 4
+
+    full = client.post("/step", json={"full_weights": True}, headers=headers).json()
+    assert len(full["w"]) == 64 * 64
+    state = client.get("/state", params={"full_weights": "true"}, headers=headers).json()
+    assert len(state["w"]) == 64 * 64
+    assert client.post("/step", json={"preview_side": 0}, headers=headers).status_code == 400
+
+
+def test_mlp_large_grid_compact_payload(client):
+    headers = {"X-Session-Id": "large-grid-mlp-01"}
+    reset = client.post("/mlp/reset", json={**_dataset(40), "hidden_dim": 3}, headers=headers).json()
+    assert reset["payload"] == "compact"
+    assert "weights" not in reset["hidden"]
+    assert len(reset["hidden"]["templates"]) == 3
+    assert len(reset["hidden"]["templates"][0]) == 14
+    assert all("x" not in item for item in reset["evals"])
+
+    step = client.post("/mlp/step", json={}, headers=headers).json()
+    assert step["step"]["payload"] == "compact"
+    assert "weights_before" not in step["step"]["hidden"]
+    assert len(step["step"]["gradients"]["templates"]) == 3
+    run = client.post("/mlp/step", json={"n": 3}, headers=headers).json()
+    assert "hidden_W" not in run["trajectory"]
+    sparse = client.post("/mlp/step", json={"fields": ["templates"]}, headers=headers).json()
+    assert set(sparse["hidden"]) == {"templates"} and len(sparse["hidden"]["templates"][0]) == 14
+    assert "evals" not in sparse and "step" not in sparse
+
+    internals = client.post("/mlp-internals", json={**_dataset(24), "hidden_dim": 2}).json()
+    assert internals["payload"] == "compact"
+    assert len(internals["x_preview"]) == 12
+
+
+def test_small_grids_keep_full_payloads(client):
+    state = client.get("/state").json()
+    assert "payload" not in state and "w" in state
+    assert "weights" in client.get("/mlp/state").json()["hidden"]
+
+
+def test_request_size_limit():
+    side = 128
+    count = MAX_REQUEST_CELLS // (side * side) + 1
+    with pytest.raises(ValueError, match="too large"):
+        normalize_samples([{"x": [1] * (side * side), "y": 1}] * count, side, side)
+    with pytest.raises(ValueError, match="-1 or \\+1"):
+        normalize_samples([{"x": ["1", 1], "y": 1}], 1, 2)
+    matrix = normalize_samples([{"grid": [[1, -1], [-1, 1]], "y": -1}], 2, 2)
+    assert matrix.X.tolist() == [[1.0, -1.0, -1.0, 1.0]]
+
+
+def test_downsample_template_block_means():
+    assert downsample_template(list(range(16)), 4, 4, 2) == [[2.5, 4.5], [10.5, 12.5]]
+    assert downsample_template([1, 2, 3], 1, 3, 2) == [[1.5, 3.0]]
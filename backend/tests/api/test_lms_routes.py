@@ -31,3 +31,13 @@ def test_lms_custom_reset(client):
     ).json()
     assert custom["dataset"] == "custom"
     assert custom["sample_count"] == 2
+
+
+def test_lms_multi_step_trajectory(client):
+    run = client.post("/lms/step", json={"n": 8}).json()
+    traj = run["trajectory"]
+    assert traj["steps"] == 8
+    assert traj["idx"] == [0, 1, 2, 3, 0, 1, 2, 3]
+    assert len(traj["error"]) == 8
+    assert traj["w"][-1] == run["w"]
+    assert client.post("/lms/step", json={"n": "many"}).status_code == 400
@@ -14,3 +14,85 @@ def test_mlp_state_step_reset(client):
     assert "step" in step
     assert step["step"]["dataset"] == "or"
     assert step["step"]["hidden_dim"] == 3
+
+
+def test_mlp_multi_step_trajectory(client):
+    client.post("/mlp/reset", json={"dataset": "xor", "hidden_dim": 2, "seed": 0})
+    run = client.post("/mlp/step", json={"n": 6, "stride": 2}).json()
+    traj = run["trajectory"]
+    assert traj["step"] == [2, 4, 6]
+    assert len(traj["loss"]) == 3
+    assert traj["hidden_W"][-1] == run["hidden"]["weights"]
+    assert traj["out_b"][-1] == run["output"]["bias"]
+    assert run["idx"] == 2
+
+
+def test_mlp_step_fields_limit_sections(client):
+    headers = {"X-Session-Id": "mlp-fields"}
+    client.post("/mlp/reset", json={"dataset": "xor", "hidden_dim": 2, "seed": 0}, headers=headers)
+    step = client.post("/mlp/step", json={"fields": ["step"]}, headers=headers).json()
+    assert step["idx"] == 1 and "next_x" in step
+    assert not {"hidden", "output", "evals"} & set(step)
+    assert step["step"]["loss"] > 0
+    assert not {"hidden", "output", "gradients"} & set(step["step"])
+
+    step = client.post("/mlp/step", json={"fields": "evals,gradients"}, headers=headers).json()
+    assert len(step["evals"]) == 4 and "hidden" not in step
+    assert set(step["step"]["gradients"]) == {"hidden_W", "hidden_b", "out_W", "out_b"}
+
+    full = client.post("/mlp/step", json={}, headers=headers).json()
+    selected = client.post("/mlp/step", json={"fields": ["templates", "internals"]}, headers=headers).json()
+    assert set(selected["hidden"]) == {"templates"}
+    assert set(selected["step"]["hidden"]) == set(full["step"]["hidden"])
+    assert set(selected["step"]["gradients"]) == {"templates"}
+
+
+def test_mlp_step_without_step_fields_skips_inspection(client, monkeypatch):
+    from backend.nn.mlp import MlpTwoLayer
+
+    headers = {"X-Session-Id": "mlp-fields-plain"}
+    client.post("/mlp/reset", json={"dataset": "xor", "hidden_dim": 2, "seed": 0}, headers=headers)
+    inspected = client.post("/mlp/step", json={"fields": ["internals", "weights"]}, headers=headers).json()
+    client.post("/mlp/reset", json={"dataset": "xor", "hidden_dim": 2, "seed": 0}, headers=headers)
+
+    def no_inspect(self, x, y):
+        raise AssertionError("inspect_step should not run without step fields")
+
+    monkeypatch.setattr(MlpTwoLayer, "inspect_step", no_inspect)
+    weights_only = client.post("/mlp/step", json={"fields": ["weights"]}, headers=headers).json()
+    assert "step" not in weights_only and set(weights_only["hidden"]) == {"weights", "bias"}
+    assert weights_only["hidden"] == inspected["hidden"]
+    assert weights_only["output"] == inspected["output"]
+
+
+def test_mlp_fields_on_state_and_reset(client):
+    headers = {"X-Session-Id": "mlp-fields-state"}
+    reset = client.post("/mlp/reset", json={"dataset": "or", "fields": []}, headers=headers).json()
+    assert reset["dataset"] == "or"
+    assert not {"hidden", "output", "evals"} & set(reset)
+    state = client.get("/mlp/state", params={"fields": "evals"}, headers=headers).json()
+    assert set(state) & {"hidden", "output", "evals"} == {"evals"}
+
+    bad = client.post("/mlp/step", json={"fields": ["evals", "loss"]}, headers=headers)
+    assert bad.status_code == 400
+    assert "unknown fields: loss" in bad.json()["detail"]
+    assert client.post("/mlp/step", json={"fields": 3}, headers=headers).status_code == 400
+
+
+def test_mlp_reset_rejects_oversized_models(client):
+    headers = {"X-Session-Id": "mlp-size-limits"}
+    too_wide = client.post("/mlp/reset", json={"hidden_dim": 10**6, "large_grid": True}, headers=headers)
+    assert too_wide.status_code == 400
+    assert client.post("/mlp/reset", json={"dataset": "xor", "hidden_dim": 500}, headers=headers).status_code == 200
+    big_grid = {
+        "dataset": "custom",
+        "large_grid": True,
+        "grid_rows": 100,
+        "grid_cols": 100,
+        "samples": [{"grid": [[1] * 100] * 100, "y": 1}],
+    }
+    too_big = client.post("/mlp/reset", json=big_grid, headers=headers)
+    assert too_big.status_code == 400
+    assert "exceeds" in too_big.json()["detail"]
+    state = client.get("/mlp/state", params={"fields": ""}, headers=headers).json()
+    assert (state["dataset"], state["hidden_dim"]) == ("xor", 500)
@@ -40,3 +40,56 @@ def test_perceptron_custom_reset(client):
     assert custom["grid_rows"] == 2
     assert custom["grid_cols"] == 2
     assert custom["sample_count"] == 2
+
+
+def test_perceptron_multi_step_trajectory(client):
+    run = client.post("/step", json={"dataset": "or", "n": 10, "stride": 3}).json()
+    traj = run["trajectory"]
+    assert traj["steps"] == 10
+    assert traj["step"] == [3, 6, 9, 10]
+    assert len(traj["idx"]) == len(traj["mistake"]) == len(traj["w"]) == len(traj["b"]) == 4
+    assert traj["w"][-1] == run["w"]
+    assert run["idx"] == 10 % 4
+
+    converged = client.post("/step", json={"until_converged": True}).json()["trajectory"]
+    assert converged["converged"] is True
+    assert converged["mistake"][-4:] == [False] * 4
+
+    assert client.post("/step", json={"n": 0}).status_code == 400
+    not_bool = client.post("/step", json={"until_converged": "false"})
+    assert not_bool.status_code == 400
+    assert not_bool.json()["detail"] == "until_converged must be true or false"
+    assert client.post("/step", json={"n": 5, "stride": 0}).status_code == 400
+
+
+def test_perceptron_averaged_variant(client):
+    reset = client.post("/reset", json={"dataset": "or", "variant": "averaged"}).json()
+    assert reset["variant"] == "averaged"
+    assert reset["w_avg"] == [0.0, 0.0]
+    step = client.post("/step", json={"n": 8}).json()
+    assert step["variant"] == "averaged"
+    assert len(step["w_avg"]) == 2
+    assert "b_avg" in step
+    classic = client.post("/reset", json={"variant": "classic"}).json()
+    assert classic["variant"] == "classic"
+    assert "w_avg" not in classic
+    bad = client.post("/step", json={"variant": "voted"})
+    assert bad.status_code == 400
+
+
+def test_perceptron_kernel_variant_learns_xor(client):
+    reset = client.post(
+        "/reset", json={"dataset": "xor", "variant": "kernel", "kernel": {"name": "poly", "degree": 2}}
+    ).json()
+    assert reset["variant"] == "kernel"
+    assert reset["w"] is None
+    assert reset["kernel"]["name"] == "poly"
+    run = client.post("/step", json={"until_converged": True, "variant": "kernel"}).json()
+    assert run["trajectory"]["converged"]
+    assert run["support_count"] > 0
+    assert run["gram_cache"]["hits"] > 0
+    single = client.post("/step", json={}).json()
+    assert single["mistake"] is False
+    assert single["delta_alpha"] == 0.0
+    bad = client.post("/reset", json={"variant": "kernel", "kernel": {"name": "linear"}})
+    assert bad.status_code == 400
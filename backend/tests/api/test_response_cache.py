@@ -0,0 +1,68 @@
+from backend.api.deps import response_cache
+from backend.api.response_cache import ResponseCache, request_key
+
+
+def test_request_key_is_canonical():
+    assert request_key("a", {"x": 1, "y": [1, 2]}) == request_key("a", {"y": [1, 2], "x": 1})
+    assert request_key("a", {"x": 1}) != request_key("b", {"x": 1})
+
+
+def test_lru_is_bounded_by_bytes():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"5678")
+    assert cache.get("a") == b"1234"
+    cache.put("c", b"9012")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234" and cache.get("c") == b"9012"
+    assert cache.total_bytes == 8
+    cache.put("huge", b"x" * 11)
+    assert cache.get("huge") is None
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["misses"] == 2
+
+
+def test_error_surface_hits_cache_and_revalidates(client):
+    body = {"dataset": "xor", "steps": 7, "w_min": -0.5, "w_max": 0.75, "b": 0.125}
+    first = client.post("/error-surface", json=body)
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "miss"
+    etag = first.headers["etag"]
+
+    reordered = dict(reversed(list(body.items())))
+    second = client.post("/error-surface", json=reordered)
+    assert second.headers["x-cache"] == "hit"
+    assert second.headers["etag"] == etag
+    assert second.json() == first.json()
+
+    before = response_cache.stats()["not_modified"]
+    revalidated = client.post("/error-surface", json=body, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert response_cache.stats()["not_modified"] == before + 1
+
+    stats = client.get("/cache-stats").json()
+    assert stats["hits"] >= 1 and stats["entries"] >= 1
+
+
+def test_mlp_internals_cached_and_errors_not_cached(client):
+    body = {"dataset": "or", "hidden_dim": 4, "seed": 3, "sample_index": 1}
+    first = client.post("/mlp-internals", json=body)
+    second = client.post("/mlp-internals", json=body)
+    assert second.headers["x-cache"] == "hit"
+    assert second.json() == first.json()
+
+    bad = {"dataset": "or", "hidden_dim": 0}
+    assert client.post("/mlp-internals", json=bad).status_code == 400
+    assert client.post("/mlp-internals", json=bad).status_code == 400
+
+
+def test_etags_change_with_build_and_ignore_wildcard(client, monkeypatch):
+    body = {"dataset": "or", "steps": 6, "w_min": -0.25, "w_max": 0.5}
+    etag = client.post("/error-surface", json=body).headers["etag"]
+    assert client.post("/error-surface", json=body, headers={"If-None-Match": "*"}).status_code == 200
+
+    monkeypatch.setattr(response_cache, "build_id", "next-deploy")
+    redeployed = client.post("/error-surface", json=body, headers={"If-None-Match": etag})
+    assert redeployed.status_code == 200
+    assert redeployed.headers["etag"] != etag
@@ -0,0 +1,23 @@
+from fastapi.testclient import TestClient
+
+from backend.api_app import app
+
+
+def test_sessions_are_isolated_by_header():
+    client = TestClient(app)
+    a = {"X-Session-Id": "tab-session-a"}
+    b = {"X-Session-Id": "tab-session-b"}
+    client.post("/reset", json={"dataset": "xor"}, headers=a)
+    assert client.get("/state", headers=a).json()["dataset"] == "xor"
+    assert client.get("/state", headers=b).json()["dataset"] == "or"
+    response = client.get("/lms/state", headers=a)
+    assert response.headers["X-Session-Id"] == "tab-session-a"
+
+
+def test_cookie_session_is_issued_and_reused():
+    client = TestClient(app)
+    first = client.post("/mlp/reset", json={"dataset": "or", "hidden_dim": 3})
+    session_id = first.headers["X-Session-Id"]
+    assert client.cookies.get("perceptron_session") == session_id
+    state = client.get("/mlp/state").json()
+    assert state["hidden_dim"] == 3
@@ -0,0 +1,90 @@
+from backend.api.stream import parse_stream_config
+
+
+def _collect_until_done(ws):
+    frames = []
+    while True:
+        message = ws.receive_json()
+        if message["type"] == "frame":
+            frames.append(message)
+        elif message["type"] == "status" and message["status"] == "done":
+            return frames, message
+
+
+def test_perceptron_stream_runs_to_max_steps(client):
+    headers = {"X-Session-Id": "stream-session-1"}
+    with client.websocket_connect("/stream?fps=60&steps_per_frame=3&max_steps=7", headers=headers) as ws:
+        frames, status = _collect_until_done(ws)
+    assert status["reason"] == "max_steps"
+    assert status["steps"] == 7
+    assert frames[-1]["steps"] == 7
+    assert [f["seq"] for f in frames] == list(range(1, len(frames) + 1))
+    state = client.get("/state", headers=headers).json()
+    assert state["idx"] == 7 % 4
+    assert state["w"] == frames[-1]["state"]["w"]
+
+
+def test_mlp_stream_pause_resume_stop(client):
+    with client.websocket_connect("/mlp/stream?session=stream-session-2&fps=30") as ws:
+        ws.send_json({"type": "pause"})
+        message = ws.receive_json()
+        while message["type"] != "status":
+            message = ws.receive_json()
+        assert message["status"] == "paused"
+        ws.send_json({"type": "resume"})
+        ws.send_json({"type": "bogus"})
+        ws.send_json({"type": "stop"})
+        seen = []
+        while True:
+            message = ws.receive_json()
+            seen.append(message["type"])
+            if message["type"] == "status" and message["status"] == "done":
+                break
+        assert "error" in seen
+        assert message["reason"] == "stopped"
+
+
+def test_lms_stream_until_converged(client):
+    headers = {"X-Session-Id": "stream-session-3"}
+    client.post(
+        "/lms/reset",
+        json={
+            "dataset": "custom",
+            "lr": 0.2,
+            "grid_rows": 1,
+            "grid_cols": 2,
+            "samples": [{"x": [1, 1], "y": 1}, {"x": [-1, 1], "y": -1}],
+        },
+        headers=headers,
+    )
+    url = "/lms/stream?fps=60&steps_per_frame=50&until_converged=1&max_steps=5000"
+    with client.websocket_connect(url, headers=headers) as ws:
+        frames, status = _collect_until_done(ws)
+    assert status["reason"] == "converged"
+    assert frames[-1]["state"]["trajectory"]["converged"] is True
+
+
+def test_stream_converges_at_the_same_step_as_one_run(client):
+    run = client.post("/step", json={"until_converged": True}, headers={"X-Session-Id": "stream-run-ref"}).json()
+    expected = run["trajectory"]["steps"]
+    assert run["trajectory"]["converged"] is True and expected > 3
+    headers = {"X-Session-Id": "stream-session-4"}
+    with client.websocket_connect("/stream?fps=60&steps_per_frame=5&until_converged=1", headers=headers) as ws:
+        frames, status = _collect_until_done(ws)
+    assert status["reason"] == "converged"
+    assert status["steps"] == frames[-1]["steps"] == expected
+    assert client.get("/state", headers=headers).json()["w"] == run["w"]
+
+
+def test_stream_rejects_bad_params(client):
+    with client.websocket_connect("/stream?fps=0") as ws:
+        message = ws.receive_json()
+    assert message["type"] == "error"
+
+
+def test_parse_stream_config_defaults():
+    config = parse_stream_config({})
+    assert config.fps == 10.0
+    assert config.steps_per_frame == 1
+    assert config.max_steps is None
+    assert config.until_converged is False
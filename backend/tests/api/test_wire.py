@@ -0,0 +1,94 @@
+import json
+
+import numpy as np
+import pytest
+
+import backend.api.wire as wire
+from backend.api.wire import FRAME_MEDIA_TYPE, decode_frame, encode_frame, encode_json, parse_accept
+
+FRAME = {"Accept": FRAME_MEDIA_TYPE}
+
+
+def test_parse_accept():
+    assert parse_accept(None).media_type == "application/json"
+    assert parse_accept("text/html, application/x-perceptron-frame").media_type == FRAME_MEDIA_TYPE
+    assert parse_accept("application/json; precision=3").precision == 3
+    assert parse_accept("*/*", precision="2").precision == 2
+    with pytest.raises(ValueError):
+        parse_accept("application/json; precision=99")
+
+
+def test_frame_round_trip_packs_numeric_arrays():
+    payload = {
+        "w": [[0.5, -1.25, 2.0, 0.1]] * 3,
+        "idx": list(range(10)),
+        "b": 0.25,
+        "small": [1.5, 2.5],
+        "evals": [{"x": [1, -1], "p": 0.75}],
+        "label": "or",
+        "mixed": [1, None, 2],
+    }
+    data = encode_frame(payload)
+    assert data[:4] == b"PVLF"
+    header_len = int.from_bytes(data[8:12], "little")
+    header = json.loads(data[12:12 + header_len])
+    assert [a["dtype"] for a in header["arrays"]] == ["float32", "int32"]
+    assert header["arrays"][0]["shape"] == [3, 4]
+    decoded = decode_frame(data)
+    np.testing.assert_allclose(decoded["w"], payload["w"], rtol=1e-6)
+    assert decoded["idx"] == payload["idx"]
+    assert {k: decoded[k] for k in ("b", "small", "evals", "label", "mixed")} == {
+        k: payload[k] for k in ("b", "small", "evals", "label", "mixed")
+    }
+
+
+def test_frame_keeps_booleans_and_states_conversions():
+    payload = {"converged": [True, False] * 5, "mask": np.array([[True, False, True, True]] * 2), "w": [0.1] * 8}
+    data = encode_frame(payload)
+    header_len = int.from_bytes(data[8:12], "little")
+    arrays = json.loads(data[12:12 + header_len])["arrays"]
+    assert [a["dtype"] for a in arrays] == ["bool", "bool", "float32"]
+    assert "source_dtype" not in arrays[0]
+    assert arrays[2]["source_dtype"] == "float64"
+    decoded = decode_frame(data)
+    assert decoded["converged"] == payload["converged"]
+    assert all(type(value) is bool for value in decoded["converged"])
+    assert decoded["mask"] == payload["mask"].tolist()
+
+
+def test_json_precision_and_stdlib_fallback(monkeypatch):
+    payload = {"w": [0.123456, 1.0, -2.987654], "b": 0.333333, "n": 3, "grid": [[0.11111, 0.22222]]}
+    rounded = json.loads(encode_json(payload, precision=2))
+    assert rounded == {"w": [0.12, 1.0, -2.99], "b": 0.33, "n": 3, "grid": [[0.11, 0.22]]}
+    monkeypatch.setattr(wire, "orjson", None)
+    assert json.loads(encode_json({"a": np.arange(3), "b": np.float64(0.5)})) == {"a": [0, 1, 2], "b": 0.5}
+
+
+def test_routes_negotiate_frame_and_keep_session(client):
+    client.post("/mlp/reset", json={"dataset": "xor", "hidden_dim": 8})
+    response = client.post("/mlp/step", json={}, headers=FRAME)
+    assert response.headers["content-type"] == FRAME_MEDIA_TYPE
+    assert "x-session-id" in response.headers
+    frame = decode_frame(response.content)
+    as_json = client.get("/mlp/state").json()
+    assert len(frame["hidden"]["weights"]) == len(as_json["hidden"]["weights"]) == 8
+
+    state = client.get("/state?precision=1").json()
+    assert all(round(v, 1) == v for v in state["w"])
+
+
+def test_cached_diagnostics_are_cached_per_encoding(client):
+    body = {"dataset": "or", "steps": 6, "b": 0.75}
+    as_json = client.post("/error-surface", json=body)
+    as_frame = client.post("/error-surface", json=body, headers=FRAME)
+    assert as_frame.headers["content-type"] == FRAME_MEDIA_TYPE
+    assert as_frame.headers["etag"] != as_json.headers["etag"]
+    np.testing.assert_allclose(decode_frame(as_frame.content)["grid"], as_json.json()["grid"], rtol=1e-6)
+
+    detect = client.post(
+        "/detect",
+        json={"source": "template", "board": [[1, 0, 1, 0]] * 4, "template": [[1, 0]]},
+        headers=FRAME,
+    )
+    assert decode_frame(detect.content)["method"] in ("direct", "fft", "summed_area")
+    assert client.get("/state", headers={"Accept": "application/json; precision=x"}).status_code == 400
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from backend.core.averaged_perceptron import AveragedPerceptron
+from backend.core.perceptron import Perceptron
+
+
+def _noisy_samples(n=60, seed=1):
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(n):
+        x = [rng.choice((-1, 1)) for _ in range(6)]
+        y = 1 if x[0] + x[1] + x[2] > 0 else -1
+        if rng.random() < 0.1:
+            y = -y
+        samples.append({"x": x, "y": y})
+    return samples
+
+
+def test_lazy_average_matches_naive_average():
+    samples = _noisy_samples()
+    model = AveragedPerceptron(dim=6, lr=0.5, seed=2, init="random")
+    reference = Perceptron(dim=6, lr=0.5, seed=2, init="random")
+    total_w = list(reference.w)
+    total_b = reference.b
+    states = 1
+    for _ in range(3):
+        for sample in samples:
+            model.train_step(sample["x"], sample["y"])
+            reference.train_step(sample["x"], sample["y"])
+            total_w = [t + w for t, w in zip(total_w, reference.w)]
+            total_b += reference.b
+            states += 1
+    w_avg, b_avg = model.averaged_weights()
+    assert model.w == reference.w
+    assert model.steps == states - 1
+    assert w_avg == pytest.approx([t / states for t in total_w])
+    assert b_avg == pytest.approx(total_b / states)
+
+
+def test_predict_label_uses_averaged_weights():
+    model = AveragedPerceptron(dim=1)
+    for _ in range(4):
+        model.train_step([1.0], -1)
+    for _ in range(2):
+        model.train_step([1.0], 1)
+    # live weights have swung positive, the average still leans negative
+    assert model.predict_score([1.0]) > 0
+    assert model.averaged_score([1.0]) < 0
+    assert model.predict_label([1.0]) == -1
+    with pytest.raises(ValueError):
+        model.averaged_score([1.0, 2.0])
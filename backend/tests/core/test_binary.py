@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from backend.core.binary import BinaryScorer, bytes_to_words, is_pm1, pack_pm1, popcount
+from backend.core.packed_dataset import PackedShapeDataset
+from backend.core.perceptron import Perceptron
+from backend.core.vector_perceptron import VectorPerceptron
+
+
+def _pm1(rng, n, dim):
+    return rng.integers(0, 2, size=(n, dim)) * 2 - 1
+
+
+def test_pack_pm1_layout_and_validation():
+    words = pack_pm1([[1, -1, 1], [-1, -1, -1]])
+    assert words.shape == (2, 1) and words.dtype == np.uint64
+    assert words.view(np.uint8)[0, 0] == 0b10100000
+    assert popcount(words).tolist() == [2, 0]
+    assert is_pm1([[1, -1]]) and not is_pm1([[1, 0]])
+    with pytest.raises(ValueError):
+        pack_pm1([[1, 0]])
+
+
+@pytest.mark.parametrize("dim", [3, 64, 70, 130])
+def test_scorer_matches_float_dot(dim):
+    rng = np.random.default_rng(dim)
+    X = _pm1(rng, 50, dim)
+    words = pack_pm1(X)
+    for w, expected_mode in (
+        (rng.integers(-7, 8, dim).astype(float), "popcount"),
+        (np.where(rng.random(dim) < 0.5, -1.0, 1.0), "popcount"),
+        (rng.normal(size=dim), "table"),
+    ):
+        scorer = BinaryScorer(w, b=0.25)
+        assert scorer.mode == expected_mode
+        assert scorer.scores(words) == pytest.approx(X @ w + 0.25)
+        assert scorer.predict_labels(words).tolist() == np.where(X @ w + 0.25 >= 0, 1, -1).tolist()
+    with pytest.raises(ValueError):
+        BinaryScorer(np.ones(dim + 64)).scores(words)
+
+
+def test_models_and_packed_dataset_score_bits():
+    rng = np.random.default_rng(0)
+    X = _pm1(rng, 40, 12)
+    y = np.where(X[:, 0] + X[:, 1] >= 0, 1, -1)
+    samples = [{"x": row.tolist(), "y": int(label)} for row, label in zip(X, y)]
+    model = Perceptron(dim=12, seed=0)
+    model.fit(samples, epochs=5)
+    words = pack_pm1(X)
+    expected = [model.predict_score(row) for row in X.tolist()]
+    assert model.scores_packed(words) == pytest.approx(expected)
+
+    vector = VectorPerceptron(dim=12, lr=0.3, seed=0)
+    vector.train_epoch(X.astype(float), y.astype(float))
+    assert vector.scores_packed(words) == pytest.approx(vector.scores(X))
+
+    packed = PackedShapeDataset.from_samples(samples, board_shape=(3, 4))
+    assert np.array_equal(packed.to_words(), bytes_to_words(packed.bits))
+    assert packed.scores(model.w, model.b, batch_size=7) == pytest.approx(expected)
+    assert packed.accuracy(model.w, model.b) == np.mean(np.where(np.array(expected) >= 0, 1, -1) == y)
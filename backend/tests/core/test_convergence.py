@@ -0,0 +1,64 @@
+import numpy as np
+
+from backend.core.convergence import CONVERGED, CYCLE, MAX_EPOCHS, EarlyStopper, state_key
+from backend.core.datasets import make_or_dataset_pm1, make_xor_dataset_pm1
+from backend.core.perceptron import Perceptron
+from backend.core.vector_perceptron import VectorPerceptron, samples_to_arrays
+from backend.runner import run_training
+
+
+def test_state_key_normalizes_representation():
+    assert state_key([0.0, 1.0], -0.0) == state_key(np.array([-0.0, 1.0]), 0.0)
+    assert state_key([0.0, 1.0], 0.0) != state_key([0.0, 1.0], 1.0)
+
+
+def test_stopper_reports_cycle_start():
+    stopper = EarlyStopper([0.0], 0.0)
+    assert not stopper.update(2, [1.0], 0.0)
+    assert not stopper.update(2, [2.0], 0.0)
+    assert stopper.update(2, [1.0], 0.0)
+    result = stopper.result([2, 2, 2])
+    assert (result.stop_reason, result.stop_epoch, result.cycle_start) == (CYCLE, 3, 1)
+    assert stopper.update(0, [5.0], 0.0)
+    assert stopper.result([2, 2, 2, 0]).to_dict()["stop_reason"] == CYCLE
+    assert stopper.epoch == 3
+
+
+def test_fit_stops_on_convergence_and_cycles():
+    or_fit = Perceptron(dim=2, seed=0).fit(make_or_dataset_pm1(), epochs=100)
+    assert or_fit.stop_reason == CONVERGED
+    assert or_fit.mistakes[-1] == 0 and len(or_fit.mistakes) == or_fit.stop_epoch < 100
+
+    xor_fit = Perceptron(dim=2, seed=0).fit(make_xor_dataset_pm1(), epochs=100)
+    assert xor_fit.stop_reason == CYCLE
+    assert xor_fit.stop_epoch < 100
+
+    no_detect = Perceptron(dim=2, seed=0).fit(make_xor_dataset_pm1(), epochs=5, detect_cycles=False)
+    assert no_detect.stop_reason == MAX_EPOCHS and no_detect.stop_epoch == 5
+
+
+def test_vector_fit_matches_reference():
+    for samples in (make_or_dataset_pm1(), make_xor_dataset_pm1()):
+        X, y = samples_to_arrays(samples)
+        ref = Perceptron(dim=2, seed=3, init="random").fit(samples, epochs=50)
+        vec = VectorPerceptron(dim=2, seed=3, init="random").fit(X, y, epochs=50)
+        assert ref.to_dict() == vec.to_dict()
+
+
+def test_run_training_early_stop():
+    full = run_training("xor", epochs=8, lr=1.0, seed=0)
+    assert len(full["mistakes"]) == 8
+    assert full["stop_reason"] == MAX_EPOCHS
+    stopped = run_training("xor", epochs=8, lr=1.0, seed=0, early_stop=True, engine="numpy")
+    assert stopped["stop_reason"] == CYCLE
+    assert len(stopped["mistakes"]) == len(stopped["accuracy"]) == stopped["stop_epoch"]
+    assert run_training("or", epochs=50, lr=1.0, seed=0, early_stop=True)["stop_reason"] == CONVERGED
+
+
+def test_run_training_without_early_stop_reports_max_epochs():
+    stats = run_training("or", epochs=10, lr=1.0, early_stop=False)
+    assert len(stats["mistakes"]) == 10
+    assert (stats["stop_reason"], stats["stop_epoch"]) == (MAX_EPOCHS, 10)
+    assert stats["converged_epoch"] == stats["mistakes"].index(0) + 1 < 10
+    early = run_training("or", epochs=10, lr=1.0, early_stop=True)
+    assert early["stop_epoch"] == early["converged_epoch"] == stats["converged_epoch"]
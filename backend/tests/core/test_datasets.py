@@ -1,5 +1,6 @@
 from backend.core.datasets import (
     generate_translations,
+    iter_translations,
     make_and_dataset_pm1,
     make_or_dataset_pm1,
     make_shape_dataset,
@@ -38,3 +39,12 @@ def test_make_shape_dataset_translation_samples():
         assert set(s["x"]).issubset({-1, 1})
         assert s["y"] in (-1, 1)
         assert "grid" in s and "pos" in s
+
+
+def test_iter_translations_is_lazy_and_matches_list():
+    shape = [[1, 0]]
+    lazy = iter_translations(shape, board_h=2, board_w=3)
+    first_grid, first_pos = next(lazy)
+    assert first_pos == (0, 0)
+    assert first_grid == [[1, -1, -1], [-1, -1, -1]]
+    assert [(first_grid, first_pos)] + list(lazy) == generate_translations(shape, 2, 3)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from backend.core.datasets import make_xor_dataset_pm1
+from backend.core.kernel_perceptron import GramCache, KernelPerceptron, KernelSpec
+
+
+def test_kernel_spec_values_and_validation():
+    A = np.array([[1.0, 0.0], [0.0, 1.0]])
+    rbf = KernelSpec("rbf", gamma=0.5).matrix(A, A)
+    assert rbf[0, 0] == pytest.approx(1.0)
+    assert rbf[0, 1] == pytest.approx(np.exp(-1.0))
+    poly = KernelSpec("poly", gamma=1.0, degree=2, coef0=1.0).matrix(A, A)
+    assert poly.tolist() == [[4.0, 1.0], [1.0, 4.0]]
+    assert KernelSpec.from_dict({"name": "poly", "degree": "3"}).degree == 3
+    with pytest.raises(ValueError):
+        KernelSpec("linear")
+    with pytest.raises(ValueError):
+        KernelSpec.from_dict({"gamma": "x"})
+
+
+@pytest.mark.parametrize("spec", [KernelSpec("rbf", gamma=1.0), KernelSpec("poly", degree=2)])
+def test_kernel_perceptron_separates_xor(spec):
+    samples = make_xor_dataset_pm1()
+    model = KernelPerceptron(samples, kernel=spec, seed=0)
+    for _ in range(20):
+        if not any(r.mistake for r in model.train_epoch()):
+            break
+    assert all(model.predict_label(s["x"]) == s["y"] for s in samples)
+    X = np.array([s["x"] for s in samples], dtype=float)
+    assert np.sign(model.decision_function(X)).tolist() == [s["y"] for s in samples]
+    grid = model.decision_grid(steps=5)
+    assert grid.shape == (5, 5)
+    assert grid[0, 0] == pytest.approx(model.predict_score([-1.5, -1.5]))
+    assert grid[4, 0] == pytest.approx(model.predict_score([-1.5, 1.5]))
+
+
+def test_gram_cache_is_lru_bounded():
+    X = np.arange(12, dtype=float).reshape(6, 2)
+    cache = GramCache(X, KernelSpec("rbf", gamma=0.01), max_bytes=2 * 6 * 8)
+    assert cache.max_rows == 2
+    first = cache.row(0)
+    assert cache.row(0) is first
+    cache.row(1)
+    cache.row(2)
+    assert len(cache) == 2 and cache.nbytes == 2 * 6 * 8
+    cache.row(0)
+    assert cache.stats() == {"rows": 2, "max_rows": 2, "hits": 1, "misses": 4}
+    np.testing.assert_allclose(cache.row(2), KernelSpec("rbf", gamma=0.01).matrix(X[2:3], X)[0])
+
+
+def test_epochs_reuse_cached_rows():
+    model = KernelPerceptron(make_xor_dataset_pm1(), seed=1)
+    for _ in range(3):
+        model.train_epoch()
+    misses = model.cache.misses
+    assert misses <= 4
+    model.train_epoch()
+    model.train_epoch()
+    assert model.cache.misses == misses
+    assert model.cache.hits > 0
+    with pytest.raises(ValueError):
+        model.decision_function(np.zeros((1, 3)))
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from backend.core.datasets import iter_shape_samples, make_shape_dataset
+from backend.core.packed_dataset import PackedShapeDataset
+
+GOOD = [[1, 1], [1, 0]]
+BAD = [[1, 0], [0, 1]]
+
+
+def test_from_shapes_matches_make_shape_dataset():
+    expected = make_shape_dataset(GOOD, BAD, board_size=(4, 5))
+    packed = PackedShapeDataset.from_shapes(GOOD, BAD, board_size=(4, 5))
+    assert len(packed) == len(expected)
+    assert list(packed) == list(expected)
+    assert packed[-1] == expected[-1]
+    X = packed.to_matrix()
+    assert X.shape == (len(expected), 20)
+    assert np.array_equal(X, expected.X)
+    matrix = packed.to_sample_matrix()
+    assert np.array_equal(matrix.X, expected.X)
+    assert matrix[3] == expected[3]
+
+
+def test_from_samples_consumes_generator_and_fixed_boards():
+    samples = iter_shape_samples(GOOD, BAD, board_size=(2, 2), translations=False)
+    packed = PackedShapeDataset.from_samples(samples, board_shape=(2, 2))
+    expected = make_shape_dataset(GOOD, BAD, board_size=(2, 2), translations=False)
+    assert list(packed) == list(expected)
+    assert PackedShapeDataset.from_shapes(GOOD, BAD, (2, 2), translations=False)[1] == expected[1]
+
+
+def test_large_board_is_compact_and_streams_batches():
+    packed = PackedShapeDataset.from_shapes([[1]], [[1, 1]], board_size=(64, 64))
+    assert len(packed) == 64 * 64 + 64 * 63
+    assert packed.bits.shape[1] == 512
+    assert packed.nbytes < 5 * 1024 * 1024
+    sizes = [X.shape[0] for X, _ in packed.iter_batches(1000)]
+    assert sum(sizes) == len(packed)
+    X, y = next(packed.iter_batches(3))
+    assert X.sum(axis=1).tolist() == [2 - 64 * 64] * 3
+    assert y.tolist() == [1.0, 1.0, 1.0]
+    assert packed.row(65).reshape(64, 64)[1, 1] == 1
+
+
+def test_index_and_shape_errors():
+    packed = PackedShapeDataset.from_shapes(GOOD, BAD, board_size=(2, 2))
+    with pytest.raises(IndexError):
+        packed[len(packed)]
+    with pytest.raises(ValueError):
+        PackedShapeDataset.from_samples([{"x": [1, -1, 1], "y": 1}], board_shape=(2, 2))
+    with pytest.raises(ValueError):
+        list(packed.iter_batches(0))
@@ -19,6 +19,7 @@ def test_train_step_updates_on_mistake():
     assert result.delta_b == -1.0
     assert p.w == [-1.0, 1.0]
     assert p.b == -1.0
+    assert p.version == 1
 
 
 def test_train_step_no_update_when_correct():
@@ -32,6 +33,7 @@ def test_train_step_no_update_when_correct():
     assert result.delta_b == 0.0
     assert p.w == [1.0, 1.0]
     assert p.b == 0.5
+    assert p.version == 0
 
 
 def test_random_init_is_deterministic_with_seed():
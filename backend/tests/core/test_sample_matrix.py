@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from backend.core.datasets import make_or_dataset_pm1, make_shape_dataset
+from backend.core.metrics import accuracy, batch_accuracy, batch_margins
+from backend.core.sample_matrix import SampleMatrix
+
+
+def test_from_samples_round_trips_dicts():
+    samples = [{"x": [1, -1], "y": 1}, {"x": [-1, -1], "y": -1}]
+    matrix = SampleMatrix.from_samples(samples)
+    assert matrix.X.shape == (2, 2)
+    assert matrix.X.flags["C_CONTIGUOUS"]
+    assert matrix.y.dtype == np.int8
+    assert matrix.to_samples() == [{"x": [1.0, -1.0], "y": 1}, {"x": [-1.0, -1.0], "y": -1}]
+    assert matrix[-1]["y"] == -1
+    assert matrix[0:1] == [{"x": [1.0, -1.0], "y": 1}]
+    assert SampleMatrix.from_samples(matrix) is matrix
+
+
+def test_validation_errors():
+    with pytest.raises(ValueError, match="non-empty"):
+        SampleMatrix.from_samples([])
+    with pytest.raises(ValueError, match="-1 or \\+1"):
+        SampleMatrix([[1.0]], [0])
+    with pytest.raises(ValueError, match="grid_shape"):
+        SampleMatrix([[1.0, 1.0]], [1], grid_shape=(3, 1))
+
+
+def test_factories_produce_matrices_with_grid_view():
+    assert isinstance(make_or_dataset_pm1(), SampleMatrix)
+    good = [[1, 1]]
+    bad = [[1, -1]]
+    dataset = make_shape_dataset(good, bad, board_size=(2, 3))
+    assert isinstance(dataset, SampleMatrix)
+    assert dataset.grid_shape == (2, 3)
+    first = dataset[0]
+    assert first["pos"] == (0, 0)
+    assert first["grid"] == [[1.0, 1.0, -1.0], [-1.0, -1.0, -1.0]]
+
+
+def test_metrics_accept_matrix():
+    matrix = make_or_dataset_pm1()
+    predict = lambda x: 1 if x[0] + x[1] + 1 >= 0 else -1
+    predict_batch = lambda X: np.where(X.sum(axis=1) + 1 >= 0, 1, -1)
+    assert accuracy(matrix, predict) == 1.0
+    assert batch_accuracy(matrix, predict_batch) == 1.0
+    assert np.all(batch_margins(matrix, lambda X: X.sum(axis=1) + 1) > 0)
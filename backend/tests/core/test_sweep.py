@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+
+import pytest
+
+from backend.runner import main as runner_main
+from backend.runner import run_training
+from backend.sweep import RESULT_FIELDS, expand_grid, run_sweep, write_results
+
+
+def test_expand_grid_order_and_validation():
+    configs = expand_grid(["or", "xor"], [0.5, 1.0], [0, 1], [3], inits=["zeros", "random"])
+    assert len(configs) == 16
+    assert [c.index for c in configs] == list(range(16))
+    assert (configs[0].dataset, configs[0].init) == ("or", "zeros")
+    assert (configs[1].dataset, configs[1].init) == ("or", "random")
+    assert configs[-1].dataset == "xor"
+    with pytest.raises(ValueError):
+        expand_grid(["bad"], [1.0], [0], [1])
+    with pytest.raises(ValueError):
+        expand_grid(["or"], [1.0], [0], [0])
+
+
+def test_sweep_rows_match_run_training_and_pool():
+    configs = expand_grid(["or", "xor"], [1.0], [0, 1, 2], [4], inits=["zeros", "random"])
+    serial = list(run_sweep(configs, workers=1))
+    pooled = list(run_sweep(configs, workers=2, batch_size=3))
+    strip = lambda rows: [{k: v for k, v in row.items() if k != "seconds"} for row in rows]
+    assert strip(serial) == strip(pooled)
+    first = serial[0]
+    stats = run_training("or", 4, 1.0, seed=0)
+    assert first["total_mistakes"] == sum(stats["mistakes"])
+    assert first["final_accuracy"] == stats["accuracy"][-1]
+    or_rows = [row for row in serial if row["dataset"] == "or"]
+    assert all(row["converged_epoch"] is not None for row in or_rows)
+    assert all(row["converged_epoch"] is None for row in serial if row["dataset"] == "xor")
+
+
+def test_run_sweep_rejects_non_positive_workers():
+    configs = expand_grid(["or"], [1.0], [0], [1])
+    with pytest.raises(ValueError, match="workers"):
+        run_sweep(configs, workers=0)
+    with pytest.raises(ValueError, match="batch_size"):
+        run_sweep(configs, workers=1, batch_size=0)
+
+
+def test_write_results_formats():
+    rows = list(run_sweep(expand_grid(["or"], [1.0], [0, 1], [2]), workers=1))
+    out = io.StringIO()
+    assert write_results(rows, out, "csv") == 2
+    parsed = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert tuple(parsed[0].keys()) == RESULT_FIELDS
+    out = io.StringIO()
+    write_results(rows, out, "json")
+    assert [row["seed"] for row in json.loads(out.getvalue())] == [0, 1]
+    out = io.StringIO()
+    write_results([], out, "json")
+    assert json.loads(out.getvalue()) == []
+
+
+def test_runner_dispatches_sweep(tmp_path, capsys):
+    target = tmp_path / "sweep.json"
+    runner_main(["sweep", "--seed-count", "3", "--workers", "1", "--format", "json", "--output", str(target)])
+    assert len(json.loads(target.read_text())) == 3
+    assert "3 configs" in capsys.readouterr().err
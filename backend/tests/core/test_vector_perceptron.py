@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from backend.core.datasets import make_or_dataset_pm1, make_shape_dataset
+from backend.core.perceptron import Perceptron
+from backend.core.vector_perceptron import VectorPerceptron, samples_to_arrays
+from backend.runner import run_training
+
+
+def _shape_samples():
+    good = [[1, 1], [1, 0]]
+    bad = [[1, 0], [0, 1]]
+    return make_shape_dataset(good, bad, board_size=(5, 5), translations=True)
+
+
+@pytest.mark.parametrize("init", ["zeros", "random"])
+def test_matches_reference_perceptron(init):
+    samples = _shape_samples()
+    X, y = samples_to_arrays(samples)
+    ref = Perceptron(dim=25, lr=1.0, seed=7, init=init)
+    vec = VectorPerceptron(dim=25, lr=1.0, seed=7, init=init, block=8)
+    for _ in range(5):
+        ref_mistakes = sum(r.mistake for r in ref.train_epoch(samples))
+        vec_mistakes = vec.train_epoch(X, y)
+        assert vec_mistakes == ref_mistakes
+        assert np.allclose(vec.w, ref.w)
+        assert vec.b == pytest.approx(ref.b)
+
+
+def test_batch_scores_and_accuracy():
+    X, y = samples_to_arrays(make_or_dataset_pm1())
+    vec = VectorPerceptron(dim=2, seed=0)
+    vec.w[:] = [1.0, 1.0]
+    vec.b = 1.0
+    assert vec.scores(X).tolist() == [1.0, 1.0, 3.0, -1.0]
+    assert vec.predict_labels(X).tolist() == [1, 1, 1, -1]
+    assert vec.accuracy(X, y) == 1.0
+    assert vec.predict_label([-1, -1]) == -1
+
+
+def test_validation_errors():
+    with pytest.raises(ValueError):
+        VectorPerceptron(dim=0)
+    with pytest.raises(ValueError):
+        samples_to_arrays([{"x": [1, 1], "y": 0}])
+    vec = VectorPerceptron(dim=2)
+    with pytest.raises(ValueError):
+        vec.train_epoch(np.zeros((3, 3)), np.ones(3))
+
+
+def test_runner_numpy_engine_matches_python():
+    py_stats = run_training("or", epochs=4, lr=1.0, seed=3, engine="python")
+    np_stats = run_training("or", epochs=4, lr=1.0, seed=3, engine="numpy")
+    assert np_stats == py_stats
+    with pytest.raises(ValueError):
+        run_training("or", epochs=1, lr=1.0, engine="gpu")
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from backend.core.datasets import make_shape_dataset, make_xor_dataset_pm1
+from backend.nn.activations import sigmoid_array, sigmoid_prime_from_output
+from backend.nn.batch_layers import BatchDenseLayer
+from backend.nn.batch_mlp import BatchMlpTwoLayer
+from backend.nn.grid_mlp import GridMlp
+from backend.nn.layers import DenseLayer
+from backend.nn.mlp import MlpTwoLayer
+
+
+def test_batch_layer_matches_dense_layer_per_sample():
+    ref = DenseLayer(3, 2, activation=lambda z: float(sigmoid_array(z)), activation_prime_from_output=sigmoid_prime_from_output, seed=4)
+    layer = BatchDenseLayer(3, 2, activation=sigmoid_array, activation_prime_from_output=sigmoid_prime_from_output, seed=4)
+    assert np.allclose(layer.W, ref.W)
+    x = [1.0, -1.0, 1.0]
+    assert np.allclose(layer.forward([x]).a[0], ref.forward(x).a)
+    grad_W, grad_b, grad_x = layer.backward([[0.3, -0.1]])
+    ref_W, ref_b, ref_x = ref.backward([0.3, -0.1])
+    assert np.allclose(grad_W, ref_W)
+    assert np.allclose(grad_b, ref_b)
+    assert np.allclose(grad_x[0], ref_x)
+
+
+def test_batch_layer_guards():
+    layer = BatchDenseLayer(2, 1, activation=sigmoid_array, activation_prime_from_output=sigmoid_prime_from_output)
+    with pytest.raises(ValueError):
+        layer.backward([[0.1]])
+    with pytest.raises(ValueError):
+        layer.forward([[1.0, 2.0, 3.0]])
+
+
+def test_batch_size_one_matches_reference_mlp():
+    samples = make_xor_dataset_pm1()
+    ref = MlpTwoLayer(input_dim=2, hidden_dim=3, lr=0.5, seed=1)
+    batch = BatchMlpTwoLayer(input_dim=2, hidden_dim=3, lr=0.5, seed=1)
+    ref_losses = ref.train(samples, epochs=20)
+    batch_losses = batch.train(samples, epochs=20, batch_size=1)
+    assert np.allclose(batch_losses, ref_losses)
+    assert np.allclose(batch.hidden.W, ref.hidden.W)
+    assert np.allclose(batch.output.b, ref.output.b)
+    assert batch.forward(samples[0]["x"]) == pytest.approx(ref.forward(samples[0]["x"]))
+
+
+def test_mini_batch_training_reduces_loss():
+    samples = make_shape_dataset([[1, 1], [1, 0]], [[1, 0], [0, 1]], board_size=(4, 4))
+    model = BatchMlpTwoLayer(input_dim=16, hidden_dim=4, lr=0.5, seed=0)
+    losses = model.train(samples, epochs=30, batch_size=8, shuffle=True)
+    assert losses[-1] < losses[0]
+    probs = model.forward_batch(np.array([s["x"] for s in samples]))
+    assert probs.shape == (len(samples),)
+
+
+def test_grid_mlp_numpy_engine():
+    samples = make_shape_dataset([[1, 0], [0, 0]], [[0, 0], [0, 1]], board_size=(2, 2), translations=False)
+    ref = GridMlp(rows=2, cols=2, hidden_dim=2, lr=0.3, seed=2)
+    fast = GridMlp(rows=2, cols=2, hidden_dim=2, lr=0.3, seed=2, engine="numpy")
+    assert np.allclose(fast.train(samples, epochs=5), ref.train(samples, epochs=5))
+    assert np.allclose(fast.weight_templates(), ref.weight_templates())
+    assert np.allclose(fast.gradient_templates(), ref.gradient_templates())
+    assert len(fast.train(samples, epochs=2, batch_size=2)) == 2
+    with pytest.raises(ValueError):
+        ref.train(samples, epochs=1, batch_size=2)
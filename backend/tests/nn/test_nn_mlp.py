@@ -1,3 +1,5 @@
+import pytest
+
 from backend.core.datasets import make_xor_dataset_pm1
 from backend.nn.mlp import MlpTwoLayer
 
@@ -20,3 +22,38 @@ def test_mlp_inspect_step_shapes_and_gradients():
     assert len(internals.grad_hidden_W[0]) == 2
     grad_sum = sum(abs(val) for row in internals.grad_hidden_W for val in row)
     assert grad_sum > 0.0
+
+
+def test_inspect_step_before_is_pre_update_state():
+    model = MlpTwoLayer(input_dim=2, hidden_dim=3, lr=0.4, seed=2)
+    hidden_before = [row[:] for row in model.hidden.W]
+    out_b_before = model.output.b[:]
+    internals = model.inspect_step([1.0, -1.0], -1)
+    assert internals.hidden_W_after == model.hidden.W
+    assert internals.hidden_W_after is not model.hidden.W
+    for got, expected in zip(internals.hidden_W_before, hidden_before):
+        assert got == pytest.approx(expected)
+    assert internals.out_b_before == pytest.approx(out_b_before)
+
+
+def test_fast_paths_match_inspect_path():
+    samples = make_xor_dataset_pm1()
+    inspected = MlpTwoLayer(input_dim=2, hidden_dim=2, lr=0.5, seed=3)
+    stepped = MlpTwoLayer(input_dim=2, hidden_dim=2, lr=0.5, seed=3)
+    trained = MlpTwoLayer(input_dim=2, hidden_dim=2, lr=0.5, seed=3)
+    losses = []
+    for _ in range(3):
+        total = 0.0
+        for sample in samples:
+            internals = inspected.inspect_step(sample["x"], sample["y"])
+            step = stepped.step(sample["x"], sample["y"])
+            assert step.loss == internals.loss
+            total += internals.loss
+        losses.append(total / len(samples))
+    assert trained.train(samples, epochs=3) == losses
+    assert trained.hidden.W == stepped.hidden.W == inspected.hidden.W
+    assert trained.output.b == inspected.output.b
+    assert trained.last_grad_hidden == inspected.last_grad_hidden
+    assert trained.version == stepped.version == inspected.version == 3 * len(samples)
+    inspected.forward(samples[0]["x"])
+    assert inspected.version == 3 * len(samples)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from backend.core.sample_matrix import SampleMatrix
+from backend.services.dataset_store import DatasetStore
+
+
+def _matrix(n, dim, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.choice([-1.0, 1.0], size=(n, dim))
+    y = rng.choice([-1, 1], size=n)
+    return SampleMatrix(X, y)
+
+
+def test_put_is_content_addressed_and_round_trips():
+    store = DatasetStore()
+    matrix = _matrix(10, 13)
+    entry, created = store.put(matrix, (1, 13))
+    again, created_again = store.put(_matrix(10, 13), (1, 13))
+    assert created and not created_again
+    assert again.dataset_id == entry.dataset_id
+    assert len(store) == 1
+    # 13 cells pack into 2 bytes per sample, plus one label byte.
+    assert entry.nbytes == 10 * 3
+    restored = store.get(entry.dataset_id).to_matrix()
+    np.testing.assert_array_equal(restored.X, matrix.X)
+    np.testing.assert_array_equal(restored.y, matrix.y)
+    assert restored.grid_shape == (1, 13)
+
+
+def test_grid_shape_is_part_of_the_id():
+    store = DatasetStore()
+    matrix = _matrix(4, 6)
+    a, _ = store.put(matrix, (2, 3))
+    b, _ = store.put(matrix, (3, 2))
+    assert a.dataset_id != b.dataset_id
+
+
+def test_lru_eviction_by_count_and_bytes():
+    store = DatasetStore(max_datasets=2)
+    first, _ = store.put(_matrix(4, 2, seed=1), (1, 2))
+    second, _ = store.put(_matrix(4, 2, seed=2), (1, 2))
+    store.get(first.dataset_id)
+    third, _ = store.put(_matrix(4, 2, seed=3), (1, 2))
+    assert first.dataset_id in store and third.dataset_id in store
+    assert second.dataset_id not in store
+
+    small = DatasetStore(max_bytes=100)
+    a, _ = small.put(_matrix(40, 8, seed=4), (1, 8))
+    b, _ = small.put(_matrix(40, 8, seed=5), (1, 8))
+    assert a.dataset_id not in small and b.dataset_id in small
+    assert small.total_bytes == b.nbytes
+    with pytest.raises(ValueError):
+        small.put(_matrix(200, 8), (1, 8))
+
+
+def test_get_unknown_and_drop():
+    store = DatasetStore()
+    entry, _ = store.put(_matrix(3, 2), (1, 2))
+    assert store.drop(entry.dataset_id)
+    assert not store.drop(entry.dataset_id)
+    assert store.total_bytes == 0
+    with pytest.raises(KeyError):
+        store.get(entry.dataset_id)
+
+
+def test_release_drops_only_the_owners_reference():
+    store = DatasetStore(max_datasets=2)
+    entry, _ = store.put(_matrix(3, 2), (1, 2), owner="session-a")
+    store.put(_matrix(3, 2), (1, 2), owner="session-b")
+    assert store.references(entry.dataset_id) == 2
+    with pytest.raises(KeyError):
+        store.release(entry.dataset_id, "session-c")
+    assert store.release(entry.dataset_id, "session-a") == 1
+    assert store.get(entry.dataset_id) is entry
+    with pytest.raises(KeyError):
+        store.release(entry.dataset_id, "session-a")
+    assert store.release(entry.dataset_id, "session-b") == 0
+    assert entry.dataset_id not in store and store.total_bytes == 0
+
+    first, _ = store.put(_matrix(4, 2, seed=1), (1, 2), owner="session-a")
+    store.put(_matrix(4, 2, seed=2), (1, 2))
+    store.put(_matrix(4, 2, seed=3), (1, 2))
+    assert first.dataset_id not in store and store.references(first.dataset_id) == 0
@@ -0,0 +1,79 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.core.datasets import make_or_dataset_pm1, make_xor_dataset_pm1
+from backend.core.sample_matrix import SampleMatrix
+from backend.services.jobs import CANCELLED, DONE, JobManager, JobQueueFull, JobSpec
+
+
+def _threads(workers):
+    return ThreadPoolExecutor(max_workers=workers or 1)
+
+
+def _or():
+    return SampleMatrix.from_samples(make_or_dataset_pm1(), grid_shape=(1, 2))
+
+
+def test_spec_validation():
+    with pytest.raises(ValueError):
+        JobSpec(model="svm", dataset="or", grid_shape=(1, 2), epochs=5, lr=1.0)
+    with pytest.raises(ValueError):
+        JobSpec(model="mlp", dataset="or", grid_shape=(1, 2), epochs=0, lr=1.0)
+    with pytest.raises(ValueError, match="hidden_dim"):
+        JobSpec(model="mlp", dataset="or", grid_shape=(1, 2), epochs=5, lr=0.5, hidden_dim=10**6)
+    with pytest.raises(ValueError, match="model too large"):
+        JobSpec(model="mlp", dataset="custom", grid_shape=(128, 128), epochs=5, lr=0.5, hidden_dim=1000)
+    assert JobSpec(model="mlp", dataset="or", grid_shape=(1, 2), epochs=95, lr=0.5).chunk_size == 5
+
+
+def test_perceptron_job_converges_across_chunks():
+    manager = JobManager(executor_factory=_threads)
+    spec = JobSpec(model="perceptron", dataset="or", grid_shape=(1, 2), epochs=50, lr=1.0, chunk_epochs=1)
+    job = manager.wait(manager.submit(spec, _or()).id)
+    assert job.status == DONE
+    assert job.stop_reason == "converged"
+    assert job.losses[-1] == 0.0
+    assert job.epochs_done == len(job.losses) < 50
+    data = job.to_dict()
+    assert data["curves"]["accuracy"][-1] == 1.0
+    assert len(data["weights"]["w"]) == 2
+
+
+def test_mlp_job_runs_all_epochs_with_loss_curve():
+    manager = JobManager(executor_factory=_threads)
+    xor = SampleMatrix.from_samples(make_xor_dataset_pm1(), grid_shape=(1, 2))
+    spec = JobSpec(model="mlp", dataset="xor", grid_shape=(1, 2), epochs=30, lr=0.5, hidden_dim=3, chunk_epochs=7)
+    job = manager.wait(manager.submit(spec, xor).id)
+    assert job.status == DONE and job.stop_reason == "max_epochs"
+    data = job.to_dict()
+    assert len(data["curves"]["loss"]) == 30
+    assert data["progress"] == 1.0
+    assert len(data["weights"]["hidden_W"]) == 3
+
+
+def test_queue_limit_and_cancel_of_queued_job():
+    gate = threading.Event()
+    blocker = ThreadPoolExecutor(max_workers=1)
+    blocker.submit(gate.wait)
+    manager = JobManager(max_active=2, executor_factory=lambda _: blocker)
+    spec = JobSpec(model="perceptron", dataset="or", grid_shape=(1, 2), epochs=5, lr=1.0)
+    first = manager.submit(spec, _or())
+    manager.submit(spec, _or())
+    with pytest.raises(JobQueueFull):
+        manager.submit(spec, _or())
+    assert manager.cancel(first.id).status == CANCELLED
+    assert manager.active_count == 1
+    gate.set()
+    manager.shutdown()
+
+
+def test_process_pool_job():
+    manager = JobManager(workers=1)
+    try:
+        spec = JobSpec(model="perceptron", dataset="or", grid_shape=(1, 2), epochs=20, lr=1.0, chunk_epochs=5)
+        job = manager.wait(manager.submit(spec, _or()).id, timeout=60)
+        assert job.status == DONE
+    finally:
+        manager.shutdown()
@@ -0,0 +1,76 @@
+import pytest
+
+from backend.services.sessions import SessionRegistry, is_valid_session_id
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_same_id_returns_same_isolated_session():
+    registry = SessionRegistry()
+    a = registry.get_or_create("tab-aaaaaaaa")
+    b = registry.get_or_create("tab-bbbbbbbb")
+    assert registry.get_or_create("tab-aaaaaaaa") is a
+    a.perceptron.set_dataset("xor")
+    assert b.perceptron.dataset == "or"
+
+
+def test_invalid_id_gets_generated_id():
+    registry = SessionRegistry()
+    session = registry.get_or_create("bad id!")
+    assert session.id != "bad id!"
+    assert is_valid_session_id(session.id)
+    assert registry.get_or_create(None).id != session.id
+
+
+def test_lru_eviction_by_count():
+    registry = SessionRegistry(max_sessions=2)
+    registry.get_or_create("session-1")
+    registry.get_or_create("session-2")
+    registry.get_or_create("session-1")
+    registry.get_or_create("session-3")
+    assert registry.session_ids() == ["session-1", "session-3"]
+
+
+def test_idle_ttl_expires_sessions():
+    clock = _Clock()
+    registry = SessionRegistry(ttl_seconds=10.0, clock=clock)
+    first = registry.get_or_create("session-1")
+    clock.now = 11.0
+    registry.get_or_create("session-2")
+    assert "session-1" not in registry
+    assert registry.get_or_create("session-1") is not first
+
+
+def test_float_cap_evicts_heavy_sessions():
+    registry = SessionRegistry(max_floats=20)
+    old = registry.get_or_create("session-1")
+    old.perceptron
+    registry.touch(old)
+    # OR: 4 samples x 2 cells, plus w and b.
+    assert registry.total_size == 4 * 2 + 3
+    new = registry.get_or_create("session-2")
+    new.mlp
+    registry.touch(new)
+    assert registry.session_ids() == ["session-2"]
+    # XOR: 4 x 2 cells, plus a 2x2 hidden layer with biases and a 2-input output unit.
+    assert registry.total_size == 4 * 2 + (2 * 3 + 3)
+
+
+def test_session_size_counts_cells_and_kept_custom_data():
+    session = SessionRegistry().get_or_create("session-big")
+    samples = [{"x": [1.0] * 100, "y": 1}, {"x": [-1.0] * 100, "y": -1}]
+    session.perceptron.set_dataset("custom", custom=(samples, (10, 10)))
+    assert session.size() == 2 * 100 + 101
+    session.perceptron.set_dataset("or")
+    assert session.size() == 4 * 2 + 3 + 2 * 100
+
+
+def test_registry_validates_limits():
+    with pytest.raises(ValueError):
+        SessionRegistry(max_sessions=0)
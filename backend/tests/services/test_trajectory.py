@@ -0,0 +1,29 @@
+from backend.services.trajectory import RunOptions, TrajectoryRecorder
+
+
+def test_recorder_keeps_stride_and_final_step():
+    recorder = TrajectoryRecorder(RunOptions(n=5, stride=2), sample_count=4)
+    kept = []
+    while True:
+        done = recorder.advance(settled=False)
+        if recorder.should_keep(done):
+            recorder.add(value=recorder.steps)
+            kept.append(recorder.steps)
+        if done:
+            break
+    assert kept == [2, 4, 5]
+    data = recorder.to_dict()
+    assert data["step"] == data["value"] == [2, 4, 5]
+    assert data["converged"] is False
+
+
+def test_recorder_stops_after_settled_pass():
+    recorder = TrajectoryRecorder(RunOptions(n=100, until_converged=True), sample_count=3)
+    settled = [False, True, True, False, True, True, True, True]
+    stopped_at = None
+    for flag in settled:
+        if recorder.advance(settled=flag):
+            stopped_at = recorder.steps
+            break
+    assert stopped_at == 7
+    assert recorder.converged is True
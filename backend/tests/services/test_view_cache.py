@@ -0,0 +1,35 @@
+from backend.services.mlp_service import MlpService
+from backend.services.view_cache import ViewCache
+
+
+def test_views_live_for_one_version():
+    cache = ViewCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get(0, "evals", compute) == 1
+    assert cache.get(0, "evals", compute) == 1
+    assert cache.get(1, "evals", compute) == 2
+    assert cache.get(1, "other", compute) == 3
+    assert cache.stats() == {"version": 1, "views": 2, "hits": 1, "misses": 3}
+    cache.clear()
+    assert cache.get(1, "evals", compute) == 4
+
+
+def test_mlp_snapshot_reuses_views_until_weights_change():
+    service = MlpService(dataset="xor", hidden_dim=3)
+    first = service.snapshot()
+    again = service.snapshot()
+    assert again["evals"] is first["evals"]
+    assert again["hidden"]["templates"] is first["hidden"]["templates"]
+
+    stepped, _ = service.step()
+    assert stepped["evals"] is not first["evals"]
+    assert [item["p_hat"] for item in stepped["evals"]] == service._eval_probs()
+    assert service.snapshot()["evals"] is stepped["evals"]
+
+    service.set_dataset("or")
+    assert service.snapshot()["evals"] is not stepped["evals"]
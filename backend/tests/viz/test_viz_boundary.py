@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from backend.core.datasets import make_xor_dataset_pm1
+from backend.core.kernel_perceptron import KernelPerceptron
+from backend.nn.mlp import MlpTwoLayer
+from backend.viz.viz_boundary import (
+    RasterSpec,
+    kernel_score_raster,
+    linear_score_raster,
+    mlp_probability_raster,
+    quantize_raster,
+    raster_payload,
+)
+
+
+def test_raster_spec_validation_and_levels():
+    with pytest.raises(ValueError, match="between 2 and 512"):
+        RasterSpec(height=1)
+    with pytest.raises(ValueError, match="y_min must be less than y_max"):
+        RasterSpec(y_range=(1.0, 1.0))
+    spec = RasterSpec(height=64, width=40)
+    assert [(s.height, s.width) for s in spec.levels()] == [(16, 10), (32, 20), (64, 40)]
+    assert RasterSpec(height=8, width=8).levels() == [RasterSpec(height=8, width=8)]
+    points = RasterSpec(height=3, width=2, x_range=(0.0, 1.0), y_range=(-1.0, 1.0)).points()
+    assert points.tolist() == [[0, -1], [1, -1], [0, 0], [1, 0], [0, 1], [1, 1]]
+
+
+def test_rasters_match_pointwise_models():
+    spec = RasterSpec(height=5, width=4)
+    points = spec.points()
+    mlp = MlpTwoLayer(input_dim=2, hidden_dim=3, seed=4)
+    probs = mlp_probability_raster(mlp.hidden.W, mlp.hidden.b, mlp.output.W, mlp.output.b, spec)
+    assert probs.shape == (5, 4)
+    assert probs.ravel() == pytest.approx([mlp.forward(p) for p in points])
+
+    scores = linear_score_raster([1.0, -2.0], 0.5, spec)
+    assert scores.ravel() == pytest.approx(points @ [1.0, -2.0] + 0.5)
+    with pytest.raises(ValueError, match="2D inputs"):
+        linear_score_raster([1.0, 2.0, 3.0], 0.0, spec)
+
+    model = KernelPerceptron(make_xor_dataset_pm1(), seed=0)
+    model.train_epoch(shuffle=False)
+    support = model.support
+    grid = kernel_score_raster(model.kernel.matrix, model.X[support], model.alpha[support] * model.y[support], model.b, spec)
+    assert grid.ravel() == pytest.approx(model.decision_function(points))
+
+
+def test_quantized_payload():
+    values = np.array([[0.0, 0.5], [1.0, 0.25]])
+    assert quantize_raster(values, 0.0, 1.0).tolist() == [[0, 128], [255, 64]]
+    payload = raster_payload(values, RasterSpec(height=2, width=2), "probability", 3, quantize=True)
+    assert payload["encoding"] == "uint8" and payload["version"] == 3
+    assert "values" not in payload
+    scores = raster_payload(np.array([[-2.0, 1.0]]), RasterSpec(height=2, width=2), "score", 0)
+    assert scores["range"] == [-2.0, 2.0]
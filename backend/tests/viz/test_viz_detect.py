@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from backend.viz.viz_detect import choose_method, correlate_many, mlp_score_maps, score_map, top_placements
+from backend.viz.viz_grid import score_from_grid
+
+
+def _reference(board, template, b=0.0):
+    h, w = len(template), len(template[0])
+    return [
+        [score_from_grid([row[c:c + w] for row in board[r:r + h]], template, b) for c in range(len(board[0]) - w + 1)]
+        for r in range(len(board) - h + 1)
+    ]
+
+
+@pytest.mark.parametrize("method", ["direct", "fft", "auto"])
+def test_score_map_matches_score_from_grid(method):
+    rng = np.random.default_rng(0)
+    board = rng.choice([-1.0, 1.0], size=(9, 11)).tolist()
+    template = rng.normal(size=(3, 4)).tolist()
+    np.testing.assert_allclose(score_map(board, template, b=0.5, method=method), _reference(board, template, 0.5))
+
+
+def test_summed_area_for_constant_templates():
+    board = np.arange(30, dtype=float).reshape(5, 6)
+    template = np.full((2, 3), 0.5)
+    assert choose_method(board.shape, template) == "summed_area"
+    np.testing.assert_allclose(score_map(board, template, method="summed_area"), _reference(board.tolist(), template.tolist()))
+    with pytest.raises(ValueError):
+        score_map(board, [[1.0, 2.0]], method="summed_area")
+
+
+def test_auto_prefers_fft_for_large_templates():
+    assert choose_method((256, 256), np.eye(3)) == "direct"
+    assert choose_method((256, 256), np.eye(48)) == "fft"
+
+
+def test_validation_errors():
+    with pytest.raises(ValueError):
+        score_map([[1.0]], [[1.0, 1.0]])
+    with pytest.raises(ValueError):
+        score_map([[1.0]], [[1.0]], method="sobel")
+    with pytest.raises(ValueError):
+        correlate_many([[1.0]], [])
+
+
+def test_mlp_maps_and_peaks():
+    board = np.zeros((4, 4))
+    board[1:3, 2:4] = 1.0
+    templates = [np.ones((2, 2)).tolist(), (-np.ones((2, 2))).tolist()]
+    hidden, output, used = mlp_score_maps(board, templates, [0.0, 0.0], [1.0, -1.0], 0.0)
+    assert hidden.shape == (2, 3, 3)
+    assert used == ["summed_area", "summed_area"]
+    expected = 1.0 / (1.0 + np.exp(-(np.tanh(hidden[0]) - np.tanh(hidden[1]))))
+    np.testing.assert_allclose(output, expected)
+    peaks = top_placements(output, k=2)
+    assert peaks[0]["row"] == 1 and peaks[0]["col"] == 2
+    assert peaks[0]["score"] >= peaks[1]["score"]
+    assert top_placements(output, k=0) == []
@@ -1,7 +1,9 @@
+import sys
+
 import pytest
 
 from backend.core.datasets import make_or_dataset_pm1
-from backend.viz.viz_error_surface import mse_surface, plot_surface
+from backend.viz.viz_error_surface import MAX_SURFACE_STEPS, mse_minimum, mse_stats, mse_surface, plot_surface
 
 
 def test_mse_surface_shape():
@@ -11,17 +13,49 @@ def test_mse_surface_shape():
     assert len(grid[0]) == 5
 
 
+def _brute_force(samples, w1, w2, b):
+    total = 0.0
+    for s in samples:
+        diff = s["y"] - (w1 * s["x"][0] + w2 * s["x"][1] + b)
+        total += 0.5 * diff * diff
+    return total / len(samples)
+
+
+def test_mse_surface_matches_per_sample_loss():
+    samples = [
+        {"x": [1, -1], "y": 1},
+        {"x": [-1, -1], "y": -1},
+        {"x": [1, 1], "y": 1},
+    ]
+    grid = mse_surface(samples, (-2.0, 2.0), steps=5, b=0.3)
+    for i, w1 in enumerate([-2.0, -1.0, 0.0, 1.0, 2.0]):
+        for j, w2 in enumerate([-2.0, -1.0, 0.0, 1.0, 2.0]):
+            assert grid[i][j] == pytest.approx(_brute_force(samples, w1, w2, 0.3))
+
+
+def test_mse_minimum_is_analytic_optimum():
+    samples = make_or_dataset_pm1()
+    best = mse_minimum(mse_stats(samples), b=0.0)
+    assert best["w1"] == pytest.approx(0.5)
+    assert best["w2"] == pytest.approx(0.5)
+    assert best["loss"] == pytest.approx(_brute_force(samples, 0.5, 0.5, 0.0))
+    # Singular design (all x identical) falls back to the minimum-norm solution.
+    flat = mse_minimum(mse_stats([{"x": [1, 1], "y": 1}, {"x": [1, 1], "y": 1}]), b=0.0)
+    assert flat["w1"] == pytest.approx(0.5)
+    assert flat["loss"] == pytest.approx(0.0)
+
+
 def test_mse_surface_validates_inputs():
     samples = make_or_dataset_pm1()
     with pytest.raises(ValueError):
         mse_surface(samples, (1.0, -1.0), steps=5)
     with pytest.raises(ValueError):
         mse_surface(samples, (-1.0, 1.0), steps=1)
+    with pytest.raises(ValueError, match="between 2 and"):
+        mse_surface(samples, (-1.0, 1.0), steps=MAX_SURFACE_STEPS + 1)
 
 
 def test_plot_surface_requires_matplotlib(monkeypatch):
-    import backend.viz.viz_error_surface as mod
-
-    monkeypatch.setattr(mod, "plt", None)
+    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", None)
     with pytest.raises(RuntimeError):
         plot_surface([[0.0]])
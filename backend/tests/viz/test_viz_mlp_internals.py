@@ -1,16 +1,18 @@
+import sys
+
 import pytest
 
 from backend.viz import viz_mlp_internals
 
 
 def test_plot_heatmap_requires_matplotlib(monkeypatch):
-    monkeypatch.setattr(viz_mlp_internals, "plt", None)
+    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", None)
     with pytest.raises(RuntimeError):
         viz_mlp_internals.plot_heatmap([[1.0]])
 
 
 def test_plot_templates_requires_matplotlib(monkeypatch):
-    monkeypatch.setattr(viz_mlp_internals, "plt", None)
+    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", None)
     with pytest.raises(RuntimeError):
         viz_mlp_internals.plot_templates([[[1.0]]])
 
@@ -74,7 +76,7 @@ class _FakePlt:
 
 def test_plot_heatmap_draws_with_title(monkeypatch):
     fake = _FakePlt()
-    monkeypatch.setattr(viz_mlp_internals, "plt", fake)
+    monkeypatch.setattr(viz_mlp_internals, "load_pyplot", lambda: fake)
     viz_mlp_internals.plot_heatmap([[1.0, -1.0]], title="Example")
     assert fake.imshow_calls == 1
     assert fake.colorbar_calls == 1
@@ -83,7 +85,7 @@ def test_plot_heatmap_draws_with_title(monkeypatch):
 
 def test_plot_templates_draws_and_hides_unused_axes(monkeypatch):
     fake = _FakePlt()
-    monkeypatch.setattr(viz_mlp_internals, "plt", fake)
+    monkeypatch.setattr(viz_mlp_internals, "load_pyplot", lambda: fake)
     templates = [
         [[1.0, -1.0]],
         [[-1.0, 1.0]],
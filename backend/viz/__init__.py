@@ -1,6 +1,40 @@
-"""Visualization helpers."""
+"""Visualization helpers.
 
-from .viz_mlp_internals import plot_heatmap, plot_templates
-from .viz_error_surface import mse_surface, plot_surface
+Submodules are imported on first attribute access, so importing
+backend.viz (or one of its submodules) does not load the others.
+"""
 
-__all__ = ["plot_heatmap", "plot_templates", "mse_surface", "plot_surface"]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "plot_heatmap": "viz_mlp_internals",
+    "plot_templates": "viz_mlp_internals",
+    "mse_minimum": "viz_error_surface",
+    "mse_stats": "viz_error_surface",
+    "mse_surface": "viz_error_surface",
+    "mse_surface_from_stats": "viz_error_surface",
+    "plot_surface": "viz_error_surface",
+    "correlate_many": "viz_detect",
+    "mlp_score_maps": "viz_detect",
+    "score_map": "viz_detect",
+    "top_placements": "viz_detect",
+    "RasterSpec": "viz_boundary",
+    "kernel_score_raster": "viz_boundary",
+    "linear_score_raster": "viz_boundary",
+    "mlp_probability_raster": "viz_boundary",
+    "quantize_raster": "viz_boundary",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,14 @@
+"""Deferred matplotlib loading shared by the plotting helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def load_pyplot() -> Any:
+    """Import matplotlib.pyplot on first use; importing backend.viz never pays for it."""
+    try:
+        import matplotlib.pyplot as plt  # type: ignore
+    except Exception as exc:
+        raise RuntimeError("matplotlib is required for plotting") from exc
+    return plt
@@ -0,0 +1,157 @@
+"""Decision-region rasters over the 2D input plane.
+
+The lattice matches KernelPerceptron.decision_grid: `width` points span
+x_range (columns) and `height` points span y_range (rows), endpoints
+included, with row r at y_range[0] + r * dy, so the first row is the
+bottom of the plane.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import base64
+import math
+
+import numpy as np
+
+from backend.nn.activations import sigmoid_array, tanh_array
+
+MAX_RASTER_SIDE = 512
+DEFAULT_RASTER_SIDE = 64
+DEFAULT_PLANE_RANGE = (-1.5, 1.5)
+# Coarsest level of a progressive response.
+MIN_LEVEL_SIDE = 8
+# Points per kernel evaluation chunk, bounding the (points, support) matrix.
+KERNEL_CHUNK = 4096
+
+
+@dataclass(frozen=True)
+class RasterSpec:
+    height: int = DEFAULT_RASTER_SIDE
+    width: int = DEFAULT_RASTER_SIDE
+    x_range: Tuple[float, float] = DEFAULT_PLANE_RANGE
+    y_range: Tuple[float, float] = DEFAULT_PLANE_RANGE
+
+    def __post_init__(self) -> None:
+        if not (2 <= self.height <= MAX_RASTER_SIDE and 2 <= self.width <= MAX_RASTER_SIDE):
+            raise ValueError(f"height and width must be between 2 and {MAX_RASTER_SIDE}")
+        for axis, (lo, hi) in (("x", self.x_range), ("y", self.y_range)):
+            if not (math.isfinite(lo) and math.isfinite(hi) and lo < hi):
+                raise ValueError(f"{axis}_min must be less than {axis}_max")
+
+    def points(self) -> np.ndarray:
+        """(height * width, 2) lattice points, row-major."""
+        xs = np.linspace(self.x_range[0], self.x_range[1], self.width)
+        ys = np.linspace(self.y_range[0], self.y_range[1], self.height)
+        gx, gy = np.meshgrid(xs, ys)
+        return np.column_stack([gx.ravel(), gy.ravel()])
+
+    def levels(self) -> List["RasterSpec"]:
+        """Coarse-to-fine specs ending with self; each halves the next one's sides, down to MIN_LEVEL_SIDE."""
+        specs = [self]
+        while min(specs[-1].height, specs[-1].width) >= 2 * MIN_LEVEL_SIDE:
+            last = specs[-1]
+            specs.append(replace(last, height=-(-last.height // 2), width=-(-last.width // 2)))
+        return specs[::-1]
+
+
+def _require_2d(dim: int) -> None:
+    if dim != 2:
+        raise ValueError("boundary requires 2D inputs (grid_rows * grid_cols == 2)")
+
+
+def mlp_probability_raster(
+    hidden_W: Sequence[Sequence[float]],
+    hidden_b: Sequence[float],
+    out_W: Sequence[Sequence[float]],
+    out_b: Sequence[float],
+    spec: RasterSpec,
+) -> np.ndarray:
+    """p(y=+1) of a tanh/sigmoid two-layer MLP at every lattice point, in one batched pass."""
+    W = np.asarray(hidden_W, dtype=np.float64)
+    _require_2d(W.shape[1])
+    hidden = tanh_array(spec.points() @ W.T + np.asarray(hidden_b, dtype=np.float64))
+    logits = hidden @ np.asarray(out_W, dtype=np.float64).T + np.asarray(out_b, dtype=np.float64)
+    return sigmoid_array(logits[:, 0]).reshape(spec.height, spec.width)
+
+
+def linear_score_raster(w: Sequence[float], b: float, spec: RasterSpec) -> np.ndarray:
+    """w . x + b at every lattice point."""
+    w_arr = np.asarray(w, dtype=np.float64)
+    _require_2d(w_arr.shape[0])
+    return (spec.points() @ w_arr + b).reshape(spec.height, spec.width)
+
+
+def kernel_score_raster(
+    kernel_matrix: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    support_vectors: np.ndarray,
+    coef: np.ndarray,
+    b: float,
+    spec: RasterSpec,
+) -> np.ndarray:
+    """sum_j coef_j k(x_j, x) + b at every lattice point (coef = alpha * y over the support)."""
+    _require_2d(support_vectors.shape[1])
+    points = spec.points()
+    out = np.full(points.shape[0], b, dtype=np.float64)
+    if coef.size:
+        for start in range(0, points.shape[0], KERNEL_CHUNK):
+            stop = start + KERNEL_CHUNK
+            out[start:stop] += kernel_matrix(points[start:stop], support_vectors) @ coef
+    return out.reshape(spec.height, spec.width)
+
+
+def value_range(values: np.ndarray, kind: str) -> Tuple[float, float]:
+    """Probabilities span [0, 1]; scores a range symmetric about 0, so the boundary stays at mid-scale."""
+    if kind == "probability":
+        return 0.0, 1.0
+    bound = float(np.max(np.abs(values))) if values.size else 0.0
+    bound = bound if bound > 0 and math.isfinite(bound) else 1.0
+    return -bound, bound
+
+
+def quantize_raster(values: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """uint8 codes q with value ~= lo + q * (hi - lo) / 255."""
+    scaled = (np.asarray(values, dtype=np.float64) - lo) * (255.0 / (hi - lo))
+    return np.clip(np.rint(scaled), 0, 255).astype(np.uint8)
+
+
+def raster_payload(
+    values: np.ndarray,
+    spec: RasterSpec,
+    kind: str,
+    version: int,
+    quantize: bool = False,
+) -> Dict[str, Any]:
+    lo, hi = value_range(values, kind)
+    payload: Dict[str, Any] = {
+        "kind": kind,
+        "version": version,
+        "height": spec.height,
+        "width": spec.width,
+        "x_range": list(spec.x_range),
+        "y_range": list(spec.y_range),
+        "range": [lo, hi],
+    }
+    if quantize:
+        payload["encoding"] = "uint8"
+        payload["data"] = base64.b64encode(quantize_raster(values, lo, hi).tobytes()).decode("ascii")
+    else:
+        payload["values"] = values
+    return payload
+
+
+@dataclass(frozen=True)
+class BoundarySource:
+    """A model's decision field at one weight version.
+
+    raster works on copies of the weights, so it may be called after the
+    model's lock is released (e.g. while streaming finer levels).
+    """
+
+    kind: str
+    version: int
+    raster: Callable[[RasterSpec], np.ndarray]
+
+    def payload(self, spec: RasterSpec, quantize: bool = False) -> Dict[str, Any]:
+        return raster_payload(self.raster(spec), spec, self.kind, self.version, quantize)
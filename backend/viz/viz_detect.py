@@ -0,0 +1,150 @@
+"""Sliding-window template scoring over a whole board in one pass.
+
+For a board B (H x W) and a template T (h x w), the score of placing T with
+its top-left corner at (r, c) is sum_ij B[r + i, c + j] * T[i, j] + b, i.e.
+score_from_grid for every placement. The full (H - h + 1, W - w + 1) map is
+a 2D cross-correlation, computed one of three ways:
+
+- "summed_area": constant templates reduce to box sums of an integral image;
+- "direct": one shifted-slice multiply-add per template cell (cheap for the
+  small templates this project trains);
+- "fft": correlation via rfft2, cheaper once templates get large.
+
+"auto" picks by a simple operation-count estimate.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from backend.nn.activations import sigmoid_array, tanh_array
+
+METHODS = ("auto", "direct", "summed_area", "fft")
+
+
+def _as_grid(values: Sequence[Sequence[float]] | np.ndarray, name: str) -> np.ndarray:
+    grid = np.asarray(values, dtype=np.float64)
+    if grid.ndim != 2 or grid.size == 0:
+        raise ValueError(f"{name} must be a non-empty 2D grid")
+    return grid
+
+
+def choose_method(board_shape: Tuple[int, int], template: np.ndarray) -> str:
+    if np.all(template == template.flat[0]):
+        return "summed_area"
+    H, W = board_shape
+    h, w = template.shape
+    direct_ops = (H - h + 1) * (W - w + 1) * h * w
+    fft_ops = 5 * H * W * max(1.0, np.log2(H * W))
+    return "direct" if direct_ops <= fft_ops else "fft"
+
+
+def _direct(board: np.ndarray, template: np.ndarray) -> np.ndarray:
+    h, w = template.shape
+    out_h = board.shape[0] - h + 1
+    out_w = board.shape[1] - w + 1
+    out = np.zeros((out_h, out_w), dtype=np.float64)
+    for i in range(h):
+        for j in range(w):
+            weight = template[i, j]
+            if weight != 0.0:
+                out += weight * board[i:i + out_h, j:j + out_w]
+    return out
+
+
+def _summed_area(board: np.ndarray, template: np.ndarray) -> np.ndarray:
+    h, w = template.shape
+    integral = np.zeros((board.shape[0] + 1, board.shape[1] + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(board, axis=0), axis=1, out=integral[1:, 1:])
+    box = integral[h:, w:] - integral[:-h, w:] - integral[h:, :-w] + integral[:-h, :-w]
+    return template.flat[0] * box
+
+
+def _fft(board_spectrum: np.ndarray, board_shape: Tuple[int, int], template: np.ndarray) -> np.ndarray:
+    # Circular convolution with the flipped template; only the first h-1 rows
+    # and w-1 columns wrap around, and those fall outside the valid region.
+    H, W = board_shape
+    h, w = template.shape
+    kernel = np.fft.rfft2(template[::-1, ::-1], s=(H, W))
+    full = np.fft.irfft2(board_spectrum * kernel, s=(H, W))
+    return full[h - 1:, w - 1:]
+
+
+def correlate_many(
+    board: Sequence[Sequence[float]] | np.ndarray,
+    templates: Sequence[Sequence[Sequence[float]]] | np.ndarray,
+    method: str = "auto",
+) -> Tuple[np.ndarray, List[str]]:
+    """Valid cross-correlation of board with each template; returns (k, H-h+1, W-w+1) and methods used.
+
+    All templates must share a shape. The board spectrum is computed at most
+    once and reused across templates.
+    """
+    if method not in METHODS:
+        raise ValueError("method must be one of: auto, direct, summed_area, fft")
+    board = _as_grid(board, "board")
+    stack = np.asarray(templates, dtype=np.float64)
+    if stack.ndim != 3 or stack.shape[0] == 0 or stack.shape[1] == 0 or stack.shape[2] == 0:
+        raise ValueError("templates must be a non-empty list of equally sized 2D grids")
+    h, w = stack.shape[1:]
+    if h > board.shape[0] or w > board.shape[1]:
+        raise ValueError("template does not fit on board")
+    spectrum = None
+    maps = []
+    used = []
+    for template in stack:
+        chosen = choose_method(board.shape, template) if method == "auto" else method
+        if chosen == "summed_area" and not np.all(template == template.flat[0]):
+            raise ValueError("summed_area requires a constant template")
+        if chosen == "direct":
+            maps.append(_direct(board, template))
+        elif chosen == "summed_area":
+            maps.append(_summed_area(board, template))
+        else:
+            if spectrum is None:
+                spectrum = np.fft.rfft2(board)
+            maps.append(_fft(spectrum, board.shape, template))
+        used.append(chosen)
+    return np.stack(maps), used
+
+
+def score_map(
+    board: Sequence[Sequence[float]] | np.ndarray,
+    template: Sequence[Sequence[float]] | np.ndarray,
+    b: float = 0.0,
+    method: str = "auto",
+) -> np.ndarray:
+    """score_from_grid(window, template, b) for every placement of template on board."""
+    maps, _ = correlate_many(board, [_as_grid(template, "template")], method=method)
+    return maps[0] + b
+
+
+def mlp_score_maps(
+    board: Sequence[Sequence[float]] | np.ndarray,
+    hidden_templates: Sequence[Sequence[Sequence[float]]],
+    hidden_b: Sequence[float],
+    out_w: Sequence[float],
+    out_b: float,
+    method: str = "auto",
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Hidden pre-activation maps and the MLP output probability at every placement."""
+    if len(hidden_b) != len(hidden_templates) or len(out_w) != len(hidden_templates):
+        raise ValueError("hidden biases and output weights must match the template count")
+    maps, used = correlate_many(board, hidden_templates, method=method)
+    hidden = maps + np.asarray(hidden_b, dtype=np.float64)[:, None, None]
+    logits = np.tensordot(np.asarray(out_w, dtype=np.float64), tanh_array(hidden), axes=1) + out_b
+    return hidden, sigmoid_array(logits), used
+
+
+def top_placements(scores: np.ndarray, k: int = 5) -> List[Dict[str, float]]:
+    """The k highest-scoring placements, best first, as {"row", "col", "score"}."""
+    if k <= 0:
+        return []
+    flat = scores.ravel()
+    k = min(k, flat.size)
+    best = np.argpartition(flat, flat.size - k)[flat.size - k:]
+    best = best[np.argsort(flat[best])[::-1]]
+    cols = scores.shape[1]
+    return [{"row": int(i // cols), "col": int(i % cols), "score": float(flat[i])} for i in best]
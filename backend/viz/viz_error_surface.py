@@ -2,12 +2,88 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
 
-try:
-    import matplotlib.pyplot as plt  # type: ignore
-except Exception:  # pragma: no cover
-    plt = None
+import numpy as np
+
+from backend.core.sample_matrix import SampleMatrix
+from backend.viz._pyplot import load_pyplot
+
+# The surface is steps x steps float64 (plus same-sized temporaries): 2 MB at the cap.
+MAX_SURFACE_STEPS = 512
+
+
+@dataclass
+class MseStats:
+    """Sufficient statistics of a 2D dataset for the MSE quadratic form."""
+
+    n: int
+    sxx: np.ndarray
+    sxy: np.ndarray
+    sx: np.ndarray
+    sy: float
+    syy: float
+
+    def centered(self, b: float) -> Tuple[np.ndarray, float]:
+        """Return (sum r*x, sum r^2) for residual targets r = y - b."""
+        srx = self.sxy - b * self.sx
+        srr = self.syy - 2.0 * b * self.sy + self.n * b * b
+        return srx, srr
+
+
+def mse_stats(samples: Iterable[dict]) -> MseStats:
+    """Accumulate sum(x x^T), sum(x y), sum(x), sum(y), sum(y^2) in one pass."""
+    matrix = SampleMatrix.from_samples(samples)
+    if matrix.dim != 2:
+        raise ValueError("mse surface requires 2D inputs")
+    X = matrix.X
+    y = matrix.y_float
+    return MseStats(
+        n=len(matrix),
+        sxx=X.T @ X,
+        sxy=X.T @ y,
+        sx=X.sum(axis=0),
+        sy=float(y.sum()),
+        syy=float(y @ y),
+    )
+
+
+def _check_steps(steps: int) -> None:
+    if not 1 < steps <= MAX_SURFACE_STEPS:
+        raise ValueError(f"steps must be between 2 and {MAX_SURFACE_STEPS}")
+
+
+def mse_surface_from_stats(
+    stats: MseStats,
+    w_range: Tuple[float, float],
+    steps: int = 25,
+    b: float = 0.0,
+) -> np.ndarray:
+    """Evaluate the MSE grid (rows are w1, columns are w2) without touching samples."""
+    _check_steps(steps)
+    w_min, w_max = w_range
+    if w_min >= w_max:
+        raise ValueError("w_range must be increasing")
+    axis = np.linspace(w_min, w_max, steps)
+    w1 = axis[:, None]
+    w2 = axis[None, :]
+    srx, srr = stats.centered(b)
+    quad = stats.sxx[0, 0] * w1 * w1 + 2.0 * stats.sxx[0, 1] * w1 * w2 + stats.sxx[1, 1] * w2 * w2
+    lin = srx[0] * w1 + srx[1] * w2
+    return 0.5 * (srr - 2.0 * lin + quad) / stats.n
+
+
+def mse_minimum(stats: MseStats, b: float = 0.0) -> Dict[str, float]:
+    """Analytic minimiser of the MSE over (w1, w2) at fixed bias.
+
+    Solves the normal equations sum(x x^T) w = sum((y - b) x); singular
+    datasets get the minimum-norm solution.
+    """
+    srx, srr = stats.centered(b)
+    w, *_ = np.linalg.lstsq(stats.sxx, srx, rcond=None)
+    loss = 0.5 * (srr - 2.0 * float(w @ srx) + float(w @ stats.sxx @ w)) / stats.n
+    return {"w1": float(w[0]), "w2": float(w[1]), "loss": max(loss, 0.0)}
 
 
 def mse_surface(
@@ -17,33 +93,14 @@ def mse_surface(
     b: float = 0.0,
 ) -> List[List[float]]:
     """Compute MSE surface for 2D weights over a grid."""
-    if steps <= 1:
-        raise ValueError("steps must be > 1")
-    w_min, w_max = w_range
-    if w_min >= w_max:
+    _check_steps(steps)
+    if w_range[0] >= w_range[1]:
         raise ValueError("w_range must be increasing")
-    data = list(samples)
-    grid: List[List[float]] = []
-    for i in range(steps):
-        w1 = w_min + (w_max - w_min) * i / (steps - 1)
-        row: List[float] = []
-        for j in range(steps):
-            w2 = w_min + (w_max - w_min) * j / (steps - 1)
-            loss = 0.0
-            for sample in data:
-                x1, x2 = sample["x"]
-                y = sample["y"]
-                y_hat = w1 * x1 + w2 * x2 + b
-                diff = y - y_hat
-                loss += 0.5 * diff * diff
-            row.append(loss / len(data))
-        grid.append(row)
-    return grid
+    return mse_surface_from_stats(mse_stats(samples), w_range, steps=steps, b=b).tolist()
 
 
 def plot_surface(grid: List[List[float]], title: str = "MSE surface") -> None:
-    if plt is None:
-        raise RuntimeError("matplotlib is required for plotting")
+    plt = load_pyplot()
     plt.imshow(grid, cmap="viridis")
     plt.colorbar()
     plt.title(title)
@@ -4,15 +4,11 @@ from __future__ import annotations
 
 from typing import List
 
-try:
-    import matplotlib.pyplot as plt  # type: ignore
-except Exception:  # pragma: no cover
-    plt = None
+from backend.viz._pyplot import load_pyplot
 
 
 def plot_heatmap(grid: List[List[float]], title: str = "") -> None:
-    if plt is None:
-        raise RuntimeError("matplotlib is required for plotting")
+    plt = load_pyplot()
     plt.imshow(grid, cmap="coolwarm")
     plt.colorbar()
     if title:
@@ -20,8 +16,7 @@ def plot_heatmap(grid: List[List[float]], title: str = "") -> None:
 
 
 def plot_templates(templates: List[List[List[float]]], title_prefix: str = "Template") -> None:
-    if plt is None:
-        raise RuntimeError("matplotlib is required for plotting")
+    plt = load_pyplot()
     count = len(templates)
     cols = min(4, count)
     rows = (count + cols - 1) // cols
@@ -1,6 +1,7 @@
 import { useCallback, useState } from "react";
 import type { CustomConfig, LmsState, LmsStep } from "../types";
 import { buildCustomPayload } from "../../utils/custom";
+import { sessionHeaders } from "../../utils/session";
 
 type ResetOptions = {
   datasetName?: string;
@@ -20,7 +21,7 @@ export function useLmsApi(apiBase: string) {
     setLoading(true);
     setError(null);
     try {
-      const res = await fetch(`${apiBase}/lms/state`);
+      const res = await fetch(`${apiBase}/lms/state`, { headers: sessionHeaders() });
       if (!res.ok) {
         setError(`API error: ${res.status}`);
         return;
@@ -38,7 +39,7 @@ export function useLmsApi(apiBase: string) {
     setLoading(true);
     setError(null);
     try {
-      const res = await fetch(`${apiBase}/lms/step`, { method: "POST", headers: { "Content-Type": "application/json" } });
+      const res = await fetch(`${apiBase}/lms/step`, { method: "POST", headers: sessionHeaders({ "Content-Type": "application/json" }) });
       if (!res.ok) {
         setError(`API error: ${res.status}`);
         return;
@@ -88,7 +89,7 @@ export function useLmsApi(apiBase: string) {
       }
       const res = await fetch(`${apiBase}/lms/reset`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: sessionHeaders({ "Content-Type": "application/json" }),
         body: JSON.stringify(body),
       });
       if (!res.ok) {
@@ -1,6 +1,7 @@
 import { useCallback, useState } from "react";
 import type { CustomConfig, MlpTrainerResponse, MlpTrainerSnapshot, MlpInternalsResponse } from "../types";
 import { buildCustomPayload } from "../../utils/custom";
+import { sessionHeaders } from "../../utils/session";
 
 type ResetOptions = {
   datasetName?: string;
@@ -38,7 +39,7 @@ export function useMlpTrainerApi(apiBase: string) {
       if (typeof options.seed === "number") body.seed = options.seed;
       const res = await fetch(`${apiBase}/mlp/reset`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: sessionHeaders({ "Content-Type": "application/json" }),
         body: JSON.stringify(body),
       });
       if (!res.ok) {
@@ -61,7 +62,7 @@ export function useMlpTrainerApi(apiBase: string) {
     try {
       const res = await fetch(`${apiBase}/mlp/step`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: sessionHeaders({ "Content-Type": "application/json" }),
       });
       if (!res.ok) {
         setError(`API error: ${res.status}`);
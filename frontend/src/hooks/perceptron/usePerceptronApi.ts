@@ -2,6 +2,7 @@ import { useCallback, useState } from "react";
 import type { LastStep } from "../types";
 import type { CustomConfig } from "../types";
 import { buildCustomPayload } from "../../utils/custom";
+import { sessionHeaders } from "../../utils/session";
 
 export type ApiState = {
   datasetName: string;
@@ -53,7 +54,7 @@ export function usePerceptronApi(initialState: ApiState = DEFAULT_STATE) {
         }
         const res = await fetch(`${config.apiBase}/reset`, {
           method: "POST",
-          headers: { "Content-Type": "application/json" },
+          headers: sessionHeaders({ "Content-Type": "application/json" }),
           body: JSON.stringify(payload),
         });
         if (!res.ok) {
@@ -91,7 +92,7 @@ export function usePerceptronApi(initialState: ApiState = DEFAULT_STATE) {
       try {
         const res = await fetch(`${config.apiBase}/step`, {
           method: "POST",
-          headers: { "Content-Type": "application/json" },
+          headers: sessionHeaders({ "Content-Type": "application/json" }),
           body: JSON.stringify({ dataset: state.datasetName, lr: config.lr }),
         });
         if (!res.ok) {
@@ -0,0 +1,26 @@
+export const SESSION_HEADER = "X-Session-Id";
+const STORAGE_KEY = "perceptron-session-id";
+
+function randomId(): string {
+  if (typeof crypto !== "undefined" && typeof crypto.randomUUID === "function") {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+}
+
+// One id per browser tab, so each tab trains its own backend models.
+export function getSessionId(): string {
+  try {
+    const existing = window.sessionStorage.getItem(STORAGE_KEY);
+    if (existing) return existing;
+    const id = randomId();
+    window.sessionStorage.setItem(STORAGE_KEY, id);
+    return id;
+  } catch {
+    return randomId();
+  }
+}
+
+export function sessionHeaders(headers: Record<string, string> = {}): Record<string, string> {
+  return { ...headers, [SESSION_HEADER]: getSessionId() };
+}
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Latency of /step and /mlp/step as the custom grid grows (large-grid mode).
+
+Usage: python scripts/bench_large_grid.py [--sides 5 16 32 64 128] [--samples 16] [--repeat 20]
+
+Runs the app in-process through TestClient, so numbers include routing,
+validation, JSON encoding and payload compaction but no network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.api_app import app  # noqa: E402
+
+
+def make_samples(side: int, count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {"grid": [[rng.choice((-1, 1)) for _ in range(side)] for _ in range(side)], "y": rng.choice((-1, 1))}
+        for _ in range(count)
+    ]
+
+
+def time_calls(client: TestClient, path: str, body: Dict[str, Any], headers: Dict[str, str], repeat: int):
+    times = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.post(path, json=body, headers=headers)
+        times.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    return statistics.median(times), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Large-grid /step and /mlp/step latency")
+    parser.add_argument("--sides", nargs="+", type=int, default=[5, 16, 32, 64, 128])
+    parser.add_argument("--samples", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--full-weights", action="store_true", help="request full payloads instead of previews")
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    print(f"{'grid':>9}  {'/step ms':>9}  {'bytes':>9}  {'/mlp/step ms':>12}  {'bytes':>9}")
+    for side in args.sides:
+        headers = {"X-Session-Id": f"bench-large-grid-{side}"}
+        dataset = {
+            "dataset": "custom",
+            "large_grid": True,
+            "grid_rows": side,
+            "grid_cols": side,
+            "samples": make_samples(side, args.samples),
+        }
+        client.post("/reset", json=dataset, headers=headers).raise_for_status()
+        client.post("/mlp/reset", json=dataset, headers=headers).raise_for_status()
+        body = {"full_weights": True} if args.full_weights else {}
+        step_ms, step_bytes = time_calls(client, "/step", body, headers, args.repeat)
+        mlp_ms, mlp_bytes = time_calls(client, "/mlp/step", body, headers, args.repeat)
+        print(f"{side:>4}x{side:<4}  {step_ms:9.2f}  {step_bytes:9d}  {mlp_ms:12.2f}  {mlp_bytes:9d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Cold-start import report for the API (python -X importtime, summarized).
+
+Usage: python scripts/import_time.py [--module backend.api_app] [--top 15] [--repeat 5]
+
+Each repeat runs a fresh interpreter, so nothing is cached in-process.
+Prints the median total import time and the slowest modules by cumulative
+time from the median run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) rows for one cold import."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows: List[Tuple[str, int, int]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarize python -X importtime for the API")
+    parser.add_argument("--module", default="backend.api_app")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(max(1, args.repeat))]
+    totals = [sum(row[1] for row in run) for run in runs]
+    median_total = statistics.median(totals)
+    run = min(runs, key=lambda r: abs(sum(row[1] for row in r) - median_total))
+    loaded = {row[0] for row in run}
+
+    print(f"import {args.module}: median {median_total / 1000:.1f} ms over {len(runs)} runs")
+    print(f"modules loaded: {len(loaded)}; matplotlib loaded: {'yes' if 'matplotlib' in loaded else 'no'}")
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for name, self_us, cumulative_us in sorted(run, key=lambda row: row[2], reverse=True)[: args.top]:
+        print(f"{cumulative_us / 1000:14.1f}  {self_us / 1000:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()